@@ -1,9 +1,15 @@
 from verificador import verificar_solucion, analisis_detallado
+from cotas import cota_inferior, gap_optimalidad, TIEMPO_LP
 
-def analizar_solucion(problema, asignacion):
+def analizar_solucion(problema, asignacion, usar_lp=False, tiempo_limite_lp=TIEMPO_LP):
     """
     Proporciona métricas sobre una solución
     
+    usar_lp: incluir la relajación lineal en la cota inferior (ver cotas.py;
+             por defecto solo cotas combinatorias, que no usan HiGHS)
+    tiempo_limite_lp: segundos máximos para esa relajación (si no termina,
+                      se usa la cota de cliques)
+    
     Retorna diccionario con estadísticas
     """
     # Obtener análisis detallado
@@ -49,6 +55,10 @@ def analizar_solucion(problema, asignacion):
     # 4. Análisis de posibles mejoras
     posibles_mejoras = estimar_potencial_mejora(problema, asignacion)
     
+    # 5. Gap de optimalidad frente a la mejor cota inferior (en caché por instancia)
+    cota = cota_inferior(problema, usar_lp=usar_lp, tiempo_limite_lp=tiempo_limite_lp)
+    gap = gap_optimalidad(analisis['costo_total'], cota) if analisis['valida'] else None
+    
     # Combinar todo en un diccionario
     resultado = {
         'valida': analisis['valida'],
@@ -63,7 +73,9 @@ def analizar_solucion(problema, asignacion):
         'distribucion_frecuencias': analisis['torres_por_frecuencia'],
         'costos_por_frecuencia': analisis['costos_por_frecuencia'],
         'torres_problematicas': analisis['torres_problematicas'],
-        'potencial_mejora_estimado': posibles_mejoras
+        'potencial_mejora_estimado': posibles_mejoras,
+        'cota_inferior': cota,
+        'gap_optimalidad_porcentaje': gap
     }
     
     return resultado
@@ -1,138 +1,169 @@
+import heapq
 import random
-from verificador import verificar_solucion
+import time
+from concurrent.futures import wait, FIRST_COMPLETED
+import numpy as np
+from verificador import verificar_solucion, verificar_lote
+from tabla_conflictos import TablaConflictos, peso_conflicto_por_defecto
+from cola_movimientos import ColaMovimientos
+from busqueda_tabu import busqueda_tabu
+from recocido_simulado import recocido_simulado
+from vecindarios import VecindarioKempe, aplicar_mejor_movimiento
+from presupuesto import Presupuesto, iteraciones
+from paralelo import (crear_pool, crear_cancelacion, problema_compartido, cancelacion_compartida,
+                      numero_procesos, semillas_independientes)
 
-def hill_climbing(problema, asignacion_inicial, costo_inicial, max_iter):
-    """Ascenso de colina simple (solo acepta mejoras que no creen conflictos)"""
-    n = problema['n']
-    k = problema['k']
-    grafo = problema['grafo']
-    costos = problema['costos']
+def hill_climbing(problema, asignacion_inicial, costo_inicial, max_iter, kempe=False, intercambios=False,
+                  presupuesto=None):
+    """
+    Ascenso de colina simple (solo acepta mejoras que no creen conflictos)
+    
+    Cada torre tiene su mejor movimiento libre de conflictos en una cola de
+    prioridad; tras aplicar un movimiento solo se reevalúan la torre movida
+    y sus vecinos.
+    
+    Con kempe o intercambios, cuando ya no queda ningún movimiento simple
+    que mejore se prueba la mejor cadena de Kempe o el mejor intercambio
+    entre vecinas (ver vecindarios.py) antes de terminar.
+    
+    Con un presupuesto (ver presupuesto.py) se detiene en cuanto se agota;
+    como solo acepta mejoras, la asignación actual es siempre la mejor.
+    max_iter=None no limita las iteraciones.
+    """
+    tabla = TablaConflictos(problema, asignacion_inicial)
+    cola = ColaMovimientos(problema['n'], tabla.mejores_movimientos_libres)
+    cola.actualizar(np.arange(problema['n']))
+    vecindario = VecindarioKempe(tabla) if kempe else None
+    aristas = tabla.csr.aristas() if intercambios else None
     
-    mejor_asignacion = asignacion_inicial[:]
     mejor_costo = costo_inicial
     mejoras = 0
+    grandes = 0
+    if presupuesto is not None and tabla.num_conflictos == 0:
+        presupuesto.registrar(mejor_costo, tabla.lista)
     
-    for iteracion in range(max_iter):
-        # Generar lista de movimientos posibles que NO causen conflictos
-        movimientos_validos = []
-        
-        for torre in range(n):
-            freq_actual = mejor_asignacion[torre]
-            
-            # Obtener frecuencias usadas por vecinos
-            frec_vecinos = set()
-            for vecino in grafo.obtener_vecinos(torre):
-                frec_vecinos.add(mejor_asignacion[vecino])
-            
-            # Evaluar todas las frecuencias alternativas
-            for f in range(k):
-                if f != freq_actual and f not in frec_vecinos:
-                    # Calcular ahorro potencial (solo si no causa conflictos)
-                    ahorro = costos[torre][freq_actual] - costos[torre][f]
-                    if ahorro > 0:
-                        movimientos_validos.append((torre, f, ahorro))
-        
-        # Si no hay movimientos válidos que mejoren, terminar
-        if not movimientos_validos:
+    for iteracion in iteraciones(max_iter):
+        if presupuesto is not None and presupuesto.agotado():
             break
         
-        # Seleccionar el mejor movimiento
-        movimientos_validos.sort(key=lambda x: x[2], reverse=True)
-        mejor_torre, mejor_freq, mejor_ahorro = movimientos_validos[0]
+        # Seleccionar el mejor movimiento; si no hay que mejoren, probar uno grande
+        movimiento = cola.extraer()
+        if movimiento is None:
+            if vecindario is None and aristas is None:
+                break
+            grande = aplicar_mejor_movimiento(tabla, vecindario, aristas, presupuesto=presupuesto)
+            if grande is None:
+                break
+            afectadas, delta = grande
+            mejor_costo += delta
+            grandes += 1
+            cola.actualizar(afectadas)
+            if presupuesto is not None:
+                presupuesto.registrar(mejor_costo, tabla.lista)
+            continue
+        mejor_torre, mejor_freq, mejor_ahorro = movimiento
         
         # Aplicar el movimiento
-        mejor_asignacion[mejor_torre] = mejor_freq
+        vieja = int(tabla.asignacion[mejor_torre])
+        vecinos = tabla.mover(mejor_torre, mejor_freq)
         mejor_costo -= mejor_ahorro
         mejoras += 1
+        if vecindario is not None:
+            vecindario.invalidar(vieja, mejor_freq)
+        if presupuesto is not None:
+            presupuesto.registrar(mejor_costo, tabla.lista)
+        
+        # Solo cambian las opciones de la torre movida y de sus vecinos
+        cola.actualizar(np.append(vecinos, mejor_torre))
     
-    return mejor_asignacion, mejor_costo, f"Hill Climbing: {mejoras} mejoras"
+    info = f"Hill Climbing: {mejoras} mejoras"
+    if grandes:
+        info += f" (+{grandes} cadenas/intercambios)"
+    return tabla.lista(), mejor_costo, info
 
-def hill_climbing_con_conflictos(problema, asignacion_inicial, costo_inicial, max_iter):
-    """Ascenso de colina que permite conflictos temporales pero los repara"""
-    n = problema['n']
-    k = problema['k']
-    grafo = problema['grafo']
+# Penalización por cada conflicto creado en hill_climbing_con_conflictos
+PENALIZACION_CONFLICTO = 20
+
+def hill_climbing_con_conflictos(problema, asignacion_inicial, costo_inicial, max_iter, presupuesto=None):
+    """
+    Ascenso de colina que permite conflictos temporales pero los repara
+    
+    Usa la misma cola de movimientos que hill_climbing, puntuada por el
+    ahorro neto (ahorro - penalización por conflictos creados). Si termina
+    con conflictos devuelve el mejor estado sin conflictos que atravesó.
+    Con un presupuesto se detiene al agotarse y solo le informa de los
+    estados sin conflictos.
+    """
     costos = problema['costos']
     
-    mejor_asignacion = asignacion_inicial[:]
+    tabla = TablaConflictos(problema, asignacion_inicial)
+    cola = ColaMovimientos(problema['n'], lambda torres: tabla.mejores_movimientos_penalizados(
+        torres, PENALIZACION_CONFLICTO))
+    cola.actualizar(np.arange(problema['n']))
+    
     mejor_costo = costo_inicial
     mejoras = 0
+    if presupuesto is not None and tabla.num_conflictos == 0:
+        presupuesto.registrar(mejor_costo, tabla.lista)
     
-    for iteracion in range(max_iter):
-        mejor_movimiento = None
-        mejor_ahorro_neto = 0
-        
-        # Evaluar todas las torres
-        for torre in range(n):
-            freq_actual = mejor_asignacion[torre]
-            costo_actual = costos[torre][freq_actual]
-            
-            # Evaluar todas las frecuencias alternativas
-            for f in range(k):
-                if f != freq_actual:
-                    # Calcular ahorro potencial
-                    ahorro = costo_actual - costos[torre][f]
-                    
-                    if ahorro > 0:  # Solo considerar si hay ahorro
-                        # Contar conflictos que causaría
-                        conflictos_nuevos = 0
-                        for vecino in grafo.obtener_vecinos(torre):
-                            if mejor_asignacion[vecino] == f:
-                                conflictos_nuevos += 1
-                        
-                        # Calcular ahorro neto: ahorro - penalización por conflictos
-                        # Penalización más inteligente: proporcional al costo de las torres en conflicto
-                        penalizacion = 0
-                        if conflictos_nuevos > 0:
-                            # Penalizar más si hay muchos conflictos
-                            penalizacion = conflictos_nuevos * 20
-                        
-                        ahorro_neto = ahorro - penalizacion
-                        
-                        if ahorro_neto > mejor_ahorro_neto:
-                            mejor_ahorro_neto = ahorro_neto
-                            mejor_movimiento = (torre, f, ahorro, conflictos_nuevos)
+    # Último mejor estado válido, guardado solo al salir de la zona válida
+    mejor_valida = None
+    mejor_costo_valido = float('inf')
+    
+    for iteracion in iteraciones(max_iter):
+        if presupuesto is not None and presupuesto.agotado():
+            break
         
         # Aplicar el mejor movimiento si hay mejora neta
-        if mejor_movimiento and mejor_ahorro_neto > 0:
-            torre, nueva_freq, ahorro, conflictos = mejor_movimiento
-            mejor_asignacion[torre] = nueva_freq
-            mejor_costo -= ahorro
-            mejoras += 1
-            
-            # Si creamos conflictos, intentar repararlos inmediatamente
-            if conflictos > 0:
-                # Intentar cambiar las torres en conflicto
-                for vecino in grafo.obtener_vecinos(torre):
-                    if mejor_asignacion[vecino] == nueva_freq:
-                        # Buscar alternativa para el vecino
-                        mejor_alternativa = None
-                        mejor_costo_alternativa = float('inf')
-                        
-                        # Frecuencias prohibidas para el vecino
-                        prohibidas_vecino = set()
-                        for v2 in grafo.obtener_vecinos(vecino):
-                            if v2 != torre:
-                                prohibidas_vecino.add(mejor_asignacion[v2])
-                        
-                        for f_alt in range(k):
-                            if f_alt != nueva_freq and f_alt not in prohibidas_vecino:
-                                if costos[vecino][f_alt] < mejor_costo_alternativa:
-                                    mejor_costo_alternativa = costos[vecino][f_alt]
-                                    mejor_alternativa = f_alt
-                        
-                        if mejor_alternativa is not None:
-                            mejor_asignacion[vecino] = mejor_alternativa
-                            mejor_costo = mejor_costo - costos[vecino][nueva_freq] + mejor_costo_alternativa
-        
-        else:
+        movimiento = cola.extraer()
+        if movimiento is None:
             # No hay más mejoras
             break
+        torre, nueva_freq, _ = movimiento
+        
+        conflictos = int(tabla.conteo[torre, nueva_freq])
+        if conflictos > 0 and tabla.num_conflictos == 0 and mejor_costo < mejor_costo_valido:
+            mejor_valida = tabla.lista()
+            mejor_costo_valido = mejor_costo
+        mejor_costo -= tabla.costos[torre, tabla.asignacion[torre]] - tabla.costos[torre, nueva_freq]
+        vecinos = tabla.mover(torre, nueva_freq)
+        mejoras += 1
+        afectadas = [vecinos, [torre]]
+        
+        # Si creamos conflictos, intentar repararlos inmediatamente
+        if conflictos > 0:
+            for vecino in vecinos[tabla.asignacion[vecinos] == nueva_freq].tolist():
+                # Frecuencias libres para el vecino (la torre movida solo bloquea nueva_freq)
+                libres = tabla.conteo[vecino] == 0
+                libres[nueva_freq] = False
+                if not libres.any():
+                    continue
+                
+                mejor_alternativa = int(np.argmin(np.where(libres, costos[vecino], np.inf)))
+                mejor_costo = mejor_costo - costos[vecino][nueva_freq] + costos[vecino][mejor_alternativa]
+                afectadas.append(tabla.mover(vecino, mejor_alternativa))
+                afectadas.append([vecino])
+        
+        cola.actualizar(np.unique(np.concatenate(afectadas)))
+        if presupuesto is not None and tabla.num_conflictos == 0:
+            presupuesto.registrar(mejor_costo, tabla.lista)
     
-    return mejor_asignacion, mejor_costo, f"Hill Climbing mejorado: {mejoras} mejoras"
+    if tabla.num_conflictos > 0 and mejor_valida is not None:
+        return mejor_valida, mejor_costo_valido, f"Hill Climbing mejorado: {mejoras} mejoras"
+    return tabla.lista(), mejor_costo, f"Hill Climbing mejorado: {mejoras} mejoras"
 
-def tabu_search_simple(problema, asignacion_inicial, costo_inicial, max_iter, tamano_tabu=10):
-    """Búsqueda Tabú simple con lista de movimientos prohibidos"""
+def _verificar_rapido(problema, asignacion):
+    """(es_valida, costo, num_conflictos) con verificar_lote, en O(n + m) vectorizado"""
+    validas, costos_totales, num_conflictos = verificar_lote(problema, np.asarray([asignacion], dtype=np.int64).reshape(1, problema['n']))
+    return bool(validas[0]), float(costos_totales[0]), int(num_conflictos[0])
+
+def tabu_search_simple(problema, asignacion_inicial, costo_inicial, max_iter, tamano_tabu=10, presupuesto=None):
+    """
+    Búsqueda Tabú simple con lista de movimientos prohibidos
+    
+    Con un presupuesto se detiene al agotarse (max_iter=None no limita las
+    iteraciones) y le informa de las mejoras que no tienen conflictos.
+    """
     n = problema['n']
     k = problema['k']
     grafo = problema['grafo']
@@ -148,13 +179,26 @@ def tabu_search_simple(problema, asignacion_inicial, costo_inicial, max_iter, ta
     lista_tabu = []
     mejoras = 0
     
-    for iteracion in range(max_iter):
+    # Conflictos de la asignación actual (solo para informar al presupuesto)
+    if presupuesto is not None:
+        conflictos_actuales = _verificar_rapido(problema, asignacion_actual)[2]
+        if conflictos_actuales == 0:
+            presupuesto.registrar(costo_actual, lambda: asignacion_actual[:])
+    
+    for iteracion in iteraciones(max_iter):
+        if presupuesto is not None and presupuesto.agotado():
+            break
+        
         mejor_movimiento = None
         mejor_costo_vecino = float('inf')
-        mejor_asignacion_vecino = None
+        agotado = False
         
         # Evaluar todos los movimientos posibles
         for torre in range(n):
+            # El barrido cuesta O(n k): consultar el presupuesto también durante él
+            if presupuesto is not None and torre & 1023 == 1023 and presupuesto.agotado():
+                agotado = True
+                break
             freq_actual = asignacion_actual[torre]
             
             for f in range(k):
@@ -170,19 +214,19 @@ def tabu_search_simple(problema, asignacion_inicial, costo_inicial, max_iter, ta
                        (nuevo_costo < mejor_costo_global):
                         mejor_costo_vecino = nuevo_costo
                         mejor_movimiento = (torre, f, freq_actual)
-                        
-                        # Crear nueva asignación
-                        nueva_asignacion = asignacion_actual[:]
-                        nueva_asignacion[torre] = f
-                        mejor_asignacion_vecino = nueva_asignacion
         
+        if agotado:
+            break
         if mejor_movimiento is None:
             # No hay movimientos no tabú, terminar
             break
         
         # Aplicar el mejor movimiento
         torre, nueva_freq, vieja_freq = mejor_movimiento
-        asignacion_actual = mejor_asignacion_vecino
+        if presupuesto is not None:
+            for vecino in grafo.obtener_vecinos(torre):
+                conflictos_actuales += (asignacion_actual[vecino] == nueva_freq) - (asignacion_actual[vecino] == vieja_freq)
+        asignacion_actual[torre] = nueva_freq
         costo_actual = mejor_costo_vecino
         
         # Añadir a lista Tabú
@@ -198,104 +242,106 @@ def tabu_search_simple(problema, asignacion_inicial, costo_inicial, max_iter, ta
             mejor_costo_global = costo_actual
             mejor_asignacion_global = asignacion_actual[:]
             mejoras += 1
+            if presupuesto is not None and conflictos_actuales == 0:
+                presupuesto.registrar(costo_actual, lambda: mejor_asignacion_global[:])
     
     return mejor_asignacion_global, mejor_costo_global, f"Tabu Search: {mejoras} mejoras"
 
-def arreglar_conflictos(problema, asignacion, max_intentos=10):
+def arreglar_conflictos(problema, asignacion, max_intentos=None, tiempo_limite=None):
     """
     Intenta arreglar conflictos en una solución inválida
     
+    Las aristas en conflicto se guardan en un heap ordenado por el costo de
+    sus dos torres, junto con la tabla de conflictos. En cada paso se toma el
+    conflicto más caro y se recolorea una de sus torres; el heap y la tabla
+    se actualizan en O(grado), así que el tiempo crece con el número de
+    conflictos y no con intentos por aristas. Un recoloreo sin alternativa
+    libre puede crear más conflictos de los que quita, así que se devuelve
+    el estado con menos conflictos visto (copiado solo al abandonarlo).
+    
     Args:
         problema: diccionario con el problema
         asignacion: solución con conflictos
-        max_intentos: máximo de intentos de arreglo
+        max_intentos: máximo de recoloreos (None = 10 por conflicto inicial)
+        tiempo_limite: segundos máximos (None = sin límite)
     
     Returns:
-        solución arreglada (puede seguir teniendo conflictos si es imposible)
+        solución arreglada (puede seguir teniendo conflictos si es imposible,
+        nunca más que la de entrada)
     """
-    n = problema['n']
-    k = problema['k']
-    grafo = problema['grafo']
-    costos = problema['costos']
+    inicio = time.time()
+    tabla = TablaConflictos(problema, asignacion)
+    if tabla.num_conflictos == 0:
+        return tabla.lista()
+    if max_intentos is None:
+        max_intentos = 10 * tabla.num_conflictos
     
-    asignacion_arreglada = asignacion[:]
+    costos = tabla.costos.tolist()
+    peso = peso_conflicto_por_defecto(tabla.costos)
+    asignacion_arreglada = tabla.asignacion
     
-    for intento in range(max_intentos):
-        # Identificar todos los conflictos
-        conflictos = []
-        for i in range(n):
-            for j in grafo.obtener_vecinos(i):
-                if i < j and asignacion_arreglada[i] == asignacion_arreglada[j]:
-                    conflictos.append((i, j))
-        
-        # Si no hay conflictos, hemos terminado
-        if not conflictos:
+    # Heap de conflictos (-costo, i, j, frecuencia); las entradas que dejan de
+    # ser conflicto se descartan al salir
+    aristas = tabla.csr.aristas()
+    en_conflicto = aristas[asignacion_arreglada[aristas[:, 0]] == asignacion_arreglada[aristas[:, 1]]]
+    conflictos = []
+    for i, j in en_conflicto.tolist():
+        f = int(asignacion_arreglada[i])
+        conflictos.append((-(costos[i][f] + costos[j][f]), i, j, f))
+    heapq.heapify(conflictos)
+    
+    def mejor_alternativa(torre, freq_conflicto):
+        # Frecuencia más barata sin conflictos; si no hay, la que menos crea
+        puntuacion = tabla.costos[torre] + peso * tabla.conteo[torre]
+        puntuacion[freq_conflicto] = np.inf
+        f = int(puntuacion.argmin())
+        return f, int(tabla.conteo[torre, f]) == 0
+    
+    mejor_conflictos = tabla.num_conflictos
+    mejor = None  # None: la asignación actual es la de menos conflictos
+    
+    intento = 0
+    while tabla.num_conflictos > 0 and intento < max_intentos:
+        if tiempo_limite is not None and time.time() - inicio >= tiempo_limite:
             break
+        intento += 1
         
         # Tomar el conflicto con mayor costo
-        conflictos.sort(key=lambda x: costos[x[0]][asignacion_arreglada[x[0]]] + 
-                                   costos[x[1]][asignacion_arreglada[x[1]]], reverse=True)
-        i, j = conflictos[0]
-        freq_conflicto = asignacion_arreglada[i]
+        while True:
+            _, i, j, freq_conflicto = heapq.heappop(conflictos)
+            if asignacion_arreglada[i] == freq_conflicto and asignacion_arreglada[j] == freq_conflicto:
+                break
         
         # Decidir qué torre cambiar (la que tenga alternativa más barata)
-        mejor_cambio_i = None
-        mejor_costo_i = float('inf')
+        cambio_i, libre_i = mejor_alternativa(i, freq_conflicto)
+        cambio_j, libre_j = mejor_alternativa(j, freq_conflicto)
         
-        mejor_cambio_j = None
-        mejor_costo_j = float('inf')
-        
-        # Buscar alternativa para torre i
-        for f in range(k):
-            if f != freq_conflicto:
-                # Verificar que no cause conflictos con otros vecinos
-                conflicto_con_vecinos = False
-                for vecino in grafo.obtener_vecinos(i):
-                    if vecino != j and asignacion_arreglada[vecino] == f:
-                        conflicto_con_vecinos = True
-                        break
-                
-                if not conflicto_con_vecinos and costos[i][f] < mejor_costo_i:
-                    mejor_costo_i = costos[i][f]
-                    mejor_cambio_i = f
-        
-        # Buscar alternativa para torre j
-        for f in range(k):
-            if f != freq_conflicto:
-                # Verificar que no cause conflictos con otros vecinos
-                conflicto_con_vecinos = False
-                for vecino in grafo.obtener_vecinos(j):
-                    if vecino != i and asignacion_arreglada[vecino] == f:
-                        conflicto_con_vecinos = True
-                        break
-                
-                if not conflicto_con_vecinos and costos[j][f] < mejor_costo_j:
-                    mejor_costo_j = costos[j][f]
-                    mejor_cambio_j = f
-        
-        # Aplicar el cambio que sea mejor (menor costo)
-        if mejor_cambio_i is not None and mejor_cambio_j is not None:
-            costo_cambio_i = costos[i][mejor_cambio_i] - costos[i][freq_conflicto]
-            costo_cambio_j = costos[j][mejor_cambio_j] - costos[j][freq_conflicto]
-            
-            if costo_cambio_i <= costo_cambio_j:
-                asignacion_arreglada[i] = mejor_cambio_i
-            else:
-                asignacion_arreglada[j] = mejor_cambio_j
-        elif mejor_cambio_i is not None:
-            asignacion_arreglada[i] = mejor_cambio_i
-        elif mejor_cambio_j is not None:
-            asignacion_arreglada[j] = mejor_cambio_j
+        if libre_i and libre_j:
+            costo_cambio_i = costos[i][cambio_i] - costos[i][freq_conflicto]
+            costo_cambio_j = costos[j][cambio_j] - costos[j][freq_conflicto]
+            torre, f = (i, cambio_i) if costo_cambio_i <= costo_cambio_j else (j, cambio_j)
+        elif libre_i or libre_j:
+            torre, f = (i, cambio_i) if libre_i else (j, cambio_j)
         else:
-            # No hay alternativa sin conflictos, elegir la más barata
-            for f in range(k):
-                if f != freq_conflicto:
-                    asignacion_arreglada[i] = f
-                    break
+            # Sin alternativa libre: la torre cuyo cambio deja menos conflictos
+            delta_i = tabla.delta_conflictos(i, cambio_i) * peso + tabla.delta_costo(i, cambio_i)
+            delta_j = tabla.delta_conflictos(j, cambio_j) * peso + tabla.delta_costo(j, cambio_j)
+            torre, f = (i, cambio_i) if delta_i <= delta_j else (j, cambio_j)
+        
+        # Copiar la mejor antes de dejarla, salvo que este cambio la mejore
+        if mejor is None and tabla.delta_conflictos(torre, f) >= 0:
+            mejor = tabla.lista()
+        vecinos = tabla.mover(torre, f)
+        if tabla.num_conflictos < mejor_conflictos:
+            mejor_conflictos = tabla.num_conflictos
+            mejor = None
+        for vecino in vecinos[asignacion_arreglada[vecinos] == f].tolist():
+            heapq.heappush(conflictos, (-(costos[torre][f] + costos[vecino][f]),
+                                        min(torre, vecino), max(torre, vecino), f))
     
-    return asignacion_arreglada
+    return tabla.lista() if mejor is None else mejor
 
-def mejorar_solucion(problema, asignacion_inicial, max_iter=1000, metodo='hill_climbing'):
+def mejorar_solucion(problema, asignacion_inicial, max_iter=1000, metodo='hill_climbing', presupuesto=None, **opciones):
     """
     Mejora solución mediante búsqueda local mejorada
     
@@ -303,40 +349,191 @@ def mejorar_solucion(problema, asignacion_inicial, max_iter=1000, metodo='hill_c
         problema: diccionario con el problema
         asignacion_inicial: solución inicial
         max_iter: máximo de iteraciones
-        metodo: 'hill_climbing', 'tabu_search', 'hill_climbing_con_conflictos'
+        metodo: 'hill_climbing', 'tabu_search' (TabuCol), 'tabu_search_simple',
+                'hill_climbing_con_conflictos', 'recocido_simulado',
+                'kempe' (hill climbing con cadenas de Kempe e intercambios)
+        opciones: parámetros adicionales del método (p. ej. tiempo_limite o
+                  enfriamiento para el recocido simulado, kempe=True para
+                  hill_climbing o tabu_search); se pasan a todos los métodos
+        presupuesto: Presupuesto opcional (tiempo límite, estancamiento,
+                     costo objetivo, callback de mejoras)
     
     Returns:
         mejor_asignacion, mejor_costo, info
+    
+    tabu_search y recocido_simulado trabajan sobre el objetivo penalizado y
+    parten de la asignación tal cual; el resto de métodos necesita una
+    solución válida y antes se intenta arreglar. La verificación y el
+    arreglo cuentan dentro del presupuesto. Un método desconocido usa
+    hill_climbing.
     """
     # Primero verificar y arreglar si es necesario
-    valida, costo_actual, conflictos = verificar_solucion(problema, asignacion_inicial)
+    valida, costo_actual, _ = _verificar_rapido(problema, asignacion_inicial)
     asignacion_actual = asignacion_inicial[:]
     
+    if metodo == 'tabu_search':
+        return busqueda_tabu(problema, asignacion_actual, costo_actual, max_iter,
+                             presupuesto=presupuesto, **opciones)
+    if metodo == 'recocido_simulado':
+        return recocido_simulado(problema, asignacion_actual, costo_actual, max_iter,
+                                 presupuesto=presupuesto, **opciones)
+    
     # Si la solución no es válida, intentar arreglarla primero
     if not valida:
-        asignacion_actual = arreglar_conflictos(problema, asignacion_actual)
-        valida, costo_actual, conflictos = verificar_solucion(problema, asignacion_actual)
+        tiempo = presupuesto.tiempo_restante() if presupuesto is not None else None
+        asignacion_actual = arreglar_conflictos(problema, asignacion_actual, tiempo_limite=tiempo)
+        valida, costo_actual, _ = _verificar_rapido(problema, asignacion_actual)
     
     # Si después de arreglar sigue siendo inválida, devolver como está
     if not valida:
         return asignacion_actual, costo_actual, "Solución inválida después de intentar arreglar"
+    if presupuesto is not None and presupuesto.agotado():
+        presupuesto.registrar(costo_actual, lambda: asignacion_actual[:])
+        return asignacion_actual, costo_actual, "Presupuesto agotado al arreglar la solución"
     
     # Ahora aplicar búsqueda local según el método
     if metodo == 'hill_climbing':
-        return hill_climbing(problema, asignacion_actual, costo_actual, max_iter)
-    elif metodo == 'tabu_search':
-        return tabu_search_simple(problema, asignacion_actual, costo_actual, max_iter)
+        return hill_climbing(problema, asignacion_actual, costo_actual, max_iter,
+                             presupuesto=presupuesto, **opciones)
+    elif metodo == 'kempe':
+        opciones = {'kempe': True, 'intercambios': True, **opciones}
+        return hill_climbing(problema, asignacion_actual, costo_actual, max_iter,
+                             presupuesto=presupuesto, **opciones)
+    elif metodo == 'tabu_search_simple':
+        return tabu_search_simple(problema, asignacion_actual, costo_actual, max_iter,
+                                  presupuesto=presupuesto, **opciones)
     elif metodo == 'hill_climbing_con_conflictos':
-        return hill_climbing_con_conflictos(problema, asignacion_actual, costo_actual, max_iter)
+        return hill_climbing_con_conflictos(problema, asignacion_actual, costo_actual, max_iter,
+                                            presupuesto=presupuesto, **opciones)
     else:
-        return hill_climbing(problema, asignacion_actual, costo_actual, max_iter)
+        return hill_climbing(problema, asignacion_actual, costo_actual, max_iter,
+                             presupuesto=presupuesto, **opciones)
+
+def _solucion_reinicio(n, k, rng):
+    """Asignación aleatoria para un reinicio (rng: módulo random o random.Random)"""
+    solucion = []
+    for i in range(n):
+        # Intentar elegir frecuencia que minimice conflicto local
+        frecuencias_disponibles = list(range(k))
+        rng.shuffle(frecuencias_disponibles)
+        mejor_f = frecuencias_disponibles[0]
+        solucion.append(mejor_f)
+    return solucion
 
-def mejorar_solucion_con_reinicio(problema, solucion_inicial=None, max_reinicios=3, iter_por_reinicio=300):
+def _reinicio_trabajador(reinicio, semilla, solucion_inicial, iter_por_reinicio, fin, costo_objetivo):
+    """Tarea de un trabajador: un reinicio completo sobre el problema compartido"""
+    problema = problema_compartido()
+    cancelacion = cancelacion_compartida()
+    if cancelacion is not None and cancelacion.is_set():
+        return None
+    
+    tiempo_limite = None if fin is None else max(0.0, fin - time.time())
+    presupuesto = Presupuesto(tiempo_limite=tiempo_limite, costo_objetivo=costo_objetivo,
+                              cancelacion=cancelacion)
+    
+    if reinicio == 0 and solucion_inicial is not None:
+        solucion_actual = solucion_inicial[:]
+    else:
+        solucion_actual = _solucion_reinicio(problema['n'], problema['k'], random.Random(semilla))
+    
+    solucion_arreglada = arreglar_conflictos(problema, solucion_actual, tiempo_limite=presupuesto.tiempo_restante())
+    solucion_mejorada, _, _ = mejorar_solucion(
+        problema, solucion_arreglada, max_iter=iter_por_reinicio,
+        metodo='hill_climbing_con_conflictos', presupuesto=presupuesto
+    )
+    valida, costo_real, _ = verificar_solucion(problema, solucion_mejorada)
+    
+    # Al alcanzar el objetivo, avisar al resto de trabajadores
+    if cancelacion is not None and valida and costo_objetivo is not None and costo_real <= costo_objetivo:
+        cancelacion.set()
+    return solucion_mejorada, valida, float(costo_real)
+
+def _reinicios_paralelos(problema, solucion_inicial, max_reinicios, iter_por_reinicio, presupuesto, procesos, semilla):
+    """
+    Reinicios de mejorar_solucion_con_reinicio repartidos en un pool
+    
+    Cada reinicio usa su propio flujo aleatorio derivado de semilla y se
+    mantienen dos tareas por proceso en vuelo. Cuando uno alcanza el costo
+    objetivo del presupuesto (o este se agota) se activa el evento de
+    cancelación: los reinicios en curso terminan en su siguiente iteración
+    y los pendientes no llegan a empezar.
+    """
+    if presupuesto is None:
+        presupuesto = Presupuesto()
+    presupuesto.iniciar()
+    
+    fin = None
+    if presupuesto.tiempo_limite is not None:
+        fin = time.time() + presupuesto.tiempo_restante()
+    en_vuelo = 2 * numero_procesos(procesos)
+    semillas = []
+    cancelacion = crear_cancelacion()
+    
+    mejor = None
+    reinicios = 0
+    with crear_pool(problema, procesos, cancelacion) as pool:
+        pendientes = set()
+        lanzados = 0
+        while True:
+            # Mantener el pool lleno mientras queden reinicios y presupuesto
+            while len(pendientes) < en_vuelo and not cancelacion.is_set() and \
+                    (max_reinicios is None or lanzados < max_reinicios):
+                if lanzados >= len(semillas):
+                    semillas = semillas_independientes(semilla, max(2 * len(semillas), en_vuelo))
+                # Solo el reinicio 0 parte de la solución inicial: no enviarla al resto
+                inicial = solucion_inicial if lanzados == 0 else None
+                pendientes.add(pool.submit(_reinicio_trabajador, lanzados, semillas[lanzados], inicial,
+                                           iter_por_reinicio, fin, presupuesto.costo_objetivo))
+                lanzados += 1
+            if not pendientes:
+                break
+            
+            terminados, pendientes = wait(pendientes, return_when=FIRST_COMPLETED)
+            for futuro in terminados:
+                resultado = futuro.result()
+                if resultado is None:
+                    continue
+                reinicios += 1
+                solucion, valida, costo = resultado
+                
+                # PRIORIDAD: 1) Soluciones válidas, 2) Menor costo
+                if mejor is None or (valida and not mejor[1]) or (valida == mejor[1] and costo < mejor[2]):
+                    mejor = resultado
+                if valida:
+                    presupuesto.registrar(costo, lambda: solucion[:])
+            
+            if presupuesto.agotado():
+                cancelacion.set()
+    
+    if mejor is None:
+        # Cancelado antes de terminar ningún reinicio
+        solucion = solucion_inicial[:] if solucion_inicial is not None else \
+            _solucion_reinicio(problema['n'], problema['k'], random.Random(semilla))
+        valida, costo, _ = verificar_solucion(problema, solucion)
+        mejor = (solucion, valida, costo)
+    
+    return mejor[0], mejor[2], f"Reinicios: {reinicios} (paralelo)"
+
+def mejorar_solucion_con_reinicio(problema, solucion_inicial=None, max_reinicios=3, iter_por_reinicio=300,
+                                  presupuesto=None, procesos=None, semilla=None):
     """
     Búsqueda local con múltiples reinicios
     
     RETORNA SIEMPRE UNA SOLUCIÓN - NUNCA None
+    
+    Con un presupuesto no se empiezan reinicios una vez agotado y cada
+    búsqueda interna comparte el mismo reloj; max_reinicios=None reinicia
+    hasta agotarlo.
+    
+    Con procesos (0 = todos los núcleos) los reinicios se reparten en un
+    pool que comparte el problema; el costo_objetivo del presupuesto
+    cancela los reinicios restantes en cuanto se alcanza. semilla fija los
+    flujos aleatorios de los reinicios en ese modo.
     """
+    if procesos is not None:
+        return _reinicios_paralelos(problema, solucion_inicial, max_reinicios, iter_por_reinicio,
+                                    presupuesto, procesos, semilla)
+    
     n = problema['n']
     k = problema['k']
     
@@ -348,27 +545,27 @@ def mejorar_solucion_con_reinicio(problema, solucion_inicial=None, max_reinicios
     if solucion_inicial is None:
         solucion_inicial = [random.randint(0, k-1) for _ in range(n)]
     
-    for reinicio in range(max_reinicios):
+    reinicios = 0
+    for reinicio in iteraciones(max_reinicios):
+        if presupuesto is not None and presupuesto.agotado():
+            break
+        reinicios += 1
+        
         if reinicio == 0:
             # Usar solución inicial en el primer reinicio
             solucion_actual = solucion_inicial[:]
         else:
             # Generar solución aleatoria MEJORADA
-            solucion_actual = []
-            for i in range(n):
-                # Intentar elegir frecuencia que minimice conflicto local
-                frecuencias_disponibles = list(range(k))
-                random.shuffle(frecuencias_disponibles)
-                mejor_f = frecuencias_disponibles[0]
-                solucion_actual.append(mejor_f)
+            solucion_actual = _solucion_reinicio(n, k, random)
         
         # Intentar arreglar conflictos
-        solucion_arreglada = arreglar_conflictos(problema, solucion_actual)
+        tiempo = presupuesto.tiempo_restante() if presupuesto is not None else None
+        solucion_arreglada = arreglar_conflictos(problema, solucion_actual, tiempo_limite=tiempo)
         
         # Aplicar búsqueda local (usar hill climbing con conflictos para más exploración)
         solucion_mejorada, costo, info = mejorar_solucion(
             problema, solucion_arreglada, max_iter=iter_por_reinicio,
-            metodo='hill_climbing_con_conflictos'
+            metodo='hill_climbing_con_conflictos', presupuesto=presupuesto
         )
         
         # Verificar si es mejor
@@ -393,7 +590,46 @@ def mejorar_solucion_con_reinicio(problema, solucion_inicial=None, max_reinicios
     # Garantizar que siempre retornamos una solución
     if mejor_solucion is None:
         # Si por alguna razón no hay solución, devolver la inicial arreglada
-        mejor_solucion = arreglar_conflictos(problema, solucion_inicial[:])
+        tiempo = presupuesto.tiempo_restante() if presupuesto is not None else None
+        mejor_solucion = arreglar_conflictos(problema, solucion_inicial[:], tiempo_limite=tiempo)
         mejor_valida, mejor_costo, _ = verificar_solucion(problema, mejor_solucion)
     
-    return mejor_solucion, mejor_costo, f"Reinicios: {max_reinicios}"
\ No newline at end of file
+    return mejor_solucion, mejor_costo, f"Reinicios: {reinicios}"
+
+def buscar(problema, asignacion_inicial=None, metodo='hill_climbing', presupuesto=None, max_iter=None, **opciones):
+    """
+    Interfaz anytime común a todas las búsquedas locales
+    
+    Ejecuta el método hasta que termina por sí mismo, se cumple max_iter o
+    se agota el presupuesto, y devuelve siempre la mejor solución encontrada
+    hasta ese momento.
+    
+    Ejemplo: buscar(problema, inicial, 'tabu_search', Presupuesto(tiempo_limite=0.2))
+    
+    Args:
+        problema: diccionario con el problema
+        asignacion_inicial: solución inicial (None = aleatoria)
+        metodo: cualquier método de mejorar_solucion, o 'reinicio' para
+                mejorar_solucion_con_reinicio (max_iter = número de reinicios)
+        presupuesto: Presupuesto con tiempo límite, estancamiento, costo
+                     objetivo y/o callback al mejorar
+        max_iter: máximo de iteraciones (None = solo el presupuesto)
+        opciones: parámetros adicionales del método
+    
+    Returns:
+        mejor_asignacion, mejor_costo, info
+    """
+    if presupuesto is None:
+        presupuesto = Presupuesto()
+    if max_iter is None and presupuesto.tiempo_limite is None and presupuesto.limite_estancamiento is None:
+        raise ValueError("buscar necesita max_iter o un presupuesto con tiempo_limite o limite_estancamiento")
+    presupuesto.iniciar()
+    
+    if metodo == 'reinicio':
+        return mejorar_solucion_con_reinicio(problema, asignacion_inicial, max_reinicios=max_iter,
+                                             presupuesto=presupuesto, **opciones)
+    
+    if asignacion_inicial is None:
+        asignacion_inicial = [random.randint(0, problema['k'] - 1) for _ in range(problema['n'])]
+    return mejorar_solucion(problema, asignacion_inicial, max_iter=max_iter, metodo=metodo,
+                            presupuesto=presupuesto, **opciones)
\ No newline at end of file
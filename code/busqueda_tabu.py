@@ -0,0 +1,171 @@
+import heapq
+import numpy as np
+from tabla_conflictos import TablaConflictos, peso_conflicto_por_defecto
+from vecindarios import VecindarioKempe, aplicar_mejor_movimiento
+from presupuesto import iteraciones
+
+def busqueda_tabu(problema, asignacion_inicial, costo_inicial, max_iter,
+                  tenencia_base=7, factor_tenencia=0.6, peso_conflicto=None, semilla=None,
+                  kempe=False, intercambios=False, presupuesto=None):
+    """
+    Búsqueda Tabú al estilo TabuCol sobre el objetivo penalizado
+    
+    Objetivo: costo + peso_conflicto * conflictos. En cada iteración se aplica
+    el mejor movimiento (torre, f) no tabú, salvo aspiración (mejora el mejor
+    objetivo conocido). Tras mover la torre de a a b se prohíbe volver a
+    (torre, a) durante tenencia_base + U{0..9} + factor_tenencia * conflictos
+    iteraciones.
+    
+    Estructuras (sin recorrer la matriz n x k en cada iteración):
+      - tabu_hasta: matriz n x k con la iteración hasta la que cada movimiento es tabú
+      - por cada torre, su mejor movimiento (aspiración) y su mejor movimiento
+        no tabú, en dos montículos con versiones (las entradas viejas se
+        descartan al salir); tras un movimiento solo se reevalúan la fila de
+        la torre, las de sus vecinos y las filas cuyo tabú vence
+      - la asignación se modifica en el sitio (TablaConflictos)
+    
+    Con kempe o intercambios, cuando el mejor movimiento admisible no mejora
+    el objetivo se aplica antes la mejor cadena de Kempe o el mejor
+    intercambio entre vecinas, si alguno lo mejora.
+    
+    Args:
+        problema: diccionario con el problema
+        asignacion_inicial: solución inicial (puede tener conflictos)
+        costo_inicial: costo de la solución inicial (solo informativo)
+        max_iter: número de iteraciones (None = hasta agotar el presupuesto)
+        tenencia_base, factor_tenencia: parámetros de la tenencia tabú
+        peso_conflicto: penalización por conflicto (por defecto, rango de costos + 1)
+        semilla: semilla para la parte aleatoria de la tenencia
+        kempe, intercambios: usar también esos vecindarios (ver vecindarios.py)
+        presupuesto: Presupuesto opcional; se informa de cada mejora válida
+    
+    Returns:
+        mejor_asignacion, mejor_costo, info (la mejor sin conflictos si se
+        encontró alguna; si no, la de menor objetivo penalizado)
+    """
+    n = problema['n']
+    k = problema['k']
+    rng = np.random.default_rng(semilla)
+    
+    tabla = TablaConflictos(problema, asignacion_inicial)
+    costos = tabla.costos
+    conteo = tabla.conteo
+    asignacion = tabla.asignacion
+    
+    if peso_conflicto is None:
+        peso_conflicto = peso_conflicto_por_defecto(costos)
+    
+    tabu_hasta = np.zeros((n, k), dtype=np.int64)
+    
+    def evaluar(filas, iteracion):
+        """Mejor movimiento de cada fila, con y sin los tabú, en la iteración dada"""
+        actuales = asignacion[filas]
+        posiciones = np.arange(len(filas))
+        base = costos[filas, actuales] + peso_conflicto * conteo[filas, actuales]
+        delta = costos[filas] + peso_conflicto * conteo[filas] - base[:, None]
+        delta[posiciones, actuales] = np.inf
+        f_todos = delta.argmin(axis=1)
+        d_todos = delta[posiciones, f_todos]
+        delta[tabu_hasta[filas] > iteracion] = np.inf
+        f_libres = delta.argmin(axis=1)
+        return f_todos, d_todos, f_libres, delta[posiciones, f_libres]
+    
+    # Entradas (delta, torre, f, versión); solo vale la de la versión actual de la torre
+    version = [0] * n
+    todos = []
+    libres = []
+    vencimientos = {}
+    
+    def reconstruir(iteracion):
+        f_todos, d_todos, f_libres, d_libres = evaluar(np.arange(n), iteracion)
+        todos[:] = [(d, t, f, version[t]) for t, (d, f) in enumerate(zip(d_todos.tolist(), f_todos.tolist()))
+                    if d < np.inf]
+        libres[:] = [(d, t, f, version[t]) for t, (d, f) in enumerate(zip(d_libres.tolist(), f_libres.tolist()))
+                     if d < np.inf]
+        heapq.heapify(todos)
+        heapq.heapify(libres)
+    
+    def actualizar(filas, iteracion):
+        if len(todos) + len(libres) > 4 * n + 64:
+            reconstruir(iteracion)  # Demasiadas entradas viejas
+            return
+        f_todos, d_todos, f_libres, d_libres = evaluar(filas, iteracion)
+        for t, d, f, dl, fl in zip(filas.tolist(), d_todos.tolist(), f_todos.tolist(),
+                                   d_libres.tolist(), f_libres.tolist()):
+            version[t] += 1
+            if d < np.inf:
+                heapq.heappush(todos, (d, t, f, version[t]))
+            if dl < np.inf:
+                heapq.heappush(libres, (dl, t, fl, version[t]))
+    
+    def cima(monticulo):
+        while monticulo and monticulo[0][3] != version[monticulo[0][1]]:
+            heapq.heappop(monticulo)
+        return monticulo[0] if monticulo else None
+    
+    reconstruir(0)
+    vecindario = VecindarioKempe(tabla) if kempe else None
+    aristas = tabla.csr.aristas() if intercambios else None
+    objetivo = tabla.costo + peso_conflicto * tabla.num_conflictos
+    
+    mejor_objetivo = objetivo
+    mejor_asignacion = asignacion.copy()
+    mejor_costo_valido = tabla.costo if tabla.num_conflictos == 0 else np.inf
+    mejor_valida = asignacion.copy()
+    mejoras = 0
+    if presupuesto is not None and tabla.num_conflictos == 0:
+        presupuesto.registrar(tabla.costo, mejor_valida.tolist)
+    
+    for iteracion in iteraciones(max_iter):
+        if presupuesto is not None and presupuesto.agotado():
+            break
+        vencen = vencimientos.pop(iteracion, None)
+        if vencen:
+            actualizar(np.unique(vencen), iteracion)
+        
+        # Mejor movimiento no tabú, o el mejor de todos si mejora el mejor objetivo
+        eleccion = cima(libres)
+        aspirante = cima(todos)
+        if aspirante is not None and aspirante[0] < mejor_objetivo - objetivo:
+            eleccion = aspirante
+        
+        grande = None
+        if (vecindario is not None or aristas is not None) and not (eleccion is not None and eleccion[0] < 0):
+            grande = aplicar_mejor_movimiento(tabla, vecindario, aristas, peso_conflicto, presupuesto)
+        if grande is not None:
+            afectadas, delta_grande = grande
+            objetivo += delta_grande
+            actualizar(np.asarray(afectadas), iteracion + 1)
+        else:
+            if eleccion is None:
+                break  # Todos los movimientos son tabú
+            
+            delta, torre, f, _ = eleccion
+            objetivo += delta
+            vieja = asignacion[torre]
+            vecinos = tabla.mover(torre, f)
+            if vecindario is not None:
+                vecindario.invalidar(int(vieja), f)
+            
+            hasta = (iteracion + tenencia_base + int(rng.integers(0, 10))
+                     + int(factor_tenencia * tabla.num_conflictos))
+            tabu_hasta[torre, vieja] = hasta
+            vencimientos.setdefault(hasta, []).append(torre)
+            actualizar(np.append(vecinos, torre), iteracion + 1)
+        
+        if objetivo < mejor_objetivo - 1e-9:
+            mejor_objetivo = objetivo
+            np.copyto(mejor_asignacion, asignacion)
+        if tabla.num_conflictos == 0 and tabla.costo < mejor_costo_valido - 1e-9:
+            mejor_costo_valido = tabla.costo
+            np.copyto(mejor_valida, asignacion)
+            mejoras += 1
+            if presupuesto is not None:
+                presupuesto.registrar(mejor_costo_valido, mejor_valida.tolist)
+    
+    if np.isfinite(mejor_costo_valido):
+        return mejor_valida.tolist(), mejor_costo_valido, f"Tabu Search (TabuCol): {mejoras} mejoras"
+    
+    mejor = mejor_asignacion.tolist()
+    mejor_costo = float(costos[np.arange(n), mejor_asignacion].sum())
+    return mejor, mejor_costo, "Tabu Search (TabuCol): sin solución válida"
\ No newline at end of file
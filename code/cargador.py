@@ -0,0 +1,237 @@
+import os
+import json
+import numpy as np
+from grafo import GrafoCSR
+
+# Aristas leídas por bloque antes de volcarlas a un array
+TAMANO_BLOQUE = 1 << 16
+
+def _ruta_cache(ruta):
+    return ruta + '.npz'
+
+def _huella(ruta):
+    """Tamaño y fecha de modificación del archivo fuente, para invalidar la caché"""
+    info = os.stat(ruta)
+    return np.array([info.st_size, info.st_mtime_ns], dtype=np.int64)
+
+def _leer_cache(ruta):
+    """Devuelve el contenido de la caché si existe y corresponde al archivo actual"""
+    ruta_cache = _ruta_cache(ruta)
+    if not os.path.exists(ruta_cache):
+        return None
+    try:
+        with np.load(ruta_cache) as datos:
+            if not np.array_equal(datos['huella'], _huella(ruta)):
+                return None
+            # Leer todos los arrays antes de cerrar el archivo
+            return {clave: datos[clave] for clave in datos.files}
+    except (OSError, KeyError, ValueError):
+        return None
+
+def _escribir_cache(ruta, **arrays):
+    try:
+        np.savez(_ruta_cache(ruta), huella=_huella(ruta), **arrays)
+    except OSError:
+        pass  # Directorio de solo lectura: se trabaja sin caché
+
+def _lineas_datos(archivo, comentarios=('c', '#', '%')):
+    """Itera las líneas no vacías y sin comentarios, una a una"""
+    for linea in archivo:
+        linea = linea.strip()
+        if linea and not linea.startswith(comentarios):
+            yield linea
+
+def cargar_dimacs(ruta, usar_cache=True):
+    """
+    Carga un grafo en formato DIMACS (.col) leyendo línea a línea
+    
+    Formato: 'p edge n m' y una línea 'e u v' por arista (índices desde 1).
+    Las aristas se acumulan por bloques en arrays, sin guardar el texto.
+    
+    Args:
+        ruta: ruta del archivo .col
+        usar_cache: si True, lee/escribe ruta + '.npz' con el grafo en CSR
+    
+    Returns:
+        GrafoCSR
+    """
+    if usar_cache:
+        datos = _leer_cache(ruta)
+        if datos is not None:
+            return GrafoCSR(int(datos['n']), datos['indptr'], datos['indices'])
+    
+    n = None
+    bloques = []
+    bloque = np.empty((TAMANO_BLOQUE, 2), dtype=np.int64)
+    llenos = 0
+    
+    with open(ruta, 'r') as archivo:
+        for linea in _lineas_datos(archivo):
+            partes = linea.split()
+            if partes[0] == 'e':
+                bloque[llenos, 0] = int(partes[1])
+                bloque[llenos, 1] = int(partes[2])
+                llenos += 1
+                if llenos == TAMANO_BLOQUE:
+                    bloques.append(bloque)
+                    bloque = np.empty((TAMANO_BLOQUE, 2), dtype=np.int64)
+                    llenos = 0
+            elif partes[0] == 'p':
+                n = int(partes[2])
+    
+    if n is None:
+        raise ValueError(f"Falta la línea 'p edge n m' en {ruta}")
+    
+    bloques.append(bloque[:llenos])
+    aristas = np.concatenate(bloques) - 1  # DIMACS numera desde 1
+    grafo = GrafoCSR.desde_aristas(n, aristas)
+    
+    if usar_cache:
+        _escribir_cache(ruta, n=np.int64(n), indptr=grafo.indptr, indices=grafo.indices)
+    
+    return grafo
+
+def cargar_costos(ruta, usar_cache=True):
+    """
+    Carga una matriz de costos leyendo línea a línea
+    
+    Formato: una línea 'n k' y luego n líneas con k costos cada una
+    (las líneas que empiezan por 'c', '#' o '%' son comentarios).
+    
+    Args:
+        ruta: ruta del archivo de costos
+        usar_cache: si True, lee/escribe ruta + '.npz'
+    
+    Returns:
+        array (n, k) de costos
+    """
+    if usar_cache:
+        datos = _leer_cache(ruta)
+        if datos is not None:
+            return datos['costos']
+    
+    with open(ruta, 'r') as archivo:
+        lineas = _lineas_datos(archivo)
+        try:
+            n, k = (int(x) for x in next(lineas).split())
+        except StopIteration:
+            raise ValueError(f"Archivo de costos vacío: {ruta}")
+        
+        costos = np.empty((n, k))
+        fila = 0
+        for linea in lineas:
+            if fila >= n:
+                raise ValueError(f"Más de {n} filas de costos en {ruta}")
+            costos[fila] = np.array(linea.split(), dtype=float)
+            fila += 1
+    
+    if fila != n:
+        raise ValueError(f"Se esperaban {n} filas de costos en {ruta}, hay {fila}")
+    
+    if usar_cache:
+        _escribir_cache(ruta, costos=costos)
+    
+    return costos
+
+def cargar_problema(ruta_grafo, ruta_costos=None, k=None, usar_cache=True):
+    """
+    Carga un problema real (grafo DIMACS + costos) con el formato de crear_problema
+    
+    Args:
+        ruta_grafo: archivo DIMACS .col
+        ruta_costos: archivo de costos; si es None se usan costos unitarios
+                     (coloración pura) y k es obligatorio
+        k: número de frecuencias (se toma del archivo de costos si hay)
+        usar_cache: si True, usa cachés .npz junto a los archivos
+    
+    Returns:
+        diccionario del problema, listo para resolver_problema_completo
+    """
+    grafo = cargar_dimacs(ruta_grafo, usar_cache)
+    
+    if ruta_costos is not None:
+        costos = cargar_costos(ruta_costos, usar_cache)
+        if costos.shape[0] != grafo.n:
+            raise ValueError(f"Costos para {costos.shape[0]} torres, el grafo tiene {grafo.n}")
+        if k is not None and k != costos.shape[1]:
+            raise ValueError(f"k={k} no coincide con las {costos.shape[1]} columnas de costos")
+        k = costos.shape[1]
+    else:
+        if k is None:
+            raise ValueError("Sin archivo de costos hay que indicar k")
+        costos = np.ones((grafo.n, k))
+    
+    return {
+        'grafo': grafo,
+        'k': k,
+        'costos': costos,
+        'n': grafo.n,
+        'densidad': grafo.densidad(),
+        'origen': ruta_grafo
+    }
+
+def guardar_binario(problema, directorio):
+    """
+    Guarda el problema en un directorio como arrays binarios sin comprimir
+    
+    Contenido: indptr.npy e indices.npy (adyacencia CSR), costos.npy,
+    coordenadas.npy si existen, y meta.json con n, k y densidad.
+    
+    Args:
+        problema: diccionario del problema
+        directorio: directorio destino (se crea si no existe)
+    """
+    os.makedirs(directorio, exist_ok=True)
+    grafo = problema['grafo'].a_csr()
+    
+    np.save(os.path.join(directorio, 'indptr.npy'), np.ascontiguousarray(grafo.indptr))
+    np.save(os.path.join(directorio, 'indices.npy'), np.ascontiguousarray(grafo.indices))
+    np.save(os.path.join(directorio, 'costos.npy'), np.ascontiguousarray(problema['costos'], dtype=float))
+    if problema.get('coordenadas') is not None:
+        np.save(os.path.join(directorio, 'coordenadas.npy'), np.asarray(problema['coordenadas'], dtype=float))
+    
+    meta = {
+        'n': int(problema['n']),
+        'k': int(problema['k']),
+        'densidad': float(problema.get('densidad', grafo.densidad()))
+    }
+    if 'radio' in problema:
+        meta['radio'] = float(problema['radio'])
+    with open(os.path.join(directorio, 'meta.json'), 'w') as f:
+        json.dump(meta, f, indent=2)
+
+def cargar_binario(directorio):
+    """
+    Abre un problema guardado con guardar_binario mediante numpy.memmap
+    
+    Los arrays no se copian ni se leen al abrir: las páginas se cargan bajo
+    demanda y varios procesos que abran el mismo directorio comparten la
+    caché de páginas del sistema operativo.
+    
+    Args:
+        directorio: directorio creado por guardar_binario
+    
+    Returns:
+        diccionario del problema (con 'ruta_binaria' para reabrirlo en otros procesos)
+    """
+    with open(os.path.join(directorio, 'meta.json'), 'r') as f:
+        meta = json.load(f)
+    
+    def abrir(nombre):
+        return np.load(os.path.join(directorio, nombre), mmap_mode='r')
+    
+    grafo = GrafoCSR(meta['n'], abrir('indptr.npy'), abrir('indices.npy'))
+    problema = {
+        'grafo': grafo,
+        'k': meta['k'],
+        'costos': abrir('costos.npy'),
+        'n': meta['n'],
+        'densidad': meta['densidad'],
+        'ruta_binaria': directorio
+    }
+    if os.path.exists(os.path.join(directorio, 'coordenadas.npy')):
+        problema['coordenadas'] = abrir('coordenadas.npy')
+    if 'radio' in meta:
+        problema['radio'] = meta['radio']
+    
+    return problema
\ No newline at end of file
@@ -0,0 +1,59 @@
+import heapq
+import numpy as np
+
+class ColaMovimientos:
+    """
+    Cola de prioridad de movimientos candidatos, uno por torre
+    
+    Cada entrada del heap es (-puntuación, torre, frecuencia, versión). Cuando
+    una torre o sus vecinos cambian se sube su versión y se inserta su nuevo
+    mejor movimiento; las entradas con versión vieja se descartan al salir del
+    heap. Así, tras un movimiento, solo se puntúan las torres afectadas.
+    
+    La función de puntuación es la que distingue a cada búsqueda:
+    evaluar(torres) -> (puntuaciones, frecuencias), vectorizada sobre un array
+    de torres. Solo se encolan puntuaciones positivas.
+    """
+    def __init__(self, n, evaluar):
+        self.evaluar = evaluar
+        self.version = [0] * n
+        self.heap = []
+    
+    def actualizar(self, torres):
+        """Vuelve a puntuar las torres indicadas e invalida sus entradas anteriores"""
+        torres = np.asarray(torres)
+        if len(torres) == 0:
+            return
+        puntuaciones, frecuencias = self.evaluar(torres)
+        
+        version = self.version
+        for torre in torres.tolist():
+            version[torre] += 1
+        
+        positivas = np.flatnonzero(puntuaciones > 0)
+        nuevas = zip((-puntuaciones[positivas]).tolist(), torres[positivas].tolist(),
+                     frecuencias[positivas].tolist())
+        if len(self.heap) == 0:
+            self.heap = [(p, t, f, version[t]) for p, t, f in nuevas]
+            heapq.heapify(self.heap)
+        else:
+            for p, t, f in nuevas:
+                heapq.heappush(self.heap, (p, t, f, version[t]))
+    
+    def extraer(self):
+        """
+        Saca el mejor movimiento vigente
+        
+        Returns:
+            (torre, frecuencia, puntuacion) o None si no quedan movimientos
+        """
+        heap = self.heap
+        version = self.version
+        while heap:
+            puntuacion, torre, f, v = heapq.heappop(heap)
+            if v == version[torre]:
+                return torre, f, -puntuacion
+        return None
+    
+    def __len__(self):
+        return len(self.heap)
\ No newline at end of file
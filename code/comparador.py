@@ -2,6 +2,8 @@ import time
 from verificador import verificar_solucion
 from greedy_simple import asignacion_greedy, greedy_con_reintentos
 from busqueda_local import mejorar_solucion, mejorar_solucion_con_reinicio
+from programacion_entera import resolver_milp
+from cotas import cota_inferior, gap_optimalidad, TIEMPO_LP
 
 def comparar_algoritmos(problema, algoritmos):
     """
@@ -9,7 +11,8 @@ def comparar_algoritmos(problema, algoritmos):
     
     Args:
         problema: diccionario con el problema
-        algoritmos: lista de tuplas (nombre, funcion, kwargs)
+        algoritmos: lista de tuplas (nombre, funcion, kwargs); funcion devuelve
+                    la asignación o una tupla (asignacion, costo, info)
     
     Returns:
         lista de resultados
@@ -20,6 +23,7 @@ def comparar_algoritmos(problema, algoritmos):
     print("="*70)
     
     resultados = []
+    cota = cota_inferior(problema, tiempo_limite_lp=TIEMPO_LP)
     
     for nombre, funcion, kwargs in algoritmos:
         print(f"\nEjecutando: {nombre}")
@@ -32,6 +36,9 @@ def comparar_algoritmos(problema, algoritmos):
                 solucion = funcion(problema, **kwargs)
             else:
                 solucion = funcion(problema)
+            if isinstance(solucion, tuple):
+                # Las búsquedas locales devuelven (asignacion, costo, info)
+                solucion = solucion[0]
             
             tiempo = time.time() - inicio
             
@@ -43,6 +50,7 @@ def comparar_algoritmos(problema, algoritmos):
                 'costo': costo,
                 'valida': valida,
                 'conflictos': len([c for c in conflictos if isinstance(c, tuple)]),
+                'gap': gap_optimalidad(costo, cota) if valida else None,
                 'solucion': solucion
             })
             
@@ -50,6 +58,8 @@ def comparar_algoritmos(problema, algoritmos):
             print(f"  - Costo: {costo:.2f}")
             print(f"  - Válida: {valida}")
             print(f"  - Conflictos: {resultados[-1]['conflictos']}")
+            if resultados[-1]['gap'] is not None:
+                print(f"  - Gap sobre la cota inferior: {resultados[-1]['gap']:.2f}%")
             
         except Exception as e:
             print(f"  - ERROR: {e}")
@@ -101,6 +111,39 @@ def comparacion_estandar(problema):
     
     return comparar_algoritmos(problema, algoritmos)
 
+def comparacion_con_optimo(problema, tiempo_limite=60):
+    """
+    Comparación estándar frente al costo certificado por el programa entero
+    
+    Args:
+        problema: diccionario con el problema
+        tiempo_limite: segundos máximos para HiGHS
+    
+    Returns:
+        resultados de comparacion_estandar, info de resolver_milp
+    """
+    _, costo_milp, info = resolver_milp(problema, tiempo_limite=tiempo_limite)
+    resultados = comparacion_estandar(problema)
+    
+    print("\n" + "="*70)
+    print("DISTANCIA AL ÓPTIMO (MILP)")
+    print("="*70)
+    if info['demostrado'] and info['factible']:
+        print(f"Óptimo certificado: {costo_milp:.2f} (gap {info['gap']:.2e}, {info['tiempo']:.2f}s)")
+    elif info['factible']:
+        print(f"Mejor MILP: {costo_milp:.2f}, cota inferior {info['cota_inferior']}, "
+              f"gap {info['gap']} (límite de {tiempo_limite}s)")
+    else:
+        print(f"Sin solución válida certificada: {info['estado']}")
+    
+    cota = info['cota_inferior']
+    for r in resultados:
+        gap = gap_optimalidad(r['costo'], cota) if 'costo' in r and r['valida'] else None
+        if gap is not None:
+            print(f"  {r['algoritmo']}: {r['costo']:.2f} ({gap:.2f}% sobre la cota)")
+    
+    return resultados, info
+
 def analizar_escalabilidad():
     """
     Analiza cómo escalan los algoritmos con diferentes tamaños de problema
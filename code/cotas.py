@@ -0,0 +1,296 @@
+import numpy as np
+
+try:
+    from scipy import sparse
+    from scipy.optimize import linprog, linear_sum_assignment
+except ImportError:  # scipy es opcional: sin él solo hay cotas por torres y cliques
+    linprog = None
+
+def cliques_greedy(problema, tamano_minimo=3):
+    """
+    Cliques grandes construidas de forma greedy, una desde cada torre
+    
+    Desde cada torre se añaden sus vecinos de mayor a menor grado si son
+    vecinos de todos los ya elegidos. Se descartan duplicados y las
+    cliques de menos de tamano_minimo torres.
+    
+    Returns:
+        lista de cliques (listas de torres ordenadas)
+    """
+    n = problema['n']
+    grafo = problema['grafo']
+    vecinos = [set(int(v) for v in grafo.obtener_vecinos(i)) for i in range(n)]
+    grados = [len(v) for v in vecinos]
+    
+    cliques = set()
+    for inicio in range(n):
+        clique = [inicio]
+        candidatos = vecinos[inicio]
+        for v in sorted(candidatos, key=lambda v: -grados[v]):
+            if v in candidatos:
+                clique.append(v)
+                candidatos = candidatos & vecinos[v]
+        if len(clique) >= tamano_minimo:
+            cliques.add(tuple(sorted(clique)))
+    return [list(c) for c in sorted(cliques)]
+
+def cliques_maximales(problema, limite=None):
+    """
+    Todas las cliques maximales de al menos dos torres (Bron-Kerbosch con pivote)
+    
+    Args:
+        problema: diccionario con el problema
+        limite: máximo de cliques (None = sin límite); en grafos densos
+                grandes su número crece muy deprisa
+    
+    Returns:
+        lista de cliques (listas de torres ordenadas), o None si hay más de
+        limite
+    """
+    n = problema['n']
+    grafo = problema['grafo']
+    vecinos = [set(int(v) for v in grafo.obtener_vecinos(i)) for i in range(n)]
+    cliques = []
+    
+    # Pila de (R, P, X): clique actual, candidatos y ya explorados
+    pila = [([], set(range(n)), set())]
+    while pila:
+        clique, candidatos, vistos = pila.pop()
+        if not candidatos:
+            if not vistos and len(clique) >= 2:
+                cliques.append(sorted(clique))
+                if limite is not None and len(cliques) > limite:
+                    return None
+            continue
+        pivote = max(candidatos | vistos, key=lambda u: len(candidatos & vecinos[u]))
+        for v in list(candidatos - vecinos[pivote]):
+            pila.append((clique + [v], candidatos & vecinos[v], vistos & vecinos[v]))
+            candidatos = candidatos - {v}
+            vistos = vistos | {v}
+    return cliques
+
+def particion_en_cliques(problema, orden=None):
+    """
+    Partición greedy de las torres en cliques disjuntas
+    
+    Cada clique crece desde la torre de mayor grado aún libre, prefiriendo
+    vecinos cuya frecuencia más barata coincide con la de algún miembro:
+    ahí es donde la clique obliga a pagar más que la suma de mínimos.
+    
+    Args:
+        problema: diccionario con el problema
+        orden: orden en que se consideran las torres de inicio (None = de
+               mayor a menor grado)
+    
+    Returns:
+        lista de cliques (listas de torres); cada torre está en exactamente una
+    """
+    n = problema['n']
+    grafo = problema['grafo']
+    vecinos = [set(int(v) for v in grafo.obtener_vecinos(i)) for i in range(n)]
+    preferida = [min(range(problema['k']), key=lambda f: problema['costos'][i][f]) for i in range(n)]
+    
+    libre = [True] * n
+    particion = []
+    if orden is None:
+        orden = sorted(range(n), key=lambda v: -len(vecinos[v]))
+    for inicio in orden:
+        if not libre[inicio]:
+            continue
+        clique = [inicio]
+        preferidas = {preferida[inicio]}
+        candidatos = {u for u in vecinos[inicio] if libre[u]}
+        while candidatos:
+            u = max(candidatos, key=lambda u: (preferida[u] in preferidas, len(vecinos[u]), -u))
+            clique.append(u)
+            preferidas.add(preferida[u])
+            candidatos &= vecinos[u]
+        for v in clique:
+            libre[v] = False
+        particion.append(clique)
+    return particion
+
+def _costo_minimo_distinto(costos_clique):
+    """Menor costo de dar frecuencias distintas a las torres de una clique (filas)"""
+    if linprog is not None:
+        filas, columnas = linear_sum_assignment(costos_clique)
+        return float(costos_clique[filas, columnas].sum())
+    # Sin scipy: programación dinámica sobre las frecuencias usadas
+    estados = {0: 0.0}
+    for fila in costos_clique:
+        nuevos = {}
+        for usadas, acumulado in estados.items():
+            for f, costo in enumerate(fila):
+                if not usadas >> f & 1:
+                    clave = usadas | (1 << f)
+                    nuevos[clave] = min(nuevos.get(clave, np.inf), acumulado + costo)
+        estados = nuevos
+    return min(estados.values())
+
+def cota_torres(problema):
+    """Cota trivial: cada torre con su frecuencia más barata"""
+    return float(np.asarray(problema['costos'], dtype=float).min(axis=1).sum())
+
+def cota_cliques(problema, intentos=4, semilla=0):
+    """
+    Cota por particiones en cliques
+    
+    Las torres de una clique necesitan frecuencias distintas, así que el
+    costo de cada clique de una partición es al menos el de la mejor
+    asignación de frecuencias distintas a sus torres (problema de
+    asignación), y la suma sobre la partición es una cota inferior. Se
+    prueban varias particiones (la primera en orden de grado, las demás
+    desempatando al azar) y se devuelve la mejor.
+    
+    Args:
+        problema: diccionario con el problema
+        intentos: número de particiones distintas
+        semilla: semilla de los desempates aleatorios
+    
+    Returns:
+        cota inferior (inf si alguna clique tiene más torres que frecuencias)
+    """
+    n = problema['n']
+    k = problema['k']
+    costos = np.asarray(problema['costos'], dtype=float)
+    minimos = costos.min(axis=1)
+    grados = np.array([len(problema['grafo'].obtener_vecinos(i)) for i in range(n)])
+    rng = np.random.default_rng(semilla)
+    
+    mejor = -np.inf
+    for intento in range(intentos):
+        orden = None
+        if intento > 0:
+            orden = np.lexsort((rng.random(n), -grados)).tolist()
+        cota = 0.0
+        for clique in particion_en_cliques(problema, orden):
+            if len(clique) > k:
+                return np.inf
+            if len(clique) == 1:
+                cota += minimos[clique[0]]
+            else:
+                cota += _costo_minimo_distinto(costos[clique])
+        mejor = max(mejor, cota)
+    return float(mejor)
+
+def relajacion_lineal(problema, maximales=False):
+    """
+    Relajación lineal con restricciones de clique, lista para linprog
+    
+    Relaja x[i, f] (índice i * k + f) a [0, 1] con una frecuencia por torre
+    y, para cada clique y frecuencia, sum x[c, f] <= 1. Las cliques son las
+    aristas más las de cliques_greedy y particion_en_cliques, que dan una
+    relajación más ajustada que solo las aristas.
+    
+    Con maximales se usan todas las cliques maximales (cliques_maximales),
+    que la ajustan bastante más en grafos densos, si no pasan de 50 por
+    torre; si pasan, las de siempre.
+    
+    Returns:
+        (c, a_ub, b_ub, a_eq, b_eq), o None si alguna clique tiene más
+        torres que frecuencias (no hay solución válida)
+    """
+    n = problema['n']
+    k = problema['k']
+    c = np.asarray(problema['costos'], dtype=float).reshape(n * k)
+    
+    cliques = cliques_maximales(problema, limite=50 * n) if maximales else None
+    if cliques is None:
+        cliques = [list(arista) for arista in problema['grafo'].aristas().tolist()]
+        cliques += cliques_greedy(problema)
+        cliques += [clique for clique in particion_en_cliques(problema) if len(clique) >= 3]
+    if any(len(clique) > k for clique in cliques):
+        return None
+    
+    # Una frecuencia por torre
+    a_eq = sparse.csr_array((np.ones(n * k), (np.repeat(np.arange(n), k), np.arange(n * k))), shape=(n, n * k))
+    # Fila q*k + f: suma de x[c, f] sobre las torres c de la clique q
+    tamanos = np.array([len(clique) for clique in cliques], dtype=np.int64)
+    miembros = np.array([v for clique in cliques for v in clique], dtype=np.int64)
+    ids = np.repeat(np.arange(len(cliques)), tamanos)
+    filas = (ids[:, None] * k + np.arange(k)).reshape(-1)
+    columnas = (miembros[:, None] * k + np.arange(k)).reshape(-1)
+    a_ub = sparse.csr_array((np.ones(len(filas)), (filas, columnas)), shape=(len(cliques) * k, n * k))
+    
+    b_ub = np.ones(len(cliques) * k)
+    if len(cliques) == 0:
+        a_ub, b_ub = None, None
+    return c, a_ub, b_ub, a_eq, np.ones(n)
+
+def cota_lp(problema, tiempo_limite=None):
+    """
+    Cota de la relajación lineal con restricciones de clique
+    
+    Se resuelve relajacion_lineal con linprog (símplex dual de HiGHS; el
+    punto interior no respeta time_limit durante el crossover).
+    
+    Args:
+        problema: diccionario con el problema
+        tiempo_limite: segundos máximos de HiGHS
+    
+    Returns:
+        cota inferior (inf si la relajación no tiene solución), o None si
+        no hay scipy o no se resolvió a tiempo
+    """
+    if linprog is None:
+        return None
+    if problema['n'] == 0:
+        return 0.0
+    relajacion = relajacion_lineal(problema)
+    if relajacion is None:
+        return np.inf
+    c, a_ub, b_ub, a_eq, b_eq = relajacion
+    
+    opciones = {} if tiempo_limite is None else {'time_limit': tiempo_limite}
+    resultado = linprog(c, A_ub=a_ub, b_ub=b_ub, A_eq=a_eq, b_eq=b_eq, bounds=(0, 1),
+                        method='highs-ds', options=opciones)
+    if resultado.status == 2:
+        return np.inf
+    if resultado.status != 0:
+        return None
+    return float(resultado.fun)
+
+# Segundos por defecto para la relajación lineal en cota_inferior: en
+# instancias grandes sin límite tarda varios segundos
+TIEMPO_LP = 0.5
+
+def cota_inferior(problema, usar_lp=True, tiempo_limite_lp=TIEMPO_LP):
+    """
+    Mejor cota inferior del costo óptimo, con caché en el propio problema
+    
+    Cada cota se calcula una sola vez por instancia y se guarda en
+    problema['cotas'] ('torres', 'cliques', 'lp'). Si la relajación lineal
+    no termina a tiempo queda la cota de cliques, y se anota el límite en
+    problema['limite_lp_fallido']: solo se vuelve a intentar con un límite
+    mayor (o sin límite).
+    
+    Args:
+        problema: diccionario con el problema
+        usar_lp: calcular también la relajación lineal si no está en caché
+        tiempo_limite_lp: segundos máximos para la relajación lineal
+                          (None = sin límite)
+    
+    Returns:
+        la mayor de las cotas disponibles (inf si el problema no tiene
+        solución válida)
+    """
+    cotas = problema.setdefault('cotas', {})
+    if 'torres' not in cotas:
+        cotas['torres'] = cota_torres(problema)
+    if 'cliques' not in cotas:
+        cotas['cliques'] = cota_cliques(problema)
+    if usar_lp and 'lp' not in cotas and cotas['cliques'] < np.inf:
+        fallido = problema.get('limite_lp_fallido')
+        if fallido is None or tiempo_limite_lp is None or tiempo_limite_lp > fallido:
+            cota = cota_lp(problema, tiempo_limite_lp)
+            if cota is not None:
+                cotas['lp'] = cota
+            elif linprog is not None:
+                problema['limite_lp_fallido'] = tiempo_limite_lp
+    return max(cotas.values())
+
+def gap_optimalidad(costo, cota):
+    """Porcentaje del costo por encima de la cota inferior (None si no se puede calcular)"""
+    if cota is None or not 0 < cota < np.inf:
+        return None
+    return (costo - cota) / cota * 100
\ No newline at end of file
@@ -0,0 +1,183 @@
+import math
+import numpy as np
+from verificador import verificar_solucion
+from greedy_simple import greedy_con_reintentos
+from busqueda_local import mejorar_solucion
+from reduccion import subproblema
+from paralelo import crear_pool, problema_compartido, numero_procesos
+
+try:
+    from scipy.sparse import csr_array
+    from scipy.sparse.csgraph import connected_components
+except ImportError:  # scipy es opcional: se usa el BFS propio
+    connected_components = None
+
+def componentes_conexas(problema):
+    """
+    Componentes conexas del grafo de interferencias en O(n + m)
+    
+    Returns:
+        (num_componentes, etiquetas) con etiquetas[i] la componente de la torre i
+    """
+    n = problema['n']
+    csr = problema['grafo'].a_csr()
+    if connected_components is not None:
+        matriz = csr_array((np.ones(len(csr.indices), dtype=np.int8), csr.indices, csr.indptr), shape=(n, n))
+        num, etiquetas = connected_components(matriz, directed=False)
+        return int(num), etiquetas.astype(np.int64)
+    
+    # BFS desde cada torre sin etiquetar
+    indptr = csr.indptr.tolist()
+    indices = csr.indices.tolist()
+    etiquetas = [-1] * n
+    num = 0
+    for inicio in range(n):
+        if etiquetas[inicio] >= 0:
+            continue
+        etiquetas[inicio] = num
+        frontera = [inicio]
+        while frontera:
+            siguiente = []
+            for u in frontera:
+                for v in indices[indptr[u]:indptr[u + 1]]:
+                    if etiquetas[v] < 0:
+                        etiquetas[v] = num
+                        siguiente.append(v)
+            frontera = siguiente
+        num += 1
+    return num, np.array(etiquetas, dtype=np.int64)
+
+def _resolver_lote(problema, torres, aristas, inicial, metodo, max_iter, opciones):
+    """
+    Resuelve un lote de componentes como un solo subproblema
+    
+    Las componentes de un lote no comparten aristas, así que resolverlas
+    juntas equivale a resolverlas por separado con una sola llamada.
+    
+    Args:
+        aristas: aristas del lote (índices originales)
+        inicial: asignación inicial del lote en el orden de torres (None =
+                 greedy_con_reintentos sobre el subproblema)
+    
+    Returns:
+        (asignacion, costo, valida) en el orden de torres
+    """
+    sub = subproblema(problema, torres, aristas)
+    if inicial is None:
+        inicial = greedy_con_reintentos(sub)
+    asignacion, _, _ = mejorar_solucion(sub, inicial, max_iter=max_iter, metodo=metodo, **opciones)
+    valida, costo, _ = verificar_solucion(sub, asignacion)
+    return asignacion, float(costo), valida
+
+def _lote_trabajador(lote, aristas, inicial, metodo, max_iter, opciones):
+    """Tarea de un trabajador: resolver un lote de componentes del problema compartido"""
+    return _resolver_lote(problema_compartido(), lote, aristas, inicial, metodo, max_iter, opciones)
+
+def agrupar_componentes(componentes, tamano_lote):
+    """
+    Agrupa componentes en lotes de al menos tamano_lote torres
+    
+    Las componentes van de mayor a menor: las grandes forman su propio lote
+    y las pequeñas se juntan hasta llenar uno, para no pagar una tarea (y
+    un greedy y una búsqueda) por cada componente diminuta. Los lotes salen
+    de mayor a menor, así que los más largos empiezan primero.
+    
+    Returns:
+        lista de lotes, cada uno un array con las torres de sus componentes
+    """
+    lotes = []
+    actual = []
+    tamano = 0
+    for torres in sorted(componentes, key=len, reverse=True):
+        actual.append(torres)
+        tamano += len(torres)
+        if tamano >= tamano_lote:
+            lotes.append(np.concatenate(actual))
+            actual = []
+            tamano = 0
+    if actual:
+        lotes.append(np.concatenate(actual))
+    return lotes
+
+def resolver_por_componentes(problema, metodo='hill_climbing_con_conflictos', max_iter=1000, procesos=None,
+                             tamano_lote=None, asignacion_inicial=None, **opciones):
+    """
+    Resuelve cada componente conexa por separado y une las asignaciones
+    
+    Entre componentes no hay interferencias, así que la unión de soluciones
+    válidas es válida y su costo es la suma de los costos. Las torres
+    aisladas toman directamente su frecuencia más barata; el resto de
+    componentes se agrupa en lotes (agrupar_componentes) y cada lote se
+    resuelve con greedy_con_reintentos (o su parte de asignacion_inicial) +
+    mejorar_solucion sobre su subproblema. Las aristas se reparten entre
+    los lotes con una sola pasada sobre las del grafo, ordenadas por
+    componente.
+    
+    Con procesos (0 = todos los núcleos) los lotes de componentes se
+    reparten en un pool que comparte el problema, y el tiempo total lo
+    marca la componente más grande.
+    
+    Args:
+        problema: diccionario con el problema
+        metodo: método de mejorar_solucion para cada componente
+        max_iter: iteraciones de mejorar_solucion por componente
+        procesos: None para resolver en serie; si no, tamaño del pool
+        tamano_lote: torres mínimas por lote (None = n / (4 * procesos),
+                     al menos 64)
+        asignacion_inicial: asignación de partida de todo el problema (None
+                            = un greedy por lote)
+        opciones: parámetros adicionales de mejorar_solucion
+    
+    Returns:
+        mejor_asignacion, mejor_costo, info
+    """
+    n = problema['n']
+    costos = np.asarray(problema['costos'], dtype=float)
+    num, etiquetas = componentes_conexas(problema)
+    orden = np.argsort(etiquetas, kind='stable')
+    cortes = np.flatnonzero(np.diff(etiquetas[orden])) + 1
+    componentes = np.split(orden, cortes) if n > 0 else []
+    
+    # Torres aisladas: su frecuencia más barata, sin búsqueda
+    asignacion = costos.argmin(axis=1) if n > 0 else np.empty(0, dtype=np.int64)
+    aisladas = [torres[0] for torres in componentes if len(torres) == 1]
+    costo_aisladas = math.fsum(costos[aisladas, asignacion[aisladas]].tolist())
+    
+    if tamano_lote is None:
+        tamano_lote = max(64, n // (4 * (1 if procesos is None else numero_procesos(procesos))))
+    lotes = agrupar_componentes([torres for torres in componentes if len(torres) > 1], tamano_lote)
+    
+    # Aristas de cada lote: ordenadas por componente, cada una es un tramo contiguo
+    aristas = problema['grafo'].aristas()
+    aristas = aristas[np.argsort(etiquetas[aristas[:, 0]], kind='stable')]
+    limites = np.searchsorted(etiquetas[aristas[:, 0]], np.arange(num + 1))
+    aristas_lotes = []
+    for lote in lotes:
+        tramos = [aristas[limites[c]:limites[c + 1]] for c in np.unique(etiquetas[lote]).tolist()]
+        aristas_lotes.append(np.concatenate(tramos))
+    if asignacion_inicial is not None:
+        asignacion_inicial = np.asarray(asignacion_inicial, dtype=np.int64)
+        iniciales = [asignacion_inicial[lote].tolist() for lote in lotes]
+    else:
+        iniciales = [None] * len(lotes)
+    
+    tareas = list(zip(lotes, aristas_lotes, iniciales))
+    if procesos is None or not lotes:
+        resultados = [_resolver_lote(problema, lote, a, inicial, metodo, max_iter, opciones)
+                      for lote, a, inicial in tareas]
+    else:
+        with crear_pool(problema, procesos) as pool:
+            futuros = [pool.submit(_lote_trabajador, lote, a, inicial, metodo, max_iter, opciones)
+                       for lote, a, inicial in tareas]
+            resultados = [futuro.result() for futuro in futuros]
+    
+    # Unir las asignaciones; el costo es la suma exacta de los de cada parte
+    for lote, (sub_asignacion, _, _) in zip(lotes, resultados):
+        asignacion[lote] = sub_asignacion
+    costo = math.fsum([costo_aisladas] + [r[1] for r in resultados])
+    validos = sum(1 for r in resultados if r[2])
+    
+    mayor = max((len(t) for t in componentes), default=0)
+    info = (f"Descomposición: {num} componentes ({len(aisladas)} aisladas, mayor de {mayor} torres) "
+            f"en {len(lotes)} lotes, {validos}/{len(lotes)} válidos")
+    return asignacion.tolist(), costo, info
\ No newline at end of file
@@ -0,0 +1,459 @@
+import time
+import numpy as np
+from verificador import verificar_solucion
+from greedy_simple import greedy_con_reintentos
+from busqueda_local import mejorar_solucion
+from recocido_simulado import recocido_simulado
+from cotas import cliques_greedy, particion_en_cliques, relajacion_lineal
+
+try:
+    from scipy.optimize import linprog
+except ImportError:  # scipy es opcional: sin él solo hay cotas combinatorias
+    linprog = None
+
+def ramificacion_y_acotamiento(problema, tiempo_limite=None, usar_cliques=True, usar_lp=True, iter_recocido=None):
+    """
+    Solver exacto de costo mínimo por ramificación y acotamiento
+    
+    Ramifica en orden DSATUR (la torre con menos frecuencias permitidas,
+    desempatando por más vecinos sin asignar) y prueba sus frecuencias de
+    menor a mayor costo. Poda con:
+      - cota de costo: las torres se reparten en cliques disjuntas
+        (particion_en_cliques); las torres sin asignar de cada clique
+        necesitan frecuencias permitidas distintas, y el menor costo de
+        hacerlo (programación dinámica sobre máscaras de frecuencias, en
+        un vector de 2^k estados reservado una sola vez) se suma al costo
+        ya asignado. Con cliques de una torre es la suma de la frecuencia
+        permitida más barata de cada torre. Solo se recalculan las cliques
+        de las torres que cambian.
+      - torres o cliques sin asignación posible (cota infinita)
+      - cliques que se solapan (cliques_greedy): la unión de frecuencias
+        permitidas de sus torres sin asignar debe tener al menos tantas
+        frecuencias como torres (palomar)
+      - con usar_lp (y scipy), la relajación lineal con restricciones de
+        clique maximal (cotas.relajacion_lineal) en cada nodo que pasa las cotas
+        anteriores, con las torres asignadas y las frecuencias prohibidas
+        fijadas. Con sus costos reducidos se fijan variables: si la cota
+        lineal más el costo reducido de x[t, f] no mejora la incumbente,
+        t no puede tomar f en ese subárbol (con los de la raíz, en toda la
+        búsqueda, y se repite cada vez que mejora la incumbente), lo que a
+        su vez ajusta la cota combinatoria y el orden DSATUR. Si la
+        relajación de un nodo es entera, es la mejor solución del subárbol.
+    La cota combinatoria es muy floja frente a la lineal (en G(n, p) con
+    n = 60-80 queda un 15-30% por debajo del óptimo, la lineal un 1-5%):
+    sin la relajación lineal solo se demuestran instancias de unas pocas
+    decenas de torres. Con ella, G(n, p) dispersos de 60-80 torres con
+    k = 5-6 (p = 0.1-0.15) se demuestran en segundos o decenas de
+    segundos; instancias más densas con más frecuencias (k = 8, p = 0.3)
+    a menudo no se demuestran en un minuto y se devuelve la incumbente
+    con 'demostrado' False.
+    
+    La cota superior inicial es la mejor entre greedy_con_reintentos pulido
+    con cadenas de Kempe y un recocido simulado corto desde el greedy: con
+    una buena incumbente casi todo el tiempo se dedica a demostrar. La
+    búsqueda es iterativa sobre una pila y un estado de tamaño
+    fijo (máscaras de bits, contadores y cotas por clique) que se modifica
+    y deshace en el sitio.
+    
+    Args:
+        problema: diccionario con el problema
+        tiempo_limite: segundos máximos (None = hasta demostrar el óptimo)
+        usar_cliques: usar la partición en cliques y la poda por cliques
+                      (False = cota de torres sueltas)
+        usar_lp: usar la relajación lineal en cada nodo (necesita scipy)
+        iter_recocido: barridos del recocido para la cota superior inicial
+                       (None = 1000, 0 = sin recocido)
+    
+    Returns:
+        mejor_asignacion, mejor_costo, info con 'demostrado' (la búsqueda
+        terminó: la solución es óptima o el problema no tiene solución
+        válida), 'factible', 'nodos', 'tiempo' y 'cota_inferior'
+    """
+    inicio = time.time()
+    n = problema['n']
+    k = problema['k']
+    grafo = problema['grafo']
+    costos = [list(map(float, fila)) for fila in problema['costos']]
+    vecinos = [[int(v) for v in grafo.obtener_vecinos(i)] for i in range(n)]
+    infinito = float('inf')
+    eps = 1e-9
+    
+    # Cota superior inicial
+    greedy = greedy_con_reintentos(problema, dsatur=True)
+    valida, mejor_costo, _ = verificar_solucion(problema, greedy)
+    mejor_asignacion = greedy
+    candidatas = [mejorar_solucion(problema, greedy, metodo='kempe')[0]]
+    if iter_recocido is None:
+        iter_recocido = 1000
+    if iter_recocido > 0 and n > 0:
+        # Como mucho la mitad del tiempo límite
+        limite = None if tiempo_limite is None else tiempo_limite / 2
+        candidatas.append(recocido_simulado(problema, greedy, mejor_costo, iter_recocido,
+                                            tiempo_limite=limite, semilla=0)[0])
+    for candidata in candidatas:
+        valida_c, costo_c, _ = verificar_solucion(problema, candidata)
+        if valida_c and (not valida or costo_c < mejor_costo):
+            mejor_asignacion, valida, mejor_costo = candidata, True, costo_c
+    cota_superior = float(mejor_costo) if valida else infinito
+    factible = valida
+    
+    # Frecuencias de cada torre de la más barata a la más cara
+    orden = [sorted(range(k), key=lambda f: costos[i][f]) for i in range(n)]
+    
+    if usar_cliques:
+        particion = particion_en_cliques(problema)
+        cliques = cliques_greedy(problema)
+    else:
+        particion = [[i] for i in range(n)]
+        cliques = []
+    if any(len(c) > k for c in cliques) or any(len(c) > k for c in particion):
+        # Una clique con más torres que frecuencias no admite solución válida
+        return mejor_asignacion, float(mejor_costo), {
+            'demostrado': True, 'factible': False, 'nodos': 0,
+            'tiempo': time.time() - inicio, 'cota_inferior': infinito
+        }
+    parte_de = [0] * n
+    for c, clique in enumerate(particion):
+        for v in clique:
+            parte_de[v] = c
+    cliques_de = [[] for _ in range(n)]
+    for c, clique in enumerate(cliques):
+        for v in clique:
+            cliques_de[v].append(c)
+    
+    # Estado de la búsqueda (se modifica y deshace en el sitio)
+    asignacion = [-1] * n
+    conteo = [[0] * k for _ in range(n)]
+    todas = (1 << k) - 1
+    ocupadas = [0] * n  # Frecuencias usadas por algún vecino
+    prohibidas = [0] * n  # Frecuencias descartadas por costos reducidos en el subárbol
+    vetadas = [0] * n  # Frecuencias descartadas por costos reducidos de la raíz
+    permitidas = [todas] * n  # todas & ~ocupadas & ~prohibidas & ~vetadas
+    num_permitidas = [k] * n
+    grado_libre = [len(vecinos[i]) for i in range(n)]
+    valor_parte = [0.0] * len(particion)
+    estado = {'costo': 0.0, 'cota': 0.0, 'infactibles': 0}
+    
+    # Programación dinámica de valor(): estados por número de frecuencias usadas
+    por_bits = [[] for _ in range(k + 1)]
+    for mascara in range(1 << k):
+        por_bits[bin(mascara).count("1")].append(mascara)
+    dp = [infinito] * (1 << k)
+    
+    def valor(c):
+        """Menor costo de dar frecuencias permitidas distintas a la clique c"""
+        dp[0] = 0.0
+        usadas = 0
+        for u in particion[c]:
+            if asignacion[u] >= 0:
+                continue
+            for mascara in por_bits[usadas + 1]:
+                dp[mascara] = infinito
+            permitida = permitidas[u]
+            fila = costos[u]
+            alguna = False
+            for mascara in por_bits[usadas]:
+                acumulado = dp[mascara]
+                if acumulado == infinito:
+                    continue
+                libres = permitida & ~mascara
+                while libres:
+                    bit = libres & -libres
+                    libres ^= bit
+                    total = acumulado + fila[bit.bit_length() - 1]
+                    if total < dp[mascara | bit]:
+                        dp[mascara | bit] = total
+                        alguna = True
+            if not alguna:
+                return infinito
+            usadas += 1
+        return min(dp[mascara] for mascara in por_bits[usadas])
+    
+    def recalcular(c):
+        viejo = valor_parte[c]
+        nuevo = valor(c)
+        if viejo == infinito:
+            estado['infactibles'] -= 1
+        else:
+            estado['cota'] -= viejo
+        if nuevo == infinito:
+            estado['infactibles'] += 1
+        else:
+            estado['cota'] += nuevo
+        valor_parte[c] = nuevo
+    
+    # Relajación lineal: cotas de las variables según el nodo actual
+    lineal = relajacion_lineal(problema, maximales=True) if usar_lp and linprog is not None and n > 0 else None
+    if usar_lp and linprog is not None and n > 0 and lineal is None:
+        return mejor_asignacion, float(mejor_costo), {
+            'demostrado': True, 'factible': False, 'nodos': 0,
+            'tiempo': time.time() - inicio, 'cota_inferior': infinito
+        }
+    bits = np.array([[mascara >> f & 1 for f in range(k)] for mascara in range(1 << k)], dtype=float)
+    limites = np.empty((n * k, 2))
+    
+    def resolver_lineal():
+        """Relajación del nodo actual: (cota, costos reducidos, solución) o None si no se resolvió"""
+        actual = np.array(asignacion)
+        asignadas = np.flatnonzero(actual >= 0)
+        inferior = np.zeros((n, k))
+        inferior[asignadas, actual[asignadas]] = 1
+        superior = bits[permitidas]
+        superior[asignadas] = 1
+        limites[:, 0] = inferior.reshape(-1)
+        limites[:, 1] = superior.reshape(-1)
+        c_lp, a_ub, b_ub, a_eq, b_eq = lineal
+        restante = None if tiempo_limite is None else tiempo_limite - (time.time() - inicio)
+        if restante is not None and restante <= 0:
+            return None
+        opciones = {} if restante is None else {'time_limit': restante}
+        resultado = linprog(c_lp, A_ub=a_ub, b_ub=b_ub, A_eq=a_eq, b_eq=b_eq, bounds=limites,
+                            method='highs-ds', options=opciones)
+        if resultado.status == 2:
+            return infinito, None, None
+        if resultado.status != 0:
+            return None
+        return float(resultado.fun), resultado.lower.marginals, resultado.x
+    
+    for c in range(len(particion)):
+        recalcular(c)
+    
+    def cliques_factibles(cambiadas):
+        for v in cambiadas:
+            for c in cliques_de[v]:
+                union = 0
+                libres = 0
+                for u in cliques[c]:
+                    if asignacion[u] < 0:
+                        union |= permitidas[u]
+                        libres += 1
+                if bin(union).count("1") < libres:
+                    return False
+        return True
+    
+    def actualizar_vecinos(t, f, delta):
+        """Suma delta al conteo de f en los vecinos de t; devuelve las torres libres afectadas"""
+        bit = 1 << f
+        cambiadas = []
+        for v in vecinos[t]:
+            fila = conteo[v]
+            fila[f] += delta
+            grado_libre[v] -= delta
+            if fila[f] == (1 if delta > 0 else 0):
+                ocupadas[v] ^= bit
+                if not (prohibidas[v] | vetadas[v]) & bit:
+                    permitidas[v] ^= bit
+                    num_permitidas[v] -= delta
+                    if asignacion[v] < 0:
+                        cambiadas.append(v)
+        return cambiadas
+    
+    def recalcular_partes(t, cambiadas):
+        partes = {parte_de[t]}
+        for v in cambiadas:
+            partes.add(parte_de[v])
+        for c in partes:
+            recalcular(c)
+    
+    def asignar(t, f):
+        """Asigna f a t; devuelve False si el nodo resultante es infactible"""
+        asignacion[t] = f
+        estado['costo'] += costos[t][f]
+        cambiadas = actualizar_vecinos(t, f, 1)
+        recalcular_partes(t, cambiadas)
+        if estado['infactibles'] > 0:
+            return False
+        return not cliques or cliques_factibles(cambiadas)
+    
+    def desasignar(t, f):
+        asignacion[t] = -1
+        estado['costo'] -= costos[t][f]
+        recalcular_partes(t, actualizar_vecinos(t, f, -1))
+    
+    pesos_bits = 1 << np.arange(k)
+    
+    def fijar(relajacion):
+        """
+        Prohíbe las x[v, f] cuyo costo reducido impide mejorar la incumbente
+        
+        Returns:
+            (cambios, viable): cambios [(torre, bits)] para deshacer y si el
+            nodo sigue pudiendo mejorar la incumbente
+        """
+        cota, reducidos, _ = relajacion
+        if reducidos is None:
+            return [], False
+        fuera = (reducidos.reshape(n, k) >= cota_superior - eps - cota) @ pesos_bits
+        cambios = []
+        for v in np.flatnonzero(fuera).tolist():
+            quitar = int(fuera[v]) & permitidas[v]
+            if asignacion[v] >= 0 or not quitar:
+                continue
+            prohibidas[v] |= quitar
+            permitidas[v] &= ~quitar
+            num_permitidas[v] = bin(permitidas[v]).count("1")
+            cambios.append((v, quitar))
+        cambiadas = [v for v, _ in cambios]
+        for c in {parte_de[v] for v in cambiadas}:
+            recalcular(c)
+        return cambios, nodo_viable(cambiadas)
+    
+    def vetar():
+        """Con la incumbente actual, descarta para toda la búsqueda las x[v, f] que la raíz no deja mejorar"""
+        if raiz is None or raiz[1] is None:
+            return
+        fuera = (raiz[1].reshape(n, k) >= cota_superior - eps - raiz[0]) @ pesos_bits
+        cambiadas = []
+        for v in np.flatnonzero(fuera).tolist():
+            nuevas = int(fuera[v]) & ~vetadas[v]
+            vetadas[v] |= nuevas
+            if permitidas[v] & nuevas:
+                permitidas[v] &= ~nuevas
+                num_permitidas[v] = bin(permitidas[v]).count("1")
+                cambiadas.append(v)
+        for c in {parte_de[v] for v in cambiadas}:
+            recalcular(c)
+    
+    def nodo_viable(cambiadas):
+        """Si el nodo actual aún puede mejorar la incumbente tras cambiar las permitidas de esas torres"""
+        if estado['infactibles'] > 0 or estado['costo'] + estado['cota'] >= cota_superior - eps:
+            return False
+        return not cliques or cliques_factibles(cambiadas)
+    
+    def deshacer(cambios):
+        for v, quitar in cambios:
+            prohibidas[v] &= ~quitar
+            permitidas[v] |= quitar & ~ocupadas[v] & ~vetadas[v]
+            num_permitidas[v] = bin(permitidas[v]).count("1")
+        for c in {parte_de[v] for v, _ in cambios}:
+            recalcular(c)
+    
+    def entera(relajacion):
+        """Asignación de la relajación si es entera (válida: incluye todas las aristas), si no None"""
+        if relajacion is None or relajacion[2] is None:
+            return None
+        x = relajacion[2].reshape(n, k)
+        if np.abs(x - x.round()).max() > 1e-6:
+            return None
+        return x.argmax(axis=1).tolist()
+    
+    def ordenar(t, relajacion):
+        """Frecuencias de t a probar: primero las que más usa la relajación, luego por costo"""
+        if relajacion is None:
+            return orden[t]
+        x = relajacion[2][t * k:(t + 1) * k].round(6).tolist()
+        return sorted(orden[t], key=lambda f: -x[f])
+    
+    def elegir_torre():
+        """DSATUR: menos frecuencias permitidas, luego más vecinos sin asignar"""
+        mejor = -1
+        for v in range(n):
+            if asignacion[v] < 0 and (mejor < 0 or num_permitidas[v] < num_permitidas[mejor] or
+                                      (num_permitidas[v] == num_permitidas[mejor] and
+                                       grado_libre[v] > grado_libre[mejor])):
+                mejor = v
+        return mejor
+    
+    # Raíz: cota combinatoria y, si hay, relajación lineal con fijación de variables
+    cota_raiz = estado['cota'] if estado['infactibles'] == 0 else infinito
+    viable = cota_raiz < cota_superior - eps
+    raiz = None
+    if viable and lineal is not None:
+        raiz = resolver_lineal()
+        if raiz is not None:
+            cota_raiz = max(cota_raiz, raiz[0])
+            solucion = entera(raiz)
+            if solucion is not None and raiz[0] < cota_superior - eps:
+                # La relajación ya es entera: es el óptimo
+                cota_superior = sum(costos[i][f] for i, f in enumerate(solucion))
+                mejor_asignacion = solucion
+                factible = True
+            vetar()
+            viable = raiz[0] < cota_superior - eps and nodo_viable(range(n))
+            cota_raiz = max(cota_raiz, estado['cota'] if estado['infactibles'] == 0 else infinito)
+    
+    # Pila: torre de cada nivel, siguiente posición y orden de sus
+    # frecuencias, frecuencia asignada y variables fijadas al llegar al nivel
+    pila_torre = [0] * n
+    pila_pos = [0] * n
+    pila_f = [-1] * n
+    pila_orden = [None] * n
+    pila_fijadas = [[] for _ in range(n)]
+    nodos = 0
+    pasos = 0
+    intervalo = 1 if lineal is not None else 1024
+    interrumpido = False
+    
+    profundidad = 0 if n > 0 and viable else -1
+    if profundidad == 0:
+        pila_torre[0] = elegir_torre()
+        pila_orden[0] = ordenar(pila_torre[0], raiz)
+    
+    while profundidad >= 0:
+        t = pila_torre[profundidad]
+        if pila_f[profundidad] >= 0:
+            desasignar(t, pila_f[profundidad])
+            pila_f[profundidad] = -1
+        
+        pasos += 1
+        if tiempo_limite is not None and pasos % intervalo == 0 and time.time() - inicio >= tiempo_limite:
+            interrumpido = True
+            break
+        
+        baja = False
+        while pila_pos[profundidad] < k:
+            f = pila_orden[profundidad][pila_pos[profundidad]]
+            pila_pos[profundidad] += 1
+            if not permitidas[t] >> f & 1:
+                continue
+            
+            nodos += 1
+            factible_nodo = asignar(t, f)
+            pila_f[profundidad] = f
+            if factible_nodo and estado['costo'] + estado['cota'] < cota_superior - eps:
+                if profundidad + 1 == n:
+                    # Solución completa mejor que la incumbente
+                    cota_superior = estado['costo']
+                    mejor_asignacion = asignacion[:]
+                    factible = True
+                    vetar()
+                else:
+                    cambios, viable, hijo = [], True, None
+                    if lineal is not None:
+                        hijo = resolver_lineal()
+                        solucion = entera(hijo)
+                        if solucion is not None and hijo[0] < cota_superior - eps:
+                            # Relajación entera: es lo mejor del subárbol
+                            cota_superior = sum(costos[i][f] for i, f in enumerate(solucion))
+                            mejor_asignacion = solucion
+                            factible = True
+                            vetar()
+                        if hijo is not None:
+                            cambios, viable = fijar(hijo)
+                    if viable:
+                        profundidad += 1
+                        pila_torre[profundidad] = elegir_torre()
+                        pila_orden[profundidad] = ordenar(pila_torre[profundidad], hijo)
+                        pila_pos[profundidad] = 0
+                        pila_f[profundidad] = -1
+                        pila_fijadas[profundidad] = cambios
+                        baja = True
+                        break
+                    deshacer(cambios)
+            desasignar(t, f)
+            pila_f[profundidad] = -1
+        
+        if not baja:
+            deshacer(pila_fijadas[profundidad])
+            pila_fijadas[profundidad] = []
+            profundidad -= 1
+    
+    _, mejor_costo, _ = verificar_solucion(problema, mejor_asignacion)
+    demostrado = not interrumpido
+    return mejor_asignacion, float(mejor_costo), {
+        'demostrado': demostrado,
+        'factible': factible,
+        'nodos': nodos,
+        'tiempo': time.time() - inicio,
+        'cota_inferior': (float(mejor_costo) if factible else infinito) if demostrado else cota_raiz
+    }
\ No newline at end of file
@@ -1,8 +1,83 @@
-class Grafo:
+import numpy as np
+
+# Densidad a partir de la cual el índice de pertenencia usa un bitset por fila
+UMBRAL_DENSIDAD_BITSET = 0.05
+
+class _IndicePertenencia:
+    """
+    Índice opcional para consultas de adyacencia en O(1)
+    
+    - 'bitset': un mapa de bits por fila (n²/8 bytes), para grafos densos
+    - 'conjuntos': un set por fila, para grafos dispersos
+    """
+    _tipo_indice = None
+    
+    def construir_indice(self, tipo='auto'):
+        """
+        Construye el índice de pertenencia a partir de las aristas actuales
+        
+        Args:
+            tipo: 'auto' (según densidad()), 'bitset' o 'conjuntos'
+        """
+        if tipo == 'auto':
+            tipo = 'bitset' if self.densidad() >= UMBRAL_DENSIDAD_BITSET else 'conjuntos'
+        if tipo not in ('bitset', 'conjuntos'):
+            raise ValueError(f"Tipo de índice desconocido: {tipo}")
+        
+        aristas = self.aristas()
+        filas = np.concatenate([aristas[:, 0], aristas[:, 1]])
+        columnas = np.concatenate([aristas[:, 1], aristas[:, 0]])
+        
+        if tipo == 'bitset':
+            self._bytes_fila = (self.n + 7) >> 3
+            bits = np.zeros(self.n * self._bytes_fila, dtype=np.uint8)
+            np.bitwise_or.at(bits, filas * self._bytes_fila + (columnas >> 3),
+                             (1 << (columnas & 7)).astype(np.uint8))
+            self._bits = bytearray(bits.tobytes())
+            self._conjuntos = None
+        else:
+            self._conjuntos = [set() for _ in range(self.n)]
+            for i, j in zip(filas.tolist(), columnas.tolist()):
+                self._conjuntos[i].add(j)
+            self._bits = None
+        
+        self._tipo_indice = tipo
+        return tipo
+    
+    def _contiene(self, i, j):
+        """Consulta O(1) en el índice (requiere índice construido)"""
+        if self._tipo_indice == 'bitset':
+            return (self._bits[i * self._bytes_fila + (j >> 3)] >> (j & 7)) & 1 == 1
+        return j in self._conjuntos[i]
+    
+    def _marcar(self, i, j):
+        """Registra la arista (i, j) en el índice"""
+        if self._tipo_indice == 'bitset':
+            self._bits[i * self._bytes_fila + (j >> 3)] |= 1 << (j & 7)
+            self._bits[j * self._bytes_fila + (i >> 3)] |= 1 << (i & 7)
+        else:
+            self._conjuntos[i].add(j)
+            self._conjuntos[j].add(i)
+
+class Grafo(_IndicePertenencia):
     """Solo guarda conexiones entre torres"""
-    def __init__(self, n):
+    _csr = None  # Copia CSR en caché (se descarta al conectar)
+    
+    def __init__(self, n, indice='auto'):
+        """
+        Args:
+            n: número de torres
+            indice: 'auto', 'bitset', 'conjuntos' o None (sin índice, búsqueda lineal).
+                    Con 'auto' se empieza con conjuntos y se pasa a bitset
+                    cuando la densidad supera UMBRAL_DENSIDAD_BITSET
+        """
         self.n = n  # número de torres
         self.vecinos = [[] for _ in range(n)]
+        self._auto = indice == 'auto'
+        self._m = 0
+        self._m_umbral = UMBRAL_DENSIDAD_BITSET * n * (n - 1) / 2
+        if indice is not None:
+            self.construir_indice(indice)
     
     def conectar(self, i, j):
         """Añade interferencia entre torres i y j"""
@@ -11,6 +86,21 @@ class Grafo:
             raise ValueError(f"Índices fuera de rango: ({i}, {j}) con n={self.n}")
         if i == j:
             return  # No conectamos un nodo consigo mismo
+        self._csr = None
+        
+        if self._tipo_indice is not None:
+            # Evitar duplicados en O(1) con el índice
+            if self._contiene(i, j):
+                return
+            self.vecinos[i].append(j)
+            self.vecinos[j].append(i)
+            self._marcar(i, j)
+            self._m += 1
+            
+            # El grafo se volvió denso: el bitset ocupa menos que los conjuntos
+            if self._auto and self._tipo_indice == 'conjuntos' and self._m >= self._m_umbral:
+                self.construir_indice('bitset')
+            return
         
         # Evitar duplicados
         if j not in self.vecinos[i]:
@@ -18,10 +108,17 @@ class Grafo:
         if i not in self.vecinos[j]:
             self.vecinos[j].append(i)
     
+    def construir_indice(self, tipo='auto'):
+        """Construye el índice y sincroniza el contador de aristas"""
+        self._m = self.numero_interferencias()
+        return super().construir_indice(tipo)
+    
     def son_vecinos(self, i, j):
         """Verifica si dos torres interfieren"""
         if i < 0 or i >= self.n or j < 0 or j >= self.n:
             return False
+        if self._tipo_indice is not None:
+            return self._contiene(i, j)
         return j in self.vecinos[i]
     
     def obtener_vecinos(self, i):
@@ -47,4 +144,142 @@ class Grafo:
         if self.n <= 1:
             return 0
         max_aristas = self.n * (self.n - 1) / 2
-        return self.numero_interferencias() / max_aristas
\ No newline at end of file
+        return self.numero_interferencias() / max_aristas
+    
+    # Conversión a representación compacta
+    def aristas(self):
+        """Retorna un array (m, 2) con las aristas (i, j), i < j"""
+        pares = [(i, j) for i in range(self.n) for j in self.vecinos[i] if i < j]
+        if not pares:
+            return np.empty((0, 2), dtype=np.int64)
+        return np.array(pares, dtype=np.int64)
+    
+    def a_csr(self):
+        """
+        Retorna una copia inmutable del grafo en formato CSR
+        
+        Se construye una vez y se reutiliza hasta la siguiente llamada a
+        conectar, así los greedy, las tablas de conflictos y los trabajadores
+        no repiten la pasada O(m) sobre las listas de vecinos.
+        """
+        if self._csr is None:
+            self._csr = GrafoCSR.desde_aristas(self.n, self.aristas())
+        return self._csr
+
+class GrafoCSR(_IndicePertenencia):
+    """
+    Grafo inmutable con adyacencia comprimida por filas (CSR)
+    
+    Los vecinos de la torre i son indices[indptr[i]:indptr[i+1]], ordenados.
+    Ocupa 8 bytes por arista dirigida en lugar de una lista por torre, y
+    mantiene la misma interfaz de consulta que Grafo. Sin índice, son_vecinos
+    hace búsqueda binaria; construir_indice() la vuelve O(1).
+    """
+    def __init__(self, n, indptr, indices):
+        self.n = n
+        self.indptr = indptr
+        self.indices = indices
+    
+    @classmethod
+    def desde_aristas(cls, n, aristas):
+        """
+        Construye el grafo en bloque a partir de un array de aristas
+        
+        Args:
+            n: número de torres
+            aristas: array (m, 2) de pares (i, j); se ignoran lazos y duplicados
+        
+        Returns:
+            GrafoCSR
+        """
+        aristas = np.asarray(aristas, dtype=np.int64).reshape(-1, 2)
+        if aristas.size and (aristas.min() < 0 or aristas.max() >= n):
+            raise ValueError(f"Índices fuera de rango con n={n}")
+        
+        u, v = aristas[:, 0], aristas[:, 1]
+        no_lazo = u != v
+        u, v = u[no_lazo], v[no_lazo]
+        
+        # Normalizar a (menor, mayor) y eliminar duplicados con una sola codificación
+        menor = np.minimum(u, v)
+        mayor = np.maximum(u, v)
+        codigos = np.sort(menor * n + mayor)
+        if len(codigos) > 1:
+            codigos = codigos[np.concatenate([[True], codigos[1:] != codigos[:-1]])]
+        menor = codigos // n
+        mayor = codigos % n
+        
+        # Cada arista aparece en las dos filas; ordenar por (fila, columna)
+        dirigidas = np.sort(np.concatenate([codigos, mayor * n + menor]))
+        filas = dirigidas // n
+        
+        indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(filas, minlength=n), out=indptr[1:])
+        indices = (dirigidas % n).astype(np.int32 if n < 2**31 else np.int64)
+        
+        return cls(n, indptr, indices)
+    
+    def conectar(self, i, j):
+        """El grafo CSR es inmutable"""
+        raise TypeError("GrafoCSR es inmutable; construya con desde_aristas")
+    
+    def son_vecinos(self, i, j):
+        """Verifica si dos torres interfieren (búsqueda binaria en la fila)"""
+        if i < 0 or i >= self.n or j < 0 or j >= self.n:
+            return False
+        if self._tipo_indice is not None:
+            return self._contiene(i, j)
+        fila = self.indices[self.indptr[i]:self.indptr[i + 1]]
+        pos = np.searchsorted(fila, j)
+        return bool(pos < len(fila) and fila[pos] == j)
+    
+    def obtener_vecinos(self, i):
+        """Retorna torres que interfieren con i (vista, sin copia)"""
+        if i < 0 or i >= self.n:
+            return self.indices[:0]
+        return self.indices[self.indptr[i]:self.indptr[i + 1]]
+    
+    def grados(self):
+        """Retorna el array de grados de todas las torres"""
+        return np.diff(self.indptr)
+    
+    def grado_maximo(self):
+        """Retorna el grado máximo del grafo"""
+        if self.n == 0:
+            return 0
+        return int(self.grados().max())
+    
+    def numero_interferencias(self):
+        """Retorna el número total de interferencias (aristas)"""
+        return len(self.indices) // 2
+    
+    def densidad(self):
+        """Retorna la densidad del grafo (0 a 1)"""
+        if self.n <= 1:
+            return 0
+        max_aristas = self.n * (self.n - 1) / 2
+        return self.numero_interferencias() / max_aristas
+    
+    def vecinos_lote(self, torres):
+        """
+        Vecinos de varias torres a la vez, concatenados
+        
+        Returns:
+            (origen, vecinos): vecinos[x] es vecino de torres[origen[x]]
+        """
+        torres = np.asarray(torres)
+        grados = self.indptr[torres + 1] - self.indptr[torres]
+        total = int(grados.sum())
+        origen = np.repeat(np.arange(len(torres)), grados)
+        desplazamiento = np.arange(total) - np.repeat(np.cumsum(grados) - grados, grados)
+        return origen, self.indices[self.indptr[torres][origen] + desplazamiento]
+    
+    def aristas(self):
+        """Retorna un array (m, 2) con las aristas (i, j), i < j"""
+        filas = np.repeat(np.arange(self.n), self.grados())
+        mascara = filas < self.indices
+        return np.column_stack([filas[mascara], self.indices[mascara]]).astype(np.int64)
+    
+    def a_csr(self):
+        """Ya está en formato CSR"""
+        return self
\ No newline at end of file
@@ -1,16 +1,25 @@
+import heapq
 import random
+import time
+import numpy as np
+from verificador import verificar_solucion, verificar_lote
+from paralelo import crear_pool, problema_compartido, numero_procesos, semillas_independientes
 
-def asignacion_greedy(problema, estrategia='grado'):
+def asignacion_greedy(problema, estrategia='grado', rng=None):
     """
     Asigna frecuencias usando estrategia greedy mejorada
     
     Args:
         problema: diccionario con el problema
-        estrategia: 'grado', 'costo', 'mixto', 'aleatorio'
+        estrategia: 'grado', 'costo', 'mixto', 'aleatorio', 'dsatur'
+        rng: random.Random para el orden aleatorio (por defecto, el módulo random)
     
     Returns:
         lista de frecuencias asignadas
     """
+    if estrategia == 'dsatur':
+        return _greedy_dsatur(problema)
+    
     grafo = problema['grafo']
     n = problema['n']
     k = problema['k']
@@ -41,77 +50,123 @@ def asignacion_greedy(problema, estrategia='grado'):
     
     elif estrategia == 'aleatorio':
         # Orden aleatorio (para múltiples intentos)
-        random.shuffle(torres)
+        (rng or random).shuffle(torres)
     else:
         # Por defecto: orden por grado
         torres.sort(key=lambda i: len(grafo.obtener_vecinos(i)), reverse=True)
     
+    # Tabla n x k: cuántos vecinos ya asignados usan cada frecuencia
+    csr = grafo.a_csr()
+    indptr = csr.indptr.tolist()
+    conteo = np.zeros((n, k), dtype=np.int32)
+    penalizacion = _penalizacion(costos)
+    
     for torre in torres:
-        # Frecuencias prohibidas por vecinos ya asignados
-        prohibidas = set()
-        for vecino in grafo.obtener_vecinos(torre):
-            if asignacion[vecino] != -1:
-                prohibidas.add(asignacion[vecino])
-        
-        # Buscar mejor frecuencia permitida (sin conflictos)
-        mejor_frecuencia = -1
-        mejor_costo = float('inf')
+        f = _elegir_frecuencia(costos[torre], conteo[torre], penalizacion)
+        asignacion[torre] = f
+        _registrar_asignacion(indptr, csr.indices, conteo, torre, f)
+    
+    return asignacion
+
+# Peso mínimo de cada conflicto al elegir frecuencia cuando ninguna está libre
+PENALIZACION_CONFLICTO = 1000
+
+def _penalizacion(costos):
+    """
+    Penalización por conflicto mayor que el rango de costos: así una sola
+    expresión elige la frecuencia libre más barata si la hay y, si no,
+    la de menor costo penalizado
+    """
+    rango = float(np.max(costos) - np.min(costos)) if np.size(costos) else 0.0
+    return max(PENALIZACION_CONFLICTO, rango + 1)
+
+def _elegir_frecuencia(costos_torre, conteo_torre, penalizacion):
+    """
+    Frecuencia más barata no usada por vecinos; si todas lo están,
+    la de menor costo penalizado (costo + penalización por conflicto)
+    
+    Args:
+        costos_torre: fila de costos de la torre
+        conteo_torre: fila de la tabla de vecinos asignados por frecuencia
+        penalizacion: valor de _penalizacion(costos)
+    """
+    return int((costos_torre + conteo_torre * penalizacion).argmin())
+
+def _registrar_asignacion(indptr, indices, conteo, torre, f):
+    """Actualiza la tabla de conteo en O(grado)"""
+    conteo[indices[indptr[torre]:indptr[torre + 1]], f] += 1
+
+def _greedy_dsatur(problema):
+    """
+    DSATUR: asigna primero la torre con más frecuencias distintas entre sus
+    vecinos ya asignados (saturación), desempatando por grado
+    
+    La cola de prioridad es un heap con entradas perezosas: al subir la
+    saturación de una torre se inserta una entrada nueva y las viejas se
+    descartan al sacarlas. Total O((n + m) log n).
+    """
+    n = problema['n']
+    k = problema['k']
+    costos = problema['costos']
+    csr = problema['grafo'].a_csr()
+    
+    indptr = csr.indptr.tolist()
+    asignacion = np.full(n, -1, dtype=np.int64)
+    conteo = np.zeros((n, k), dtype=np.int32)
+    saturacion = np.zeros(n, dtype=np.int64)
+    grados = csr.grados().tolist()
+    penalizacion = _penalizacion(costos)
+    
+    cola = [(0, -grados[i], i) for i in range(n)]
+    heapq.heapify(cola)
+    
+    while cola:
+        saturacion_neg, grado_neg, torre = heapq.heappop(cola)
+        # Entrada obsoleta: ya asignada o su saturación cambió
+        if asignacion[torre] != -1 or -saturacion_neg != saturacion[torre]:
+            continue
         
-        for f in range(k):
-            if f not in prohibidas and costos[torre][f] < mejor_costo:
-                mejor_costo = costos[torre][f]
-                mejor_frecuencia = f
+        f = _elegir_frecuencia(costos[torre], conteo[torre], penalizacion)
+        asignacion[torre] = f
         
-        # SIEMPRE EVITAR CONFLICTOS: si no hay permitida, buscar alternativa
-        if mejor_frecuencia == -1:
-            # Buscar la frecuencia que cause menos conflictos con menor costo
-            mejores_opciones = []
-            
-            for f in range(k):
-                # Contar conflictos que causaría esta frecuencia
-                conflictos_potenciales = 0
-                for vecino in grafo.obtener_vecinos(torre):
-                    if asignacion[vecino] == f:
-                        conflictos_potenciales += 1
-                
-                costo_f = costos[torre][f]
-                # Penalizar conflictos fuertemente
-                costo_penalizado = costo_f + (conflictos_potenciales * 1000)
-                mejores_opciones.append((costo_penalizado, conflictos_potenciales, costo_f, f))
-            
-            # Ordenar: primero menor costo penalizado
-            mejores_opciones.sort()
-            mejor_frecuencia = mejores_opciones[0][3]
+        # La saturación sube en los vecinos sin asignar que no veían f
+        vecinos = csr.indices[indptr[torre]:indptr[torre + 1]]
+        nuevos = vecinos[(conteo[vecinos, f] == 0) & (asignacion[vecinos] == -1)]
+        conteo[vecinos, f] += 1
+        saturacion[nuevos] += 1
         
-        asignacion[torre] = mejor_frecuencia
+        for vecino, sat in zip(nuevos.tolist(), saturacion[nuevos].tolist()):
+            heapq.heappush(cola, (-sat, -grados[vecino], vecino))
     
-    return asignacion
+    return asignacion.tolist()
 
-def greedy_con_reintentos(problema, reintentos=5):
+def greedy_con_reintentos(problema, reintentos=5, procesos=None, semilla=None, dsatur=False):
     """
     Ejecuta greedy múltiples veces con diferentes estrategias
     y devuelve la mejor solución encontrada
+    
+    Args:
+        problema: diccionario con el problema
+        reintentos: número de intentos (los que exceden las estrategias fijas son aleatorios)
+        procesos: si se indica, reparte los intentos en un pool de procesos
+                  (ver greedy_paralelo)
+        semilla: semilla de los intentos aleatorios en modo paralelo
+        dsatur: si True, el primer intento es DSATUR (se añade a los demás)
     """
+    if procesos is not None:
+        return greedy_paralelo(problema, reintentos, procesos, semilla, dsatur)[0]
+    
     mejor_solucion = None
     mejor_costo = float('inf')
     mejor_valida = False
     
-    estrategias = ['grado', 'costo', 'mixto', 'aleatorio']
-    
-    for intento in range(reintentos):
-        if intento < len(estrategias):
-            estrategia = estrategias[intento]
-        else:
-            estrategia = 'aleatorio'
+    for intento in range(reintentos + dsatur):
+        estrategia = _estrategia_intento(intento, dsatur)
         
         # Ejecutar greedy con esta estrategia
         solucion = asignacion_greedy(problema, estrategia)
         
-        # Calcular costo rápidamente
-        costo = sum(problema['costos'][i][solucion[i]] for i in range(problema['n']))
-        
-        # Verificar si es válida
-        from verificador import verificar_solucion
+        # Verificar si es válida (también devuelve el costo)
         valida, costo_real, conflictos = verificar_solucion(problema, solucion)
         
         # PRIORIDAD 1: Soluciones válidas, luego por costo
@@ -121,4 +176,124 @@ def greedy_con_reintentos(problema, reintentos=5):
             mejor_solucion = solucion
             mejor_valida = valida
     
-    return mejor_solucion
\ No newline at end of file
+    return mejor_solucion
+
+ESTRATEGIAS_REINTENTOS = ['grado', 'costo', 'mixto', 'aleatorio']
+
+def _estrategia_intento(intento, dsatur=False):
+    """Estrategia del intento: primero las fijas (con DSATUR delante si se pide), después siempre 'aleatorio'"""
+    if dsatur:
+        if intento == 0:
+            return 'dsatur'
+        intento -= 1
+    if intento < len(ESTRATEGIAS_REINTENTOS):
+        return ESTRATEGIAS_REINTENTOS[intento]
+    return 'aleatorio'
+
+def _intento_greedy(intento, semilla, dsatur=False):
+    """Tarea de un trabajador: un intento greedy sobre el problema compartido"""
+    problema = problema_compartido()
+    estrategia = _estrategia_intento(intento, dsatur)
+    
+    inicio = time.time()
+    solucion = asignacion_greedy(problema, estrategia, rng=random.Random(semilla))
+    valida, costo, conflictos = verificar_solucion(problema, solucion)
+    
+    return solucion, {
+        'intento': intento,
+        'estrategia': estrategia,
+        'costo': float(costo),
+        'valida': valida,
+        'conflictos': len([c for c in conflictos if isinstance(c, tuple)]),
+        'tiempo': time.time() - inicio
+    }
+
+def greedy_paralelo(problema, reintentos=32, procesos=None, semilla=None, dsatur=False):
+    """
+    Reparte muchos reintentos greedy aleatorizados en un pool de procesos
+    
+    Cada intento usa su propio flujo aleatorio (derivado de semilla) y todos
+    leen la misma copia del problema.
+    
+    Args:
+        problema: diccionario con el problema
+        reintentos: número total de intentos
+        procesos: tamaño del pool (None = todos los núcleos)
+        semilla: semilla para reproducibilidad
+        dsatur: si True, se añade un intento DSATUR al principio
+    
+    Returns:
+        (mejor_solucion, estadisticas) donde estadisticas es una lista con un
+        diccionario por intento (estrategia, costo, valida, conflictos, tiempo)
+    """
+    reintentos += dsatur
+    semillas = semillas_independientes(semilla, reintentos)
+    
+    with crear_pool(problema, procesos) as pool:
+        resultados = list(pool.map(_intento_greedy, range(reintentos), semillas, [dsatur] * reintentos,
+                                   chunksize=max(1, reintentos // (4 * numero_procesos(procesos)))))
+    
+    # PRIORIDAD 1: Soluciones válidas, luego por costo
+    mejor_solucion, _ = min(resultados, key=lambda r: (not r[1]['valida'], r[1]['costo'], r[1]['intento']))
+    estadisticas = [r[1] for r in resultados]
+    
+    return mejor_solucion, estadisticas
+
+def greedy_por_lotes(problema, poblacion=100, semilla=None, max_elementos=5 * 10**7):
+    """
+    Greedy aleatorizado para P órdenes a la vez, vectorizado con NumPy
+    
+    Se mantiene una matriz P x n de asignaciones y una tabla P x n x k de
+    vecinos asignados por frecuencia; en cada paso las P soluciones asignan
+    su siguiente torre con un argmin enmascarado por fila. Al final se
+    evalúan todas con una sola verificación por lotes.
+    
+    Args:
+        problema: diccionario con el problema
+        poblacion: número P de órdenes aleatorios
+        semilla: entero, None o numpy.random.Generator
+        max_elementos: tope de P*n*k por lote (la tabla usa 4 bytes por elemento)
+    
+    Returns:
+        (mejor_solucion, estadisticas) con estadisticas = {'asignaciones',
+        'validas', 'costos', 'conflictos'} (arrays de longitud P)
+    """
+    if poblacion < 1:
+        raise ValueError(f"La población debe tener al menos un individuo: {poblacion}")
+    n = problema['n']
+    k = problema['k']
+    costos = problema['costos']
+    csr = problema['grafo'].a_csr()
+    rng = np.random.default_rng(semilla)
+    penalizacion = _penalizacion(costos)
+    
+    asignaciones = np.full((poblacion, n), -1, dtype=np.int64)
+    por_lote = max(1, max_elementos // max(1, n * k))
+    
+    for inicio in range(0, poblacion, por_lote):
+        lote = asignaciones[inicio:inicio + por_lote]
+        p = len(lote)
+        filas = np.arange(p)
+        ordenes = np.argsort(rng.random((p, n)), axis=1)
+        conteo = np.zeros((p, n, k), dtype=np.int32)
+        
+        for paso in range(n):
+            torres = ordenes[:, paso]
+            frecuencias = (costos[torres] + conteo[filas, torres] * penalizacion).argmin(axis=1)
+            lote[filas, torres] = frecuencias
+            
+            # Cada solución suma 1 en la frecuencia elegida de sus vecinos
+            origen, vecinos = csr.vecinos_lote(torres)
+            conteo[origen, vecinos, frecuencias[origen]] += 1
+    
+    validas, costos_totales, conflictos = verificar_lote(problema, asignaciones)
+    
+    # PRIORIDAD 1: Soluciones válidas, luego por costo
+    mejor = np.lexsort((costos_totales, ~validas))[0]
+    
+    return asignaciones[mejor].tolist(), {
+        'asignaciones': asignaciones,
+        'validas': validas,
+        'costos': costos_totales,
+        'conflictos': conflictos
+    }
\ No newline at end of file
@@ -1,8 +1,13 @@
 import random
 import numpy as np
-from grafo import Grafo
+from grafo import Grafo, GrafoCSR
 
-def crear_problema(n_torres, k_frecuencias, densidad=0.3, semilla=None):
+try:
+    from scipy.spatial import cKDTree
+except ImportError:  # scipy es opcional: se usa la rejilla uniforme
+    cKDTree = None
+
+def crear_problema(n_torres, k_frecuencias, densidad=0.3, semilla=None, vectorizado=False):
     """
     Crea problema aleatorio sin resolver
     
@@ -11,7 +16,12 @@ def crear_problema(n_torres, k_frecuencias, densidad=0.3, semilla=None):
         k_frecuencias: número de frecuencias disponibles
         densidad: probabilidad de conexión (0 a 1)
         semilla: semilla para reproducibilidad
+        vectorizado: si True, usa el generador NumPy (misma distribución,
+                     distinta secuencia aleatoria) y devuelve un GrafoCSR
     """
+    if vectorizado:
+        return crear_problema_vectorizado(n_torres, k_frecuencias, densidad, semilla)
+    
     if semilla is not None:
         random.seed(semilla)
         np.random.seed(semilla)
@@ -47,6 +57,176 @@ def crear_problema(n_torres, k_frecuencias, densidad=0.3, semilla=None):
         'densidad': densidad
     }
 
+def generar_aristas_gnp(n, p, rng):
+    """
+    Muestrea las aristas de G(n, p) en tiempo proporcional a su número
+    
+    En lugar de lanzar una moneda por cada par, se saltan los pares no
+    elegidos: la distancia entre dos aristas consecutivas (en el orden
+    lineal de los pares i < j) sigue una distribución geométrica de
+    parámetro p.
+    
+    Args:
+        n: número de torres
+        p: probabilidad de conexión
+        rng: numpy.random.Generator
+    
+    Returns:
+        array (m, 2) de aristas (i, j) con i < j
+    """
+    total = n * (n - 1) // 2
+    if total == 0 or p <= 0:
+        return np.empty((0, 2), dtype=np.int64)
+    if p >= 1:
+        return np.column_stack(np.triu_indices(n, 1)).astype(np.int64)
+    
+    # Posiciones lineales de las aristas, generadas por bloques de saltos
+    bloques = []
+    ultima = -1
+    tam_bloque = max(1024, int(total * p * 1.05) + 64)
+    while True:
+        posiciones = ultima + np.cumsum(rng.geometric(p, size=tam_bloque))
+        if posiciones[-1] >= total:
+            bloques.append(posiciones[posiciones < total])
+            break
+        bloques.append(posiciones)
+        ultima = posiciones[-1]
+        tam_bloque = max(1024, int((total - ultima) * p * 1.05) + 64)
+    t = np.concatenate(bloques)
+    
+    # Invertir t = i*(2n-i-1)/2 + (j-i-1) para recuperar la fila i
+    def inicio_fila(i):
+        return i * (2 * n - i - 1) // 2
+    
+    b = 2 * n - 1
+    i = np.floor((b - np.sqrt(b * b - 8.0 * t)) / 2).astype(np.int64)
+    # Corregir posibles errores de redondeo de la raíz
+    i = np.clip(i, 0, n - 2)
+    i -= inicio_fila(i) > t
+    i += inicio_fila(i + 1) <= t
+    j = t - inicio_fila(i) + i + 1
+    
+    return np.column_stack([i, j])
+
+def generar_costos(n_torres, k_frecuencias, rng):
+    """
+    Matriz de costos con una frecuencia preferida (barata) por torre
+    
+    Misma distribución que crear_problema: U(5, 30) en la preferida,
+    U(30, 100) en el resto.
+    """
+    costos = rng.uniform(30, 100, size=(n_torres, k_frecuencias))
+    preferidas = rng.integers(0, k_frecuencias, size=n_torres)
+    costos[np.arange(n_torres), preferidas] = rng.uniform(5, 30, size=n_torres)
+    return costos
+
+def crear_problema_vectorizado(n_torres, k_frecuencias, densidad=0.3, semilla=None):
+    """
+    Crea problema aleatorio G(n, p) con NumPy, sin bucles sobre pares
+    
+    El tiempo de generación crece con el número de aristas y no con n².
+    
+    Args:
+        n_torres: número de torres
+        k_frecuencias: número de frecuencias disponibles
+        densidad: probabilidad de conexión (0 a 1)
+        semilla: entero, None o numpy.random.Generator
+    """
+    rng = np.random.default_rng(semilla)
+    
+    aristas = generar_aristas_gnp(n_torres, densidad, rng)
+    grafo = GrafoCSR.desde_aristas(n_torres, aristas)
+    costos = generar_costos(n_torres, k_frecuencias, rng)
+    
+    return {
+        'grafo': grafo,
+        'k': k_frecuencias,
+        'costos': costos,
+        'n': n_torres,
+        'densidad': densidad
+    }
+
+def pares_cercanos(coordenadas, radio, usar_kdtree=True):
+    """
+    Encuentra los pares de torres a distancia <= radio
+    
+    Usa un KD-tree de scipy si está disponible; si no, una rejilla uniforme
+    de celdas de lado radio, comparando cada celda solo con sus vecinas.
+    
+    Args:
+        coordenadas: array (n, 2)
+        radio: radio de interferencia
+        usar_kdtree: si False, fuerza la rejilla
+    
+    Returns:
+        array (m, 2) de pares (i, j) con i < j
+    """
+    coordenadas = np.asarray(coordenadas, dtype=float)
+    n = len(coordenadas)
+    if n < 2 or radio <= 0:
+        return np.empty((0, 2), dtype=np.int64)
+    
+    if usar_kdtree and cKDTree is not None:
+        pares = cKDTree(coordenadas).query_pairs(radio, output_type='ndarray')
+        return np.sort(pares, axis=1).astype(np.int64)
+    
+    # Rejilla: ordenar torres por celda para localizar cada celda con searchsorted
+    celdas = np.floor((coordenadas - coordenadas.min(axis=0)) / radio).astype(np.int64)
+    ancho = celdas[:, 0].max() + 3  # margen para los desplazamientos de ±1
+    clave = (celdas[:, 1] + 1) * ancho + (celdas[:, 0] + 1)
+    orden = np.argsort(clave, kind='stable')
+    clave_ordenada = clave[orden]
+    
+    bloques = []
+    # Media vecindad: cada par de celdas adyacentes se visita una sola vez
+    for dx, dy in ((0, 0), (1, 0), (-1, 1), (0, 1), (1, 1)):
+        destino = clave + dy * ancho + dx
+        inicio = np.searchsorted(clave_ordenada, destino, side='left')
+        fin = np.searchsorted(clave_ordenada, destino, side='right')
+        cantidad = fin - inicio
+        
+        # Expandir cada rango [inicio, fin) sin bucles de Python
+        origen = np.repeat(np.arange(n), cantidad)
+        desplazamiento = np.arange(cantidad.sum()) - np.repeat(np.cumsum(cantidad) - cantidad, cantidad)
+        candidato = orden[np.repeat(inicio, cantidad) + desplazamiento]
+        
+        if dx == 0 and dy == 0:
+            mascara = origen < candidato
+            origen, candidato = origen[mascara], candidato[mascara]
+        
+        diferencia = coordenadas[origen] - coordenadas[candidato]
+        cerca = np.einsum('ij,ij->i', diferencia, diferencia) <= radio * radio
+        bloques.append(np.column_stack([origen[cerca], candidato[cerca]]))
+    
+    return np.sort(np.concatenate(bloques), axis=1).astype(np.int64)
+
+def crear_problema_espacial(n_torres, k_frecuencias, radio=0.1, lado=1.0, semilla=None):
+    """
+    Crea problema geográfico: torres en el plano que interfieren por cercanía
+    
+    Args:
+        n_torres: número de torres
+        k_frecuencias: número de frecuencias disponibles
+        radio: distancia máxima a la que dos torres interfieren
+        lado: las torres se colocan uniformemente en [0, lado] x [0, lado]
+        semilla: entero, None o numpy.random.Generator
+    """
+    rng = np.random.default_rng(semilla)
+    
+    coordenadas = rng.uniform(0, lado, size=(n_torres, 2))
+    grafo = GrafoCSR.desde_aristas(n_torres, pares_cercanos(coordenadas, radio))
+    costos = generar_costos(n_torres, k_frecuencias, rng)
+    
+    return {
+        'grafo': grafo,
+        'k': k_frecuencias,
+        'costos': costos,
+        'n': n_torres,
+        'densidad': grafo.densidad(),
+        'coordenadas': coordenadas,
+        'radio': radio
+    }
+
 def crear_problema_especial(tipo='arbol', n_torres=10, k_frecuencias=3, semilla=None):
     """
     Crea problemas especiales para pruebas
@@ -0,0 +1,142 @@
+import math
+import random
+import time
+import numpy as np
+from verificador import verificar_solucion
+from greedy_simple import asignacion_greedy, greedy_con_reintentos, ESTRATEGIAS_REINTENTOS
+from busqueda_tabu import busqueda_tabu
+from recocido_simulado import recocido_simulado
+from presupuesto import Presupuesto
+from paralelo import contexto_procesos, semillas_independientes
+
+# Búsquedas que puede ejecutar cada isla
+METODOS_ISLA = {
+    'tabu_search': busqueda_tabu,
+    'recocido_simulado': recocido_simulado
+}
+
+def _mejor(valida, costo, otra_valida, otro_costo):
+    """True si (valida, costo) es mejor: primero válidas, luego menor costo"""
+    return (valida and not otra_valida) or (valida == otra_valida and costo < otro_costo - 1e-9)
+
+def _isla(indice, problema, metodo, semilla, fin, intervalo, costo_objetivo, elites, costos, validas, parar, opciones):
+    """
+    Proceso de una isla: busca por épocas y migra entre épocas
+    
+    Al terminar cada época publica su mejor solución en su fila de elites
+    y, si la élite de la isla anterior del anillo es mejor que su solución
+    actual, continúa desde ella.
+    """
+    n = problema['n']
+    islas = len(costos)
+    rng = np.random.default_rng(semilla)
+    buscar = METODOS_ISLA[metodo]
+    matriz = np.frombuffer(elites.get_obj(), dtype=np.int32).reshape(islas, n)
+    
+    # Solución inicial distinta en cada isla
+    if indice == 0:
+        actual = greedy_con_reintentos(problema, dsatur=True)
+    else:
+        estrategia = ESTRATEGIAS_REINTENTOS[indice % len(ESTRATEGIAS_REINTENTOS)]
+        actual = asignacion_greedy(problema, estrategia, rng=random.Random(semilla))
+    valida, costo, _ = verificar_solucion(problema, actual)
+    
+    def publicar(asignacion, valida, costo):
+        with elites.get_lock():
+            if _mejor(valida, costo, bool(validas[indice]), costos[indice]):
+                matriz[indice] = asignacion
+                validas[indice] = valida
+                costos[indice] = costo
+    
+    publicar(actual, valida, costo)
+    
+    while not parar.is_set() and time.time() < fin:
+        presupuesto = Presupuesto(tiempo_limite=min(intervalo, fin - time.time()), cancelacion=parar)
+        actual, _, _ = buscar(problema, actual, costo, None, semilla=int(rng.integers(2**62)),
+                              presupuesto=presupuesto, **opciones)
+        valida, costo, _ = verificar_solucion(problema, actual)
+        publicar(actual, valida, costo)
+        
+        if valida and costo_objetivo is not None and costo <= costo_objetivo:
+            parar.set()
+            break
+        
+        # Migración: adoptar la élite de la isla anterior si es mejor
+        anterior = (indice - 1) % islas
+        with elites.get_lock():
+            valida_elite = bool(validas[anterior])
+            costo_elite = costos[anterior]
+            if _mejor(valida_elite, costo_elite, valida, costo):
+                actual = matriz[anterior].tolist()
+                valida, costo = valida_elite, costo_elite
+
+def modelo_islas(problema, islas=4, metodo='tabu_search', tiempo_limite=10.0, intervalo_migracion=1.0,
+                 costo_objetivo=None, semilla=None, **opciones):
+    """
+    Modelo de islas: varias búsquedas en procesos separados que migran élites
+    
+    Cada isla arranca de una solución greedy distinta (la isla 0 de
+    greedy_con_reintentos, las demás de una estrategia cada una) y ejecuta
+    su búsqueda por épocas de intervalo_migracion segundos. Entre épocas
+    publica su mejor solución en memoria compartida y adopta la de la isla
+    anterior del anillo si es mejor. Leer y escribir las élites no bloquea
+    a ninguna isla más allá de una copia de n enteros.
+    
+    Args:
+        problema: diccionario con el problema
+        islas: número de islas (procesos)
+        metodo: 'tabu_search', 'recocido_simulado' o una lista con el
+                método de cada isla (se repite si es más corta)
+        tiempo_limite: plazo global en segundos
+        intervalo_migracion: segundos entre migraciones
+        costo_objetivo: detener todas las islas al alcanzar este costo
+        semilla: semilla para reproducibilidad de los flujos aleatorios
+        opciones: parámetros adicionales de la búsqueda de cada isla
+    
+    Returns:
+        mejor_asignacion, mejor_costo, info
+    """
+    contexto = contexto_procesos()
+    n = problema['n']
+    metodos = metodo if isinstance(metodo, (list, tuple)) else [metodo]
+    
+    elites = contexto.Array('i', islas * n)
+    costos = contexto.Array('d', [math.inf] * islas, lock=False)
+    validas = contexto.Array('b', islas, lock=False)
+    parar = contexto.Event()
+    
+    fin = time.time() + tiempo_limite
+    semillas = semillas_independientes(semilla, islas)
+    procesos = [contexto.Process(target=_isla, daemon=True,
+                                 args=(i, problema, metodos[i % len(metodos)], semillas[i], fin,
+                                       intervalo_migracion, costo_objetivo, elites, costos, validas,
+                                       parar, opciones))
+                for i in range(islas)]
+    for proceso in procesos:
+        proceso.start()
+    
+    # Esperar al plazo; después se da un margen para cerrar la época en curso
+    for proceso in procesos:
+        proceso.join(max(0.0, fin - time.time()) + 1.0)
+    parar.set()
+    for proceso in procesos:
+        proceso.join(1.0)
+        if proceso.is_alive():
+            proceso.terminate()
+            proceso.join()
+    
+    matriz = np.frombuffer(elites.get_obj(), dtype=np.int32).reshape(islas, n)
+    mejor = None
+    for i in range(islas):
+        if costos[i] < math.inf and (mejor is None or _mejor(bool(validas[i]), costos[i],
+                                                             bool(validas[mejor]), costos[mejor])):
+            mejor = i
+    
+    if mejor is None:
+        # Ninguna isla llegó a publicar (plazo menor que el greedy inicial)
+        solucion = greedy_con_reintentos(problema)
+        valida, costo, _ = verificar_solucion(problema, solucion)
+        return solucion, costo, "Modelo de islas: sin resultados de las islas, greedy"
+    
+    resumen = ", ".join(f"{costos[i]:.2f}{'' if validas[i] else '*'}" for i in range(islas))
+    return matriz[mejor].tolist(), float(costos[mejor]), f"Modelo de islas ({islas}): élites [{resumen}]"
\ No newline at end of file
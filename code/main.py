@@ -8,6 +8,7 @@ from verificador import verificar_solucion
 from greedy_simple import asignacion_greedy, greedy_con_reintentos
 from busqueda_local import mejorar_solucion, mejorar_solucion_con_reinicio
 from analizador import analizar_solucion, comparar_soluciones
+from descomposicion import resolver_por_componentes
 from visualizador import dibujar_solucion, visualizar_evolucion
 
 def ejecutar_varios_experimentos():
@@ -199,7 +200,8 @@ def ejecutar_varios_experimentos():
 
 def resolver_problema_completo(n_torres=15, k_frecuencias=4, densidad=0.3, 
                                estrategia_greedy='mixto', metodo_busqueda='hill_climbing_con_conflictos',
-                               max_iteraciones=500, visualizar=True, semilla=None):
+                               max_iteraciones=500, visualizar=True, semilla=None, problema=None,
+                               descomponer=False, procesos=None):
     """
     Función principal mejorada: crea problema y encuentra solución
     
@@ -207,11 +209,18 @@ def resolver_problema_completo(n_torres=15, k_frecuencias=4, densidad=0.3,
         n_torres: número de torres
         k_frecuencias: número de frecuencias
         densidad: densidad del grafo (0 a 1)
-        estrategia_greedy: 'grado', 'costo', 'mixto', 'aleatorio'
-        metodo_busqueda: 'hill_climbing', 'tabu_search', 'hill_climbing_con_conflictos'
+        estrategia_greedy: 'grado', 'costo', 'mixto', 'aleatorio', 'dsatur'
+        metodo_busqueda: 'hill_climbing', 'tabu_search', 'hill_climbing_con_conflictos',
+                         'recocido_simulado', 'kempe'
         max_iteraciones: máximo de iteraciones para búsqueda local
         visualizar: si True, genera visualización
         semilla: semilla para reproducibilidad
+        problema: problema ya construido (p. ej. con cargador.cargar_problema);
+                  si se da, se ignoran n_torres, k_frecuencias y densidad
+        descomponer: si True, la búsqueda resuelve cada componente conexa
+                     por separado
+        procesos: con descomponer, tamaño del pool de procesos (None = en
+                  serie, 0 = todos los núcleos)
     """
     print("="*70)
     print("RESOLVIENDO PROBLEMA DE ASIGNACIÓN DE FRECUENCIAS (MEJORADO)")
@@ -221,10 +230,17 @@ def resolver_problema_completo(n_torres=15, k_frecuencias=4, densidad=0.3,
     print("\n1. CREANDO PROBLEMA...")
     print("-"*40)
     
-    if semilla is not None:
-        print(f"   Usando semilla: {semilla}")
-    
-    problema = crear_problema(n_torres, k_frecuencias, densidad, semilla)
+    if problema is not None:
+        n_torres = problema['n']
+        k_frecuencias = problema['k']
+        densidad = problema.get('densidad', problema['grafo'].densidad())
+        if 'origen' in problema:
+            print(f"   Cargado de: {problema['origen']}")
+    else:
+        if semilla is not None:
+            print(f"   Usando semilla: {semilla}")
+        
+        problema = crear_problema(n_torres, k_frecuencias, densidad, semilla)
     
     print(f"   - {n_torres} torres, {k_frecuencias} frecuencias")
     print(f"   - Interferencias: {problema['grafo'].numero_interferencias()}")
@@ -262,8 +278,15 @@ def resolver_problema_completo(n_torres=15, k_frecuencias=4, densidad=0.3,
     
     inicio = time.time()
     
+    if descomponer:
+        # Cada componente conexa por separado, en serie o en un pool de procesos
+        opciones = {'semilla': semilla} if metodo_busqueda == 'recocido_simulado' else {}
+        solucion_mejorada, costo_mejorado, info = resolver_por_componentes(
+            problema, metodo=metodo_busqueda, max_iter=max_iteraciones, procesos=procesos,
+            asignacion_inicial=solucion_inicial, **opciones
+        )
     # Siempre usar hill_climbing_con_conflictos si está disponible (más robusto)
-    if metodo_busqueda == 'hill_climbing_con_conflictos':
+    elif metodo_busqueda == 'hill_climbing_con_conflictos':
         try:
             # Usar hill climbing mejorado que permite conflictos controlados
             solucion_mejorada, costo_mejorado, info = hill_climbing_con_conflictos(
@@ -283,6 +306,20 @@ def resolver_problema_completo(n_torres=15, k_frecuencias=4, densidad=0.3,
             max_iter=max_iteraciones, 
             metodo='tabu_search'
         )
+    elif metodo_busqueda == 'recocido_simulado':
+        # max_iteraciones se interpreta como barridos de n movimientos
+        solucion_mejorada, costo_mejorado, info = mejorar_solucion(
+            problema, solucion_inicial, 
+            max_iter=max_iteraciones, 
+            metodo='recocido_simulado',
+            semilla=semilla
+        )
+    elif metodo_busqueda == 'kempe':
+        solucion_mejorada, costo_mejorado, info = mejorar_solucion(
+            problema, solucion_inicial, 
+            max_iter=max_iteraciones, 
+            metodo='kempe'
+        )
     else:
         # Por defecto, usar hill climbing con conflictos
         try:
@@ -334,6 +371,9 @@ def resolver_problema_completo(n_torres=15, k_frecuencias=4, densidad=0.3,
     print(f"   - Costo promedio por torre: {analisis['costo_promedio']:.2f}")
     print(f"   - Eficiencia: {analisis['eficiencia_porcentaje']:.1f}% de torres con frecuencia óptima")
     print(f"   - Balance de carga: {analisis['balance_carga_porcentaje']:.1f}%")
+    if analisis['gap_optimalidad_porcentaje'] is not None:
+        print(f"   - Gap de optimalidad: {analisis['gap_optimalidad_porcentaje']:.2f}% "
+              f"(cota inferior {analisis['cota_inferior']:.2f})")
     
     # Mostrar las torres más caras
     if analisis['torres_mas_caras']:
@@ -396,7 +436,9 @@ def resolver_problema_completo(n_torres=15, k_frecuencias=4, densidad=0.3,
             'estrategia_greedy': estrategia_greedy,
             'metodo_busqueda': metodo_busqueda,
             'max_iteraciones': max_iteraciones,
-            'semilla': semilla
+            'semilla': semilla,
+            'descomponer': descomponer,
+            'procesos': procesos
         },
         'resultados': {
             'costo_inicial': float(costo_inicial),
@@ -412,7 +454,9 @@ def resolver_problema_completo(n_torres=15, k_frecuencias=4, densidad=0.3,
             'frecuencias_utilizadas': analisis['frecuencias_utilizadas'],
             'costo_promedio': float(analisis['costo_promedio']),
             'eficiencia_porcentaje': float(analisis['eficiencia_porcentaje']),
-            'balance_carga_porcentaje': float(analisis['balance_carga_porcentaje'])
+            'balance_carga_porcentaje': float(analisis['balance_carga_porcentaje']),
+            'cota_inferior': float(analisis['cota_inferior']),
+            'gap_optimalidad_porcentaje': analisis['gap_optimalidad_porcentaje']
         }
     }
     
@@ -526,9 +570,10 @@ def menu_interactivo():
     print("    1. Hill Climbing mejorado (permite conflictos temporales) [RECOMENDADO]")
     print("    2. Tabu Search (más lento, evita óptimos locales)")
     print("    3. Hill Climbing estándar (rápido, pero limitado)")
+    print("    4. Recocido simulado (estocástico, escapa de óptimos locales)")
     
     while True:
-        opcion = input("  Seleccione opción (1-3) [1]: ").strip()
+        opcion = input("  Seleccione opción (1-4) [1]: ").strip()
         if opcion == "":
             metodo = 'hill_climbing_con_conflictos'
             break
@@ -541,6 +586,9 @@ def menu_interactivo():
         elif opcion == "3":
             metodo = 'hill_climbing'
             break
+        elif opcion == "4":
+            metodo = 'recocido_simulado'
+            break
         else:
             print("  Error: opción no válida")
     
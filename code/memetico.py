@@ -0,0 +1,184 @@
+import time
+import numpy as np
+from verificador import verificar_lote
+from greedy_simple import greedy_por_lotes
+from busqueda_local import mejorar_solucion
+from busqueda_tabu import busqueda_tabu
+from recocido_simulado import recocido_simulado
+
+# Búsquedas penalizadas: mejoran los hijos aunque el cruce deje conflictos
+METODOS_PENALIZADOS = {
+    'tabu_search': busqueda_tabu,
+    'recocido_simulado': recocido_simulado
+}
+
+def cruce_gpx(padres_a, padres_b, costos, rng):
+    """
+    Cruce GPX por clases de frecuencia, para C parejas a la vez
+    
+    Cada hijo hereda clases completas alternando padre: en el paso s se toma
+    del padre de turno la frecuencia (aún no usada por el hijo) cuya clase
+    tiene más torres sin asignar, y esas torres reciben esa frecuencia. Se
+    conservan las etiquetas de frecuencia, porque aquí cada frecuencia tiene
+    un costo distinto en cada torre. Las torres que quedan sin asignar
+    toman la frecuencia más barata de entre las de sus dos padres.
+    
+    Args:
+        padres_a, padres_b: matrices (C, n) con las asignaciones de los padres
+        costos: matriz (n, k) de costos
+        rng: numpy.random.Generator (elige qué padre empieza en cada pareja)
+    
+    Returns:
+        matriz (C, n) con los hijos
+    """
+    c, n = padres_a.shape
+    k = costos.shape[1]
+    filas = np.arange(c)
+    hijos = np.full((c, n), -1, dtype=np.int64)
+    usadas = np.zeros((c, k), dtype=bool)
+    empieza_b = rng.random(c) < 0.5
+    
+    for paso in range(k):
+        turno_b = empieza_b ^ (paso % 2 == 1)
+        padre = np.where(turno_b[:, None], padres_b, padres_a)
+        libres = hijos < 0
+        
+        # Torres sin asignar por (hijo, frecuencia) en la clase del padre de turno
+        tamanos = np.bincount((filas[:, None] * k + padre)[libres], minlength=c * k).reshape(c, k)
+        tamanos[usadas] = -1
+        elegidas = tamanos.argmax(axis=1)
+        usadas[filas, elegidas] = True
+        
+        heredan = libres & (padre == elegidas[:, None])
+        hijos[heredan] = padre[heredan]
+    
+    # Restantes: la frecuencia más barata de entre las de los padres
+    libres = hijos < 0
+    torres = np.broadcast_to(np.arange(n), (c, n))
+    mas_barata = np.where(costos[torres, padres_a] <= costos[torres, padres_b], padres_a, padres_b)
+    hijos[libres] = mas_barata[libres]
+    return hijos
+
+def distancias_hamming(soluciones, poblacion, bloque=10**7):
+    """
+    Distancias de Hamming entre cada solución y cada miembro de la población
+    
+    Args:
+        soluciones: matriz (C, n)
+        poblacion: matriz (P, n)
+        bloque: máximo de comparaciones por paso (limita memoria)
+    
+    Returns:
+        matriz (C, P) con el número de torres con distinta frecuencia
+    """
+    c, n = soluciones.shape
+    distancias = np.empty((c, len(poblacion)), dtype=np.int64)
+    filas_por_paso = max(1, bloque // max(1, len(poblacion) * n))
+    for inicio in range(0, c, filas_por_paso):
+        parte = soluciones[inicio:inicio + filas_por_paso]
+        distancias[inicio:inicio + filas_por_paso] = (parte[:, None, :] != poblacion[None, :, :]).sum(axis=2)
+    return distancias
+
+def algoritmo_memetico(problema, poblacion=20, generaciones=50, hijos_por_generacion=None, iter_busqueda=200,
+                       metodo_busqueda='tabu_search', distancia_minima=None, tiempo_limite=None, semilla=None):
+    """
+    Algoritmo memético: cruce GPX + búsqueda local corta sobre cada hijo
+    
+    La población es una matriz P x n. En cada generación se eligen parejas
+    por torneo binario, se cruzan todas a la vez (cruce_gpx), cada hijo se
+    mejora con una búsqueda local y los hijos se evalúan juntos con
+    verificar_lote. La aptitud se compara lexicográficamente: primero el
+    número de conflictos y luego el costo, porque ningún peso fijo por
+    conflicto compensa el ahorro de una solución entera más barata. Un hijo
+    sustituye al peor miembro si es más apto y no está a menos de
+    distancia_minima torres de ningún miembro, lo que mantiene la
+    diversidad.
+    
+    Args:
+        problema: diccionario con el problema
+        poblacion: tamaño P de la población
+        generaciones: número máximo de generaciones
+        hijos_por_generacion: hijos por generación (None = P / 2)
+        iter_busqueda: iteraciones de la búsqueda local de cada hijo
+        metodo_busqueda: 'tabu_search' o 'recocido_simulado' (se llaman
+                         directamente, partiendo del hijo con sus
+                         conflictos), o cualquier otro método de
+                         mejorar_solucion
+        distancia_minima: distancia de Hamming mínima a la población para
+                          entrar (None = 1% de las torres, al menos 1)
+        tiempo_limite: segundos máximos (se comprueba entre hijos)
+        semilla: entero, None o numpy.random.Generator
+    
+    Returns:
+        mejor_asignacion, mejor_costo, info (la mejor sin conflictos si hay
+        alguna en la población; si no, la de menos conflictos)
+    """
+    inicio = time.time()
+    n = problema['n']
+    costos = np.asarray(problema['costos'])
+    rng = np.random.default_rng(semilla)
+    if hijos_por_generacion is None:
+        hijos_por_generacion = max(1, poblacion // 2)
+    if distancia_minima is None:
+        distancia_minima = max(1, n // 100)
+    
+    def agotado():
+        return tiempo_limite is not None and time.time() - inicio >= tiempo_limite
+    
+    def mejorar(asignaciones):
+        mejoradas = asignaciones.copy()
+        for i in range(len(asignaciones)):
+            if agotado():
+                break
+            if metodo_busqueda in METODOS_PENALIZADOS:
+                costo = float(costos[np.arange(n), asignaciones[i]].sum())
+                solucion, _, _ = METODOS_PENALIZADOS[metodo_busqueda](
+                    problema, asignaciones[i].tolist(), costo, iter_busqueda, semilla=int(rng.integers(2**62)))
+            else:
+                solucion, _, _ = mejorar_solucion(problema, asignaciones[i].tolist(), max_iter=iter_busqueda,
+                                                  metodo=metodo_busqueda)
+            mejoradas[i] = solucion
+        return mejoradas
+    
+    # Población inicial: greedy aleatorizado por lotes + búsqueda local
+    _, estadisticas = greedy_por_lotes(problema, poblacion, semilla=rng)
+    individuos = mejorar(estadisticas['asignaciones'])
+    validas, costos_totales, conflictos = verificar_lote(problema, individuos)
+    
+    completadas = 0
+    aceptados = 0
+    for generacion in range(generaciones):
+        if agotado():
+            break
+        completadas += 1
+        
+        # Torneo binario para cada padre
+        candidatos = rng.integers(0, poblacion, (2, hijos_por_generacion, 2))
+        a, b = candidatos[..., 0], candidatos[..., 1]
+        gana_a = (conflictos[a] < conflictos[b]) | ((conflictos[a] == conflictos[b]) &
+                                                    (costos_totales[a] <= costos_totales[b]))
+        ganadores = np.where(gana_a, a, b)
+        
+        hijos = mejorar(cruce_gpx(individuos[ganadores[0]], individuos[ganadores[1]], costos, rng))
+        validas_h, costos_h, conflictos_h = verificar_lote(problema, hijos)
+        cercania = distancias_hamming(hijos, individuos).min(axis=1)
+        
+        # Reemplazo del peor, de mejor a peor hijo
+        for h in np.lexsort((costos_h, conflictos_h)).tolist():
+            peor = int(np.lexsort((costos_totales, conflictos))[-1])
+            if (conflictos_h[h], costos_h[h]) >= (conflictos[peor], costos_totales[peor]) \
+                    or cercania[h] < distancia_minima:
+                continue
+            individuos[peor] = hijos[h]
+            validas[peor], costos_totales[peor] = validas_h[h], costos_h[h]
+            conflictos[peor] = conflictos_h[h]
+            aceptados += 1
+            # Los hijos siguientes no deben ser clones del que acaba de entrar
+            cercania = np.minimum(cercania, (hijos != hijos[h]).sum(axis=1))
+    
+    # PRIORIDAD 1: Soluciones válidas (sin conflictos), luego por costo
+    mejor = int(np.lexsort((costos_totales, conflictos))[0])
+    diversidad = distancias_hamming(individuos, individuos).sum() / max(1, poblacion * (poblacion - 1))
+    info = (f"Memético: {completadas} generaciones, {aceptados} hijos aceptados, "
+            f"diversidad media {diversidad:.1f} torres")
+    return individuos[mejor].tolist(), float(costos_totales[mejor]), info
\ No newline at end of file
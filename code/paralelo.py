@@ -0,0 +1,96 @@
+import os
+import multiprocessing
+from contextlib import contextmanager
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+
+# Problema visible para las tareas que se ejecutan en los procesos trabajadores
+_PROBLEMA = None
+# Evento compartido para pedir a las tareas en curso que terminen antes
+_CANCELACION = None
+
+def _inicializar_trabajador(referencia, cancelacion=None):
+    """Deja el problema en _PROBLEMA dentro de cada proceso trabajador"""
+    global _PROBLEMA, _CANCELACION
+    _CANCELACION = cancelacion
+    if referencia is None:
+        return  # Heredado del proceso padre con fork, sin copiar
+    if isinstance(referencia, str):
+        from cargador import cargar_binario
+        _PROBLEMA = cargar_binario(referencia)
+    else:
+        _PROBLEMA = referencia
+
+def problema_compartido():
+    """Problema de solo lectura del pool actual (usar dentro de las tareas)"""
+    return _PROBLEMA
+
+def cancelacion_compartida():
+    """Evento de cancelación del pool actual (None si el pool no tiene)"""
+    return _CANCELACION
+
+def numero_procesos(procesos=None):
+    """Número de procesos a usar: el indicado o todos los núcleos"""
+    if procesos is None or procesos <= 0:
+        return os.cpu_count() or 1
+    return procesos
+
+def contexto_procesos():
+    """Contexto de multiprocessing: 'fork' si está disponible"""
+    if 'fork' in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context('fork')
+    return multiprocessing.get_context()
+
+def crear_cancelacion():
+    """Evento para cancelar tareas en curso, compatible con crear_pool"""
+    return contexto_procesos().Event()
+
+@contextmanager
+def crear_pool(problema, procesos=None, cancelacion=None):
+    """
+    Crea un pool de procesos que comparten una única copia del problema
+    
+    Con 'fork' los trabajadores heredan el problema del padre (copy-on-write,
+    sin serializar nada). En otras plataformas se reabre desde disco si el
+    problema viene de cargar_binario, o se envía una vez por trabajador.
+    Se usa como contexto (with crear_pool(...) as pool); al salir se cierra
+    el pool y el padre deja de retener el problema en _PROBLEMA.
+    
+    Args:
+        problema: diccionario del problema
+        procesos: número de procesos (None = todos los núcleos)
+        cancelacion: evento de crear_cancelacion(); las tareas lo ven con
+                     cancelacion_compartida() y pueden terminar al activarse
+    
+    Returns:
+        contexto que da un concurrent.futures.ProcessPoolExecutor
+    """
+    global _PROBLEMA
+    anterior = _PROBLEMA
+    # La copia CSR en caché se construye antes de repartir el problema: así
+    # los trabajadores la heredan en lugar de rehacerla cada uno
+    problema['grafo'].a_csr()
+    if 'fork' in multiprocessing.get_all_start_methods():
+        _PROBLEMA = problema
+        contexto = multiprocessing.get_context('fork')
+        referencia = None
+    else:
+        contexto = None
+        referencia = problema.get('ruta_binaria', problema)
+    
+    try:
+        with ProcessPoolExecutor(max_workers=numero_procesos(procesos), mp_context=contexto,
+                                 initializer=_inicializar_trabajador, initargs=(referencia, cancelacion)) as pool:
+            yield pool
+    finally:
+        _PROBLEMA = anterior
+
+def semillas_independientes(semilla, cantidad):
+    """
+    Semillas enteras para flujos aleatorios independientes (una por tarea)
+    
+    Se derivan con numpy.random.SeedSequence, así que no se solapan entre sí
+    y son reproducibles a partir de una sola semilla.
+    """
+    hijas = np.random.SeedSequence(semilla).spawn(cantidad)
+    return [int(h.generate_state(1)[0]) for h in hijas]
\ No newline at end of file
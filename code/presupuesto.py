@@ -0,0 +1,95 @@
+import itertools
+import math
+import time
+
+class Presupuesto:
+    """
+    Criterios de parada comunes a las búsquedas (uso anytime)
+    
+    Una búsqueda que recibe un presupuesto consulta agotado() en cada
+    iteración y avisa con registrar() cada vez que encuentra una solución
+    válida; al agotarse devuelve la mejor solución que tenga. El mismo
+    presupuesto puede pasarse a búsquedas anidadas (p. ej. los reinicios):
+    el reloj empieza en la primera llamada a iniciar() y el mejor costo es
+    el global.
+    
+    Args:
+        tiempo_limite: segundos de reloj desde iniciar()
+        limite_estancamiento: segundos sin mejorar el mejor costo
+        costo_objetivo: detener al alcanzar un costo menor o igual
+        al_mejorar: función al_mejorar(asignacion, costo) llamada en cada
+                    mejora del mejor costo global
+        cancelacion: evento (threading o multiprocessing) que, al activarse
+                     desde fuera, agota el presupuesto
+    """
+    def __init__(self, tiempo_limite=None, limite_estancamiento=None, costo_objetivo=None, al_mejorar=None,
+                 cancelacion=None):
+        self.tiempo_limite = tiempo_limite
+        self.limite_estancamiento = limite_estancamiento
+        self.costo_objetivo = costo_objetivo
+        self.al_mejorar = al_mejorar
+        self.cancelacion = cancelacion
+        
+        self.inicio = None
+        self.ultima_mejora = None
+        self.mejor_costo = math.inf
+        self.mejoras = 0
+    
+    def iniciar(self):
+        """Arranca el reloj (solo la primera vez) y devuelve el propio presupuesto"""
+        if self.inicio is None:
+            self.inicio = time.time()
+            self.ultima_mejora = self.inicio
+        return self
+    
+    def transcurrido(self):
+        """Segundos desde iniciar()"""
+        return time.time() - self.iniciar().inicio
+    
+    def tiempo_restante(self):
+        """Segundos hasta el tiempo límite (None si no hay límite)"""
+        if self.tiempo_limite is None:
+            return None
+        return max(0.0, self.tiempo_limite - self.transcurrido())
+    
+    def agotado(self):
+        """True si se cumplió algún criterio de parada"""
+        self.iniciar()
+        if self.costo_objetivo is not None and self.mejor_costo <= self.costo_objetivo:
+            return True
+        if self.cancelacion is not None and self.cancelacion.is_set():
+            return True
+        if self.tiempo_limite is None and self.limite_estancamiento is None:
+            return False
+        ahora = time.time()
+        if self.tiempo_limite is not None and ahora - self.inicio >= self.tiempo_limite:
+            return True
+        if self.limite_estancamiento is not None and ahora - self.ultima_mejora >= self.limite_estancamiento:
+            return True
+        return False
+    
+    def registrar(self, costo, asignacion):
+        """
+        Informa de una solución válida encontrada por la búsqueda
+        
+        Args:
+            costo: costo de la solución
+            asignacion: función sin argumentos que devuelve la asignación
+                        (solo se llama si hay callback y el costo mejora)
+        
+        Returns:
+            True si mejora el mejor costo global
+        """
+        self.iniciar()
+        if not costo < self.mejor_costo - 1e-9:
+            return False
+        self.mejor_costo = costo
+        self.ultima_mejora = time.time()
+        self.mejoras += 1
+        if self.al_mejorar is not None:
+            self.al_mejorar(asignacion(), costo)
+        return True
+
+def iteraciones(max_iter):
+    """range(max_iter), o un contador sin fin si max_iter es None"""
+    return itertools.count() if max_iter is None else range(max_iter)
\ No newline at end of file
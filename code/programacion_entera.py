@@ -0,0 +1,195 @@
+import time
+import numpy as np
+from verificador import verificar_solucion
+from greedy_simple import greedy_con_reintentos
+from busqueda_local import mejorar_solucion
+from recocido_simulado import recocido_simulado
+from tabla_conflictos import peso_conflicto_por_defecto
+
+try:
+    from scipy import sparse
+    from scipy.optimize import milp, LinearConstraint, Bounds
+except ImportError:  # scipy es opcional: sin él no hay formulación entera
+    milp = None
+
+def formular_milp(problema, cota_superior=None):
+    """
+    Programa entero binario del problema
+    
+    Variables x[i, f] (índice i * k + f), 1 si la torre i usa la frecuencia
+    f. Restricciones:
+      - una frecuencia por torre: sum_f x[i, f] = 1
+      - un conflicto por arista y frecuencia: x[u, f] + x[v, f] <= 1
+      - opcionalmente, costo total <= cota_superior
+    Las matrices se construyen directamente en formato disperso a partir de
+    las aristas, sin bucles por fila.
+    
+    Args:
+        problema: diccionario con el problema
+        cota_superior: costo de una solución conocida (None = sin corte)
+    
+    Returns:
+        (c, restricciones, integralidad, cotas) listos para scipy.optimize.milp
+    """
+    n = problema['n']
+    k = problema['k']
+    c = np.asarray(problema['costos'], dtype=float).reshape(n * k)
+    aristas = problema['grafo'].aristas()
+    m = len(aristas)
+    
+    # Una frecuencia por torre: la fila i tiene unos en las columnas i*k .. i*k + k-1
+    una_por_torre = sparse.csr_array(
+        (np.ones(n * k), (np.repeat(np.arange(n), k), np.arange(n * k))), shape=(n, n * k)
+    )
+    restricciones = [LinearConstraint(una_por_torre, 1, 1)]
+    
+    if m > 0:
+        # Fila e*k + f: x[u, f] + x[v, f] <= 1 para la arista e = (u, v)
+        filas = np.repeat(np.arange(m * k), 2)
+        frecuencias = np.tile(np.arange(k), m)
+        columnas = np.column_stack([
+            np.repeat(aristas[:, 0], k) * k + frecuencias,
+            np.repeat(aristas[:, 1], k) * k + frecuencias
+        ]).reshape(-1)
+        conflictos = sparse.csr_array((np.ones(2 * m * k), (filas, columnas)), shape=(m * k, n * k))
+        restricciones.append(LinearConstraint(conflictos, -np.inf, 1))
+    
+    if cota_superior is not None:
+        restricciones.append(LinearConstraint(c.reshape(1, -1), -np.inf, cota_superior + 1e-6))
+    
+    return c, restricciones, np.ones(n * k), Bounds(0, 1)
+
+# Recocidos, con penalización creciente, para dar con una solución válida
+INTENTOS_RECOCIDO = 3
+# Tope de barridos del recocido por defecto (10^7 / (n * k) si es menor)
+MAX_BARRIDOS_RECOCIDO = 1000
+
+def solucion_heuristica(problema, iter_recocido=None, tiempo_limite=None):
+    """
+    Mejor solución válida entre el greedy pulido con Kempe y un recocido
+    
+    En instancias densas greedy_con_reintentos suele quedar con conflictos
+    aun tras las cadenas de Kempe; el recocido sobre el objetivo penalizado,
+    desde el mismo greedy, las arregla y además baja el costo. Si acaba con
+    conflictos se repite desde su resultado con el doble de penalización
+    por conflicto (hasta INTENTOS_RECOCIDO veces).
+    
+    Args:
+        problema: diccionario con el problema
+        iter_recocido: barridos del recocido (None = 10^7 / (n * k), hasta
+                       MAX_BARRIDOS_RECOCIDO; 0 = sin recocido)
+        tiempo_limite: segundos máximos del recocido (entre todos los intentos)
+    
+    Returns:
+        (asignacion, costo, valida) de la mejor candidata
+    """
+    n = problema['n']
+    k = problema['k']
+    greedy = greedy_con_reintentos(problema, dsatur=True)
+    candidatas = [mejorar_solucion(problema, greedy, metodo='kempe')[0]]
+    if iter_recocido is None:
+        iter_recocido = min(MAX_BARRIDOS_RECOCIDO, max(1, 10**7 // max(n * k, 1)))
+    inicio = time.time()
+    peso = peso_conflicto_por_defecto(np.asarray(problema['costos'], dtype=float)) if n > 0 else None
+    inicial = greedy
+    for intento in range(INTENTOS_RECOCIDO if iter_recocido > 0 and n > 0 else 0):
+        limite = None
+        if tiempo_limite is not None:
+            limite = tiempo_limite - (time.time() - inicio)
+            if limite <= 0:
+                break
+        inicial = recocido_simulado(problema, inicial, 0.0, iter_recocido, tiempo_limite=limite,
+                                    peso_conflicto=peso, semilla=intento)[0]
+        candidatas.append(inicial)
+        if verificar_solucion(problema, inicial)[0]:
+            break
+        peso *= 2
+    
+    mejor = None
+    for candidata in candidatas:
+        valida, costo, _ = verificar_solucion(problema, candidata)
+        if mejor is None or (valida, -costo) > (mejor[2], -mejor[1]):
+            mejor = (candidata, float(costo), valida)
+    return mejor
+
+def resolver_milp(problema, tiempo_limite=None, gap_relativo=None, usar_greedy=True, mostrar=False,
+                  iter_recocido=None):
+    """
+    Resuelve el problema como programa entero con HiGHS (scipy.optimize.milp)
+    
+    milp no admite una solución inicial, así que la de solucion_heuristica
+    (greedy pulido con Kempe o recocido, la mejor válida) se usa de dos
+    formas: su costo corta el espacio de búsqueda (restricción costo <=
+    cota) y se devuelve ella si es mejor que lo que HiGHS encontró dentro
+    del plazo.
+    
+    Args:
+        problema: diccionario con el problema
+        tiempo_limite: segundos máximos en total; el recocido usa como mucho
+                       la cuarta parte y HiGHS el resto (None = sin límite)
+        gap_relativo: gap relativo con el que HiGHS puede parar (None = el
+                      de HiGHS, prácticamente óptimo)
+        usar_greedy: usar la solución heurística como cota superior
+        mostrar: mostrar el registro de HiGHS
+        iter_recocido: barridos del recocido (ver solucion_heuristica)
+    
+    Returns:
+        mejor_asignacion, mejor_costo, info con 'estado', 'demostrado'
+        (óptimo dentro de la tolerancia o problema sin solución válida),
+        'factible', 'gap', 'cota_inferior' y 'tiempo'
+    """
+    if milp is None:
+        raise ImportError("resolver_milp necesita scipy (scipy.optimize.milp)")
+    
+    inicio = time.time()
+    n = problema['n']
+    k = problema['k']
+    if n == 0:
+        # milp no admite un programa sin variables; la asignación vacía es óptima
+        return [], 0.0, {
+            'estado': 'Instancia vacía',
+            'demostrado': True,
+            'factible': True,
+            'gap': 0.0,
+            'cota_inferior': 0.0,
+            'tiempo': time.time() - inicio
+        }
+    
+    limite = None if tiempo_limite is None else tiempo_limite / 4
+    heuristica, costo_heuristica, valida_heuristica = solucion_heuristica(problema, iter_recocido, limite)
+    cota = costo_heuristica if usar_greedy and valida_heuristica else None
+    
+    c, restricciones, integralidad, cotas = formular_milp(problema, cota)
+    opciones = {'disp': mostrar}
+    if tiempo_limite is not None:
+        opciones['time_limit'] = max(tiempo_limite - (time.time() - inicio), 0.0)
+    if gap_relativo is not None:
+        opciones['mip_rel_gap'] = gap_relativo
+    resultado = milp(c, integrality=integralidad, bounds=cotas, constraints=restricciones, options=opciones)
+    
+    # La mejor entre la incumbente de HiGHS y la heurística
+    asignacion, costo, valida = heuristica, costo_heuristica, valida_heuristica
+    if resultado.x is not None:
+        candidata = resultado.x.reshape(n, k).argmax(axis=1).tolist()
+        valida_milp, costo_milp, _ = verificar_solucion(problema, candidata)
+        if (valida_milp, -costo_milp) > (valida, -costo):
+            asignacion, costo, valida = candidata, costo_milp, valida_milp
+    
+    cota_inferior = getattr(resultado, 'mip_dual_bound', None)
+    gap = getattr(resultado, 'mip_gap', None)
+    demostrado = resultado.status == 0
+    if resultado.status == 2:
+        # La heurística cumple su propio corte: solo sin corte "infactible"
+        # significa que el problema no tiene solución válida
+        demostrado = cota is None
+        cota_inferior = np.inf if demostrado else None
+        gap = None
+    
+    return asignacion, float(costo), {
+        'estado': resultado.message,
+        'demostrado': demostrado,
+        'factible': bool(valida),
+        'gap': gap,
+        'cota_inferior': cota_inferior,
+        'tiempo': time.time() - inicio
+    }
\ No newline at end of file
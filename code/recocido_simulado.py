@@ -0,0 +1,195 @@
+import math
+import time
+import numpy as np
+from tabla_conflictos import TablaConflictos, peso_conflicto_por_defecto
+
+def _geometrico(t0, tf, x):
+    return t0 * (tf / t0) ** x
+
+def _lineal(t0, tf, x):
+    return t0 + (tf - t0) * x
+
+def _coseno(t0, tf, x):
+    return tf + (t0 - tf) * (1 + math.cos(math.pi * x)) / 2
+
+# Esquemas de enfriamiento: temperatura en función del progreso x en [0, 1]
+ESQUEMAS_ENFRIAMIENTO = {
+    'geometrico': _geometrico,
+    'lineal': _lineal,
+    'coseno': _coseno
+}
+
+# Máximo de movimientos entre dos consultas del reloj o del presupuesto
+BLOQUE_CON_RELOJ = 4096
+
+def _temperatura_inicial(tabla, peso_conflicto, rng, muestras=1000):
+    """Temperatura con la que un movimiento que empeora típico se acepta con prob. 0.5"""
+    n, k = tabla.n, tabla.k
+    torres = rng.integers(0, n, muestras)
+    frecuencias = (tabla.asignacion[torres] + rng.integers(1, k, muestras)) % k
+    actuales = tabla.asignacion[torres]
+    deltas = (tabla.costos[torres, frecuencias] - tabla.costos[torres, actuales]
+              + peso_conflicto * (tabla.conteo[torres, frecuencias] - tabla.conteo[torres, actuales]))
+    positivos = deltas[deltas > 0]
+    if len(positivos) == 0:
+        return 1.0
+    return float(positivos.mean() / math.log(2))
+
+def recocido_simulado(problema, asignacion_inicial, costo_inicial, max_iter,
+                      temperatura_inicial=None, temperatura_final=None, enfriamiento='geometrico',
+                      tiempo_limite=None, peso_conflicto=None, semilla=None, tamano_bloque=65536,
+                      presupuesto=None):
+    """
+    Recocido simulado con movimientos aleatorios de una torre
+    
+    Cada movimiento cambia la frecuencia de una torre al azar; su efecto sobre
+    el objetivo (costo + peso_conflicto * conflictos) se lee en O(1) de la
+    tabla de conflictos y aplicarlo cuesta O(grado). Los números aleatorios se
+    generan por bloques con NumPy, así el bucle interno no crea objetos por
+    movimiento. Un movimiento que empeora en d se acepta si d <= T * E con E
+    exponencial(1), equivalente a u < exp(-d / T). La mejor solución se
+    copia al abandonarla, no en cada mejora, así una racha de mejoras
+    seguidas cuesta una sola copia.
+    
+    Args:
+        problema: diccionario con el problema
+        asignacion_inicial: solución inicial (puede tener conflictos)
+        costo_inicial: costo de la solución inicial (solo informativo)
+        max_iter: número de barridos; cada barrido son n movimientos (None =
+                  sin límite, el enfriamiento se reparte en el tiempo)
+        temperatura_inicial: por defecto se estima para aceptar la mitad de los empeoramientos
+        temperatura_final: por defecto temperatura_inicial / 1000
+        enfriamiento: 'geometrico', 'lineal', 'coseno' o una función f(t0, tf, x)
+        tiempo_limite: segundos máximos; el enfriamiento se reparte en ese tiempo
+                       si se agota antes que los barridos
+        peso_conflicto: penalización por conflicto (por defecto, rango de costos + 1)
+        semilla: entero, None o numpy.random.Generator
+        tamano_bloque: movimientos aleatorios generados de una vez
+        presupuesto: Presupuesto opcional; se consulta entre bloques y su
+                     tiempo límite cuenta como tiempo_limite (con reloj, los
+                     bloques no pasan de BLOQUE_CON_RELOJ movimientos)
+    
+    Returns:
+        mejor_asignacion, mejor_costo, info (la mejor sin conflictos si se
+        encontró alguna; si no, la de menor objetivo penalizado)
+    """
+    inicio = time.time()
+    if presupuesto is not None:
+        restante = presupuesto.tiempo_restante()
+        if restante is not None:
+            tiempo_limite = restante if tiempo_limite is None else min(tiempo_limite, restante)
+    if max_iter is None and tiempo_limite is None:
+        raise ValueError("recocido_simulado necesita max_iter o un tiempo límite")
+    n = problema['n']
+    k = problema['k']
+    rng = np.random.default_rng(semilla)
+    esquema = ESQUEMAS_ENFRIAMIENTO[enfriamiento] if isinstance(enfriamiento, str) else enfriamiento
+    
+    tabla = TablaConflictos(problema, asignacion_inicial)
+    if peso_conflicto is None:
+        peso_conflicto = peso_conflicto_por_defecto(tabla.costos)
+    if k < 2 or n == 0:
+        return tabla.lista(), tabla.costo, "Recocido simulado: sin movimientos posibles"
+    
+    t0 = temperatura_inicial if temperatura_inicial is not None else _temperatura_inicial(tabla, peso_conflicto, rng)
+    tf = temperatura_final if temperatura_final is not None else t0 / 1000
+    
+    # Estructuras de Python puro para el bucle interno
+    costos = tabla.costos.tolist()
+    conteo = tabla.conteo.tolist()
+    asignacion = tabla.lista()
+    vecinos = [tabla.vecinos(i).tolist() for i in range(n)]
+    
+    costo = tabla.costo
+    conflictos = tabla.num_conflictos
+    mejor_costo_valido = costo if conflictos == 0 else math.inf
+    mejor_valida = asignacion[:] if conflictos == 0 else None
+    objetivo = costo + peso_conflicto * conflictos
+    mejor_objetivo = objetivo
+    mejor_penalizada = asignacion[:]
+    # La asignación actual es la mejor (válida / penalizada) y aún no se ha copiado
+    pendiente = False
+    pendiente_penalizada = False
+    if presupuesto is not None and mejor_valida is not None:
+        presupuesto.registrar(mejor_costo_valido, lambda: mejor_valida[:])
+    
+    total = max_iter * n if max_iter is not None else math.inf
+    # Bloques pequeños al principio para que la temperatura cambie a menudo
+    bloque = max(1, min(tamano_bloque, int(min(total, 10**12)) // 1000 or 1))
+    if tiempo_limite is not None or presupuesto is not None:
+        # El reloj solo se mira entre bloques: unos pocos ms de movimientos como mucho
+        bloque = min(bloque, BLOQUE_CON_RELOJ)
+    movimientos = 0
+    aceptados = 0
+    mejoras = 0
+    
+    while movimientos < total:
+        progreso = movimientos / total
+        if tiempo_limite is not None:
+            transcurrido = time.time() - inicio
+            if transcurrido >= tiempo_limite:
+                break
+            progreso = max(progreso, transcurrido / tiempo_limite)
+        if presupuesto is not None and presupuesto.agotado():
+            break
+        temperatura = esquema(t0, tf, progreso)
+        
+        b = int(min(bloque, total - movimientos))
+        torres = rng.integers(0, n, b).tolist()
+        saltos = rng.integers(1, k, b).tolist()
+        umbrales = (temperatura * rng.standard_exponential(b)).tolist()
+        movimientos += b
+        
+        for torre, salto, umbral in zip(torres, saltos, umbrales):
+            vieja = asignacion[torre]
+            f = (vieja + salto) % k
+            fila = conteo[torre]
+            fila_costos = costos[torre]
+            d_conflictos = fila[f] - fila[vieja]
+            d_costo = fila_costos[f] - fila_costos[vieja]
+            delta = d_costo + peso_conflicto * d_conflictos
+            if delta > umbral:
+                continue
+            
+            # Copiar la mejor antes de dejarla, salvo que este movimiento la vuelva a mejorar
+            if pendiente:
+                if conflictos + d_conflictos != 0 or not costo + d_costo < mejor_costo_valido - 1e-9:
+                    mejor_valida = asignacion[:]
+                    pendiente = False
+            elif pendiente_penalizada and not objetivo + delta < mejor_objetivo - 1e-9:
+                mejor_penalizada = asignacion[:]
+                pendiente_penalizada = False
+            
+            # Aplicar el movimiento en O(grado)
+            asignacion[torre] = f
+            for v in vecinos[torre]:
+                fila_v = conteo[v]
+                fila_v[vieja] -= 1
+                fila_v[f] += 1
+            costo += d_costo
+            conflictos += d_conflictos
+            objetivo += delta
+            aceptados += 1
+            
+            if conflictos == 0 and costo < mejor_costo_valido - 1e-9:
+                mejor_costo_valido = costo
+                pendiente = True
+                pendiente_penalizada = False
+                mejoras += 1
+                if presupuesto is not None:
+                    presupuesto.registrar(costo, lambda: asignacion[:])
+            elif mejor_costo_valido == math.inf and objetivo < mejor_objetivo - 1e-9:
+                mejor_objetivo = objetivo
+                pendiente_penalizada = True
+    
+    if pendiente:
+        mejor_valida = asignacion[:]
+    if pendiente_penalizada:
+        mejor_penalizada = asignacion[:]
+    
+    info = f"Recocido simulado: {movimientos} movimientos, {aceptados} aceptados, {mejoras} mejoras"
+    if mejor_valida is not None:
+        return mejor_valida, mejor_costo_valido, info
+    
+    mejor_costo = float(sum(costos[i][f] for i, f in enumerate(mejor_penalizada)))
+    return mejor_penalizada, mejor_costo, info + " (sin solución válida)"
\ No newline at end of file
@@ -0,0 +1,173 @@
+import numpy as np
+from grafo import GrafoCSR
+from verificador import verificar_solucion
+from greedy_simple import greedy_con_reintentos
+from busqueda_local import mejorar_solucion
+
+def subproblema(problema, torres, aristas=None):
+    """
+    Problema restringido a un subconjunto de torres
+    
+    Args:
+        problema: diccionario con el problema
+        torres: array de torres (índices originales), en el orden que tendrán
+                en el subproblema
+        aristas: aristas (índices originales) entre esas torres, si ya se
+                 conocen; si no, se filtran las de todo el grafo
+    
+    Returns:
+        diccionario con el problema inducido (grafo CSR, costos y, si las hay,
+        coordenadas de esas torres)
+    """
+    n = problema['n']
+    torres = np.asarray(torres, dtype=np.int64)
+    local = np.full(n, -1, dtype=np.int64)
+    local[torres] = np.arange(len(torres))
+    
+    if aristas is None:
+        aristas = problema['grafo'].aristas()
+        aristas = aristas[(local[aristas[:, 0]] >= 0) & (local[aristas[:, 1]] >= 0)]
+    grafo = GrafoCSR.desde_aristas(len(torres), local[np.asarray(aristas, dtype=np.int64).reshape(-1, 2)])
+    
+    sub = {
+        'grafo': grafo,
+        'k': problema['k'],
+        'costos': np.asarray(problema['costos'], dtype=float)[torres],
+        'n': len(torres),
+        'densidad': grafo.densidad()
+    }
+    if problema.get('coordenadas') is not None:
+        sub['coordenadas'] = np.asarray(problema['coordenadas'])[torres]
+    return sub
+
+def reducir_por_grado(problema, tolerancia=0.0):
+    """
+    Elimina repetidamente las torres con menos vecinos que frecuencias
+    
+    Una torre con d < k vecinos en el grafo que queda siempre encuentra una
+    frecuencia libre si se reinserta después de todos ellos, así que se
+    puede quitar y resolver el resto sin ella. Al quitarla baja el grado de
+    sus vecinos, que pueden caer a su vez (k-núcleo).
+    
+    Solo se quita una torre si le quedarán libres frecuencias "baratas"
+    (costo <= su mínimo + tolerancia): debe tener más frecuencias baratas
+    que vecinos. Así cada torre quitada paga como mucho
+    su mínimo + tolerancia, y el costo final no supera el óptimo en más de
+    tolerancia por torre quitada (si el núcleo se resuelve de forma óptima).
+    
+    Args:
+        problema: diccionario con el problema
+        tolerancia: sobrecosto admitido por torre quitada (0 = sin pérdida
+                    de calidad; None = quitar toda torre con grado < k,
+                    sea cual sea su costo)
+    
+    Returns:
+        diccionario con 'nucleo' (torres que quedan, ordenadas),
+        'eliminadas' (torres en el orden en que se quitaron) y 'problema'
+        (subproblema del núcleo)
+    """
+    n = problema['n']
+    k = problema['k']
+    csr = problema['grafo'].a_csr()
+    indptr = csr.indptr.tolist()
+    indices = csr.indices.tolist()
+    grados = csr.grados().tolist()
+    
+    # Vecinos que puede tener cada torre en el momento de quitarla
+    if tolerancia is None:
+        tope = [k] * n
+    else:
+        costos = np.asarray(problema['costos'], dtype=float)
+        baratas = (costos <= costos.min(axis=1, keepdims=True) + tolerancia).sum(axis=1)
+        tope = baratas.tolist()
+    
+    quitada = [False] * n
+    pendientes = [v for v in range(n) if grados[v] < tope[v]]
+    en_cola = [False] * n
+    for v in pendientes:
+        en_cola[v] = True
+    
+    eliminadas = []
+    while pendientes:
+        v = pendientes.pop()
+        quitada[v] = True
+        eliminadas.append(v)
+        for u in indices[indptr[v]:indptr[v + 1]]:
+            if not quitada[u]:
+                grados[u] -= 1
+                if not en_cola[u] and grados[u] < tope[u]:
+                    en_cola[u] = True
+                    pendientes.append(u)
+    
+    nucleo = np.flatnonzero(~np.array(quitada, dtype=bool)) if n > 0 else np.empty(0, dtype=np.int64)
+    return {
+        'nucleo': nucleo,
+        'eliminadas': eliminadas,
+        'problema': subproblema(problema, nucleo)
+    }
+
+def reinsertar(problema, reduccion, asignacion_nucleo):
+    """
+    Completa la asignación del núcleo con las torres quitadas
+    
+    Las torres se reinsertan en orden inverso al que se quitaron, cada una
+    con su frecuencia más barata entre las que no usan sus vecinos ya
+    asignados (siempre hay alguna: tenía menos de k al quitarla).
+    
+    Returns:
+        asignación completa (lista de n frecuencias)
+    """
+    n = problema['n']
+    costos = np.asarray(problema['costos'], dtype=float)
+    csr = problema['grafo'].a_csr()
+    indptr = csr.indptr.tolist()
+    indices = csr.indices.tolist()
+    
+    asignacion = [-1] * n
+    for local, torre in enumerate(reduccion['nucleo'].tolist()):
+        asignacion[torre] = int(asignacion_nucleo[local])
+    
+    for torre in reversed(reduccion['eliminadas']):
+        usadas = {asignacion[v] for v in indices[indptr[torre]:indptr[torre + 1]]}
+        orden = np.argsort(costos[torre]).tolist()
+        libres = [f for f in orden if f not in usadas]
+        # Sin frecuencia libre (no debería ocurrir): la más barata
+        asignacion[torre] = libres[0] if libres else orden[0]
+    return asignacion
+
+def resolver_reducido(problema, metodo='hill_climbing_con_conflictos', max_iter=1000, tolerancia=0.0,
+                      **opciones):
+    """
+    Resuelve el núcleo tras reducir_por_grado y reinserta las torres quitadas
+    
+    Args:
+        problema: diccionario con el problema
+        metodo: método de mejorar_solucion para el núcleo (partiendo de
+                greedy_con_reintentos), o una función funcion(problema) que
+                devuelve una asignación
+        max_iter: iteraciones de mejorar_solucion
+        tolerancia: como en reducir_por_grado
+        opciones: parámetros adicionales de mejorar_solucion
+    
+    Returns:
+        mejor_asignacion, mejor_costo, info
+    """
+    reduccion = reducir_por_grado(problema, tolerancia)
+    nucleo = reduccion['problema']
+    
+    info_nucleo = "núcleo vacío"
+    asignacion_nucleo = []
+    if nucleo['n'] > 0:
+        if callable(metodo):
+            asignacion_nucleo = metodo(nucleo)
+            info_nucleo = getattr(metodo, '__name__', 'función')
+        else:
+            inicial = greedy_con_reintentos(nucleo)
+            asignacion_nucleo, _, info_nucleo = mejorar_solucion(nucleo, inicial, max_iter=max_iter,
+                                                                metodo=metodo, **opciones)
+    
+    asignacion = reinsertar(problema, reduccion, asignacion_nucleo)
+    _, costo, _ = verificar_solucion(problema, asignacion)
+    info = (f"Reducción por grado: núcleo de {nucleo['n']} de {problema['n']} torres "
+            f"({len(reduccion['eliminadas'])} quitadas); {info_nucleo}")
+    return asignacion, costo, info
\ No newline at end of file
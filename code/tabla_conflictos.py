@@ -0,0 +1,118 @@
+import numpy as np
+
+def peso_conflicto_por_defecto(costos):
+    """Penalización por conflicto mayor que cualquier ahorro de costo posible"""
+    return float(np.ptp(costos)) + 1 if np.size(costos) else 1.0
+
+class TablaConflictos:
+    """
+    Asignación actual más una tabla n x k de vecinos por frecuencia
+    
+    conteo[i, f] es el número de vecinos de la torre i que usan f. Con ella
+    el efecto de cualquier movimiento (torre, f) se evalúa en O(1) y aplicarlo
+    cuesta O(grado), sin recorrer el grafo completo.
+    """
+    def __init__(self, problema, asignacion):
+        self.n = problema['n']
+        self.k = problema['k']
+        self.costos = np.asarray(problema['costos'])
+        self.csr = problema['grafo'].a_csr()
+        self.indptr = self.csr.indptr
+        self.indices = self.csr.indices
+        
+        self.asignacion = np.array(asignacion, dtype=np.int64)
+        filas = np.repeat(np.arange(self.n), self.csr.grados())
+        self.conteo = np.bincount(filas * self.k + self.asignacion[self.indices],
+                                  minlength=self.n * self.k).reshape(self.n, self.k).astype(np.int32)
+        
+        todas = np.arange(self.n)
+        self.costo = float(self.costos[todas, self.asignacion].sum())
+        self.num_conflictos = int(self.conteo[todas, self.asignacion].sum()) // 2
+    
+    def vecinos(self, torre):
+        """Vecinos de la torre (vista CSR, sin copia)"""
+        return self.indices[self.indptr[torre]:self.indptr[torre + 1]]
+    
+    def delta_costo(self, torre, f):
+        """Cambio de costo si la torre pasa a la frecuencia f"""
+        return self.costos[torre, f] - self.costos[torre, self.asignacion[torre]]
+    
+    def delta_conflictos(self, torre, f):
+        """Cambio en el número de conflictos si la torre pasa a f"""
+        return int(self.conteo[torre, f] - self.conteo[torre, self.asignacion[torre]])
+    
+    def conflictos_torre(self, torre):
+        """Número de vecinos con la misma frecuencia que la torre"""
+        return int(self.conteo[torre, self.asignacion[torre]])
+    
+    def mover(self, torre, f):
+        """
+        Cambia la frecuencia de una torre y actualiza tabla, costo y conflictos
+        
+        Returns:
+            vecinos de la torre (las filas de la tabla que cambiaron)
+        """
+        vieja = self.asignacion[torre]
+        vecinos = self.vecinos(torre)
+        if f == vieja:
+            return vecinos
+        
+        self.num_conflictos += int(self.conteo[torre, f] - self.conteo[torre, vieja])
+        self.costo += float(self.costos[torre, f] - self.costos[torre, vieja])
+        self.conteo[vecinos, vieja] -= 1
+        self.conteo[vecinos, f] += 1
+        self.asignacion[torre] = f
+        return vecinos
+    
+    def mejores_movimientos_libres(self, torres):
+        """
+        Mejor movimiento sin conflictos de cada torre (vectorizado)
+        
+        Solo se consideran frecuencias distintas de la actual que ningún
+        vecino usa.
+        
+        Args:
+            torres: array de torres a evaluar
+        
+        Returns:
+            (ahorros, frecuencias): el mayor ahorro de costo de cada torre
+            (-inf si no tiene movimiento libre) y la frecuencia que lo logra
+        """
+        torres = np.asarray(torres)
+        filas = np.arange(len(torres))
+        actuales = self.asignacion[torres]
+        costos = self.costos[torres]
+        
+        ahorros = costos[filas, actuales][:, None] - costos
+        ahorros[self.conteo[torres] > 0] = -np.inf
+        ahorros[filas, actuales] = -np.inf
+        
+        frecuencias = ahorros.argmax(axis=1)
+        return ahorros[filas, frecuencias], frecuencias
+    
+    def mejores_movimientos_penalizados(self, torres, penalizacion):
+        """
+        Mejor movimiento de cada torre admitiendo conflictos penalizados
+        
+        Ahorro neto = ahorro de costo - penalizacion * conflictos que crearía;
+        solo se consideran movimientos con ahorro de costo positivo.
+        
+        Returns:
+            (ahorros_netos, frecuencias), -inf si la torre no tiene candidato
+        """
+        torres = np.asarray(torres)
+        filas = np.arange(len(torres))
+        actuales = self.asignacion[torres]
+        costos = self.costos[torres]
+        
+        ahorros = costos[filas, actuales][:, None] - costos
+        netos = ahorros - penalizacion * self.conteo[torres]
+        netos[ahorros <= 0] = -np.inf
+        netos[filas, actuales] = -np.inf
+        
+        frecuencias = netos.argmax(axis=1)
+        return netos[filas, frecuencias], frecuencias
+    
+    def lista(self):
+        """Asignación actual como lista de Python"""
+        return self.asignacion.tolist()
\ No newline at end of file
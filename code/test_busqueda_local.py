@@ -0,0 +1,22 @@
+import pytest
+from instancias import crear_problema
+from verificador import verificar_solucion
+from greedy_simple import asignacion_greedy
+from busqueda_local import arreglar_conflictos
+
+def _num_conflictos(problema, asignacion):
+    """Aristas en conflicto de una asignación"""
+    return len([c for c in verificar_solucion(problema, asignacion)[2] if isinstance(c, tuple)])
+
+@pytest.mark.parametrize('semilla', [13, 31, 45])
+@pytest.mark.parametrize('n, densidad', [(30, 0.3), (60, 0.2), (100, 0.1), (200, 0.3)])
+def test_arreglar_conflictos_no_aumenta_conflictos(n, densidad, semilla):
+    # Con k = 2 la mayoría de recoloreos no tienen alternativa libre
+    problema = crear_problema(n, 2, densidad, semilla=semilla)
+    inicial = asignacion_greedy(problema)
+    arreglada = arreglar_conflictos(problema, inicial)
+    assert _num_conflictos(problema, arreglada) <= _num_conflictos(problema, inicial)
+
+def test_arreglar_conflictos_instancia_vacia():
+    problema = crear_problema(0, 2, 0.1, semilla=1)
+    assert arreglar_conflictos(problema, []) == []
\ No newline at end of file
@@ -0,0 +1,24 @@
+import math
+import pytest
+from instancias import crear_problema
+
+pytest.importorskip('scipy')
+from comparador import comparacion_estandar, comparacion_con_optimo
+
+BUSQUEDAS_LOCALES = ["Hill Climbing", "Tabu Search", "Búsqueda con reinicio"]
+
+def test_comparacion_con_optimo_incluye_busquedas_locales(capsys):
+    problema = crear_problema(40, 4, 0.1, semilla=2)
+    resultados, info = comparacion_con_optimo(problema, tiempo_limite=20)
+    informe = capsys.readouterr().out.split("DISTANCIA AL ÓPTIMO (MILP)")[1]
+    assert info['factible']
+    for r in resultados:
+        if r['algoritmo'] in BUSQUEDAS_LOCALES:
+            assert r['valida']
+            assert f"  {r['algoritmo']}: " in informe
+
+def test_comparacion_estandar_gap_busquedas_locales():
+    problema = crear_problema(40, 4, 0.1, semilla=2)
+    gaps = {r['algoritmo']: r.get('gap') for r in comparacion_estandar(problema)}
+    for nombre in ["Hill Climbing", "Tabu Search"]:
+        assert gaps[nombre] is not None and math.isfinite(gaps[nombre])
@@ -0,0 +1,12 @@
+import pytest
+from instancias import crear_problema
+from verificador import verificar_solucion
+from memetico import algoritmo_memetico
+
+def test_algoritmo_memetico_devuelve_solucion_valida():
+    # Instancia factible en la que el ranking penalizado se quedaba con conflictos
+    problema = crear_problema(300, 6, 0.04, semilla=5)
+    asignacion, costo, _ = algoritmo_memetico(problema, generaciones=20, semilla=0)
+    valida, costo_real, _ = verificar_solucion(problema, asignacion)
+    assert valida
+    assert costo == pytest.approx(costo_real)
@@ -0,0 +1,13 @@
+import pytest
+from instancias import crear_problema
+
+pytest.importorskip('scipy')
+from programacion_entera import resolver_milp
+
+def test_resolver_milp_instancia_vacia():
+    problema = crear_problema(0, 3, 0.1, semilla=1)
+    asignacion, costo, info = resolver_milp(problema, tiempo_limite=5)
+    assert asignacion == []
+    assert costo == 0.0
+    assert info['demostrado'] and info['factible']
+    assert info['gap'] == 0.0 and info['cota_inferior'] == 0.0
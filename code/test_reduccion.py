@@ -0,0 +1,13 @@
+from instancias import crear_problema_espacial
+from verificador import verificar_solucion
+from greedy_simple import greedy_con_reintentos
+from busqueda_local import mejorar_solucion
+from reduccion import resolver_reducido
+
+def test_resolver_reducido_no_empeora():
+    problema = crear_problema_espacial(600, 5, 0.035, semilla=1)
+    metodo = 'hill_climbing_con_conflictos'
+    asignacion, costo, _ = resolver_reducido(problema, metodo=metodo)
+    _, costo_completo, _ = mejorar_solucion(problema, greedy_con_reintentos(problema), metodo=metodo)
+    assert verificar_solucion(problema, asignacion)[0]
+    assert costo <= costo_completo + 1e-6
@@ -0,0 +1,228 @@
+import numpy as np
+
+class VecindarioKempe:
+    """
+    Cadenas de Kempe de una asignación, precalculadas por par de frecuencias
+    
+    Para un par (a, b), las cadenas son las componentes conexas del subgrafo
+    inducido por las torres con frecuencia a o b. Intercambiar a <-> b en
+    una cadena nunca cambia el número de conflictos (los vecinos de fuera de
+    la cadena no usan a ni b), así que es un movimiento grande que mantiene
+    válida una solución válida.
+    
+    Las componentes de un par se calculan con un BFS sobre su subgrafo y se
+    guardan junto con el cambio de costo de cada cadena; elegir la mejor
+    cadena no vuelve a recorrerlas. Tras aplicar una cadena del par (a, b)
+    las cadenas de ese par siguen siendo las mismas (su delta cambia de
+    signo) y solo se descartan los pares que comparten a o b.
+    """
+    def __init__(self, tabla):
+        self.tabla = tabla
+        self.k = tabla.k
+        self.origen = np.repeat(np.arange(tabla.n), tabla.csr.grados())
+        # (a, b) -> (torres del subgrafo, etiqueta de cadena de cada una, delta por cadena)
+        self._cache = {}
+    
+    def invalidar(self, *frecuencias):
+        """Descarta los pares que contienen alguna de las frecuencias (tras mover torres)"""
+        for par in [par for par in self._cache if par[0] in frecuencias or par[1] in frecuencias]:
+            del self._cache[par]
+    
+    def componentes(self, a, b):
+        """
+        Cadenas de Kempe del par (a, b)
+        
+        Returns:
+            (torres, etiquetas, deltas): torres con frecuencia a o b, la cadena
+            de cada una y el cambio de costo de intercambiar cada cadena
+        """
+        if a > b:
+            a, b = b, a
+        if (a, b) in self._cache:
+            return self._cache[(a, b)]
+        
+        tabla = self.tabla
+        asignacion = tabla.asignacion
+        en_par = (asignacion == a) | (asignacion == b)
+        torres = np.flatnonzero(en_par)
+        
+        # Subgrafo inducido en CSR local (las aristas ya vienen ordenadas por origen)
+        local = np.full(tabla.n, -1, dtype=np.int64)
+        local[torres] = np.arange(len(torres))
+        mascara = en_par[self.origen] & en_par[tabla.indices]
+        sub_origen = local[self.origen[mascara]]
+        sub_indices = local[tabla.indices[mascara]].tolist()
+        sub_indptr = np.concatenate([[0], np.cumsum(np.bincount(sub_origen, minlength=len(torres)))]).tolist()
+        
+        # BFS desde cada torre sin etiquetar
+        etiquetas = [-1] * len(torres)
+        num_cadenas = 0
+        for inicio in range(len(torres)):
+            if etiquetas[inicio] >= 0:
+                continue
+            etiquetas[inicio] = num_cadenas
+            frontera = [inicio]
+            while frontera:
+                siguiente = []
+                for u in frontera:
+                    for v in sub_indices[sub_indptr[u]:sub_indptr[u + 1]]:
+                        if etiquetas[v] < 0:
+                            etiquetas[v] = num_cadenas
+                            siguiente.append(v)
+                frontera = siguiente
+            num_cadenas += 1
+        
+        etiquetas = np.array(etiquetas, dtype=np.int64)
+        actuales = asignacion[torres]
+        otras = np.where(actuales == a, b, a)
+        cambios = tabla.costos[torres, otras] - tabla.costos[torres, actuales]
+        deltas = np.bincount(etiquetas, weights=cambios, minlength=num_cadenas)
+        
+        self._cache[(a, b)] = (torres, etiquetas, deltas)
+        return self._cache[(a, b)]
+    
+    def mejor_cadena(self, presupuesto=None):
+        """
+        Cadena de Kempe que más reduce el costo, entre todos los pares
+        
+        Calcular las cadenas de los k (k - 1) / 2 pares puede llevar un
+        rato; con un presupuesto agotado no se calculan pares nuevos y se
+        devuelve la mejor cadena de los ya vistos.
+        
+        Returns:
+            (a, b, torres, delta) o None si ninguna cadena mejora
+        """
+        mejor = None
+        mejor_delta = -1e-9
+        for a in range(self.k):
+            for b in range(a + 1, self.k):
+                if presupuesto is not None and (a, b) not in self._cache and presupuesto.agotado():
+                    continue
+                torres, etiquetas, deltas = self.componentes(a, b)
+                if len(deltas) == 0:
+                    continue
+                etiqueta = int(deltas.argmin())
+                if deltas[etiqueta] < mejor_delta:
+                    mejor_delta = float(deltas[etiqueta])
+                    mejor = (a, b, torres[etiquetas == etiqueta])
+        if mejor is None:
+            return None
+        return mejor + (mejor_delta,)
+    
+    def aplicar(self, a, b, torres):
+        """
+        Intercambia a <-> b en las torres de una cadena
+        
+        Returns:
+            torres cuya tabla de conflictos cambió (la cadena y sus vecinos)
+        """
+        tabla = self.tabla
+        afectadas = [torres]
+        for torre in torres.tolist():
+            f = b if tabla.asignacion[torre] == a else a
+            afectadas.append(tabla.mover(torre, f))
+        
+        par = (min(a, b), max(a, b))
+        guardado = self._cache.pop(par, None)
+        self.invalidar(a, b)
+        if guardado is not None:
+            # Mismas cadenas; la intercambiada ahora deshace su cambio
+            torres_par, etiquetas, deltas = guardado
+            etiqueta = etiquetas[np.searchsorted(torres_par, torres[0])]
+            deltas[etiqueta] = -deltas[etiqueta]
+            self._cache[par] = guardado
+        return np.unique(np.concatenate(afectadas))
+
+def evaluar_intercambios(tabla, aristas):
+    """
+    Efecto de intercambiar las frecuencias de los extremos de cada arista
+    
+    Entre torres no vecinas un intercambio equivale a dos movimientos
+    independientes, así que solo aporta algo entre vecinas: ahí cada torre
+    deja libre la frecuencia que la otra necesita.
+    
+    Args:
+        tabla: TablaConflictos con la asignación actual
+        aristas: array (m, 2) de pares de torres vecinas
+    
+    Returns:
+        (delta_costo, delta_conflictos) por arista; las aristas cuyos extremos
+        comparten frecuencia tienen delta 0
+    """
+    u = aristas[:, 0]
+    v = aristas[:, 1]
+    a = tabla.asignacion[u]
+    b = tabla.asignacion[v]
+    costos = tabla.costos
+    conteo = tabla.conteo
+    
+    delta_costo = costos[u, b] + costos[v, a] - costos[u, a] - costos[v, b]
+    # Cada extremo deja de ver al otro con su frecuencia vieja (-2 en total)
+    delta_conflictos = conteo[u, b] + conteo[v, a] - conteo[u, a] - conteo[v, b] - 2
+    iguales = a == b
+    delta_costo[iguales] = 0
+    delta_conflictos[iguales] = 0
+    return delta_costo, delta_conflictos
+
+def mejor_intercambio(tabla, aristas, peso_conflicto=None):
+    """
+    Mejor intercambio de frecuencias entre vecinas
+    
+    Args:
+        tabla: TablaConflictos con la asignación actual
+        aristas: array (m, 2) de pares de torres vecinas
+        peso_conflicto: None para admitir solo intercambios que no creen
+                        conflictos; si no, penalización por conflicto creado
+    
+    Returns:
+        (u, v, delta) con delta el cambio del objetivo, o None si ninguno mejora
+    """
+    if len(aristas) == 0:
+        return None
+    delta_costo, delta_conflictos = evaluar_intercambios(tabla, aristas)
+    if peso_conflicto is None:
+        deltas = np.where(delta_conflictos <= 0, delta_costo, np.inf)
+    else:
+        deltas = delta_costo + peso_conflicto * delta_conflictos
+    
+    indice = int(deltas.argmin())
+    if not deltas[indice] < -1e-9:
+        return None
+    u, v = aristas[indice].tolist()
+    return u, v, float(deltas[indice])
+
+def aplicar_intercambio(tabla, u, v):
+    """Intercambia las frecuencias de u y v; devuelve las torres afectadas"""
+    a = int(tabla.asignacion[u])
+    b = int(tabla.asignacion[v])
+    vecinos_u = tabla.mover(u, b)
+    vecinos_v = tabla.mover(v, a)
+    return np.unique(np.concatenate([vecinos_u, vecinos_v, [u, v]]))
+
+def aplicar_mejor_movimiento(tabla, kempe=None, aristas=None, peso_conflicto=None, presupuesto=None):
+    """
+    Aplica la mejor cadena de Kempe o el mejor intercambio, si alguno mejora
+    
+    Args:
+        tabla: TablaConflictos con la asignación actual
+        kempe: VecindarioKempe de la tabla (None para no usar cadenas)
+        aristas: aristas candidatas a intercambio (None para no usar intercambios)
+        peso_conflicto: como en mejor_intercambio
+        presupuesto: Presupuesto opcional que limita la búsqueda de cadenas
+    
+    Returns:
+        (afectadas, delta_objetivo) o None si ningún movimiento mejora
+    """
+    cadena = kempe.mejor_cadena(presupuesto) if kempe is not None else None
+    intercambio = mejor_intercambio(tabla, aristas, peso_conflicto) if aristas is not None else None
+    if cadena is None and intercambio is None:
+        return None
+    
+    if intercambio is None or (cadena is not None and cadena[3] <= intercambio[2]):
+        a, b, torres, delta = cadena
+        return kempe.aplicar(a, b, torres), delta
+    
+    u, v, delta = intercambio
+    if kempe is not None:
+        kempe.invalidar(int(tabla.asignacion[u]), int(tabla.asignacion[v]))
+    return aplicar_intercambio(tabla, u, v), delta
\ No newline at end of file
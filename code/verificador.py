@@ -1,3 +1,5 @@
+import numpy as np
+
 def verificar_solucion(problema, asignacion, calcular_todo=True):
     """
     Verifica si asignación cumple restricciones y calcula costo
@@ -42,7 +44,7 @@ def verificar_solucion(problema, asignacion, calcular_todo=True):
     for i in range(n):
         for j in grafo.obtener_vecinos(i):
             if i < j and asignacion[i] == asignacion[j]:
-                conflictos.append((i, j))
+                conflictos.append((i, int(j)))
                 if not calcular_todo:
                     return False, costo_total, conflictos
     
@@ -98,4 +100,42 @@ def analisis_detallado(problema, asignacion):
         'torres_por_frecuencia': torres_por_frecuencia,
         'conflictos_por_torre': conflictos_por_torre,
         'torres_problematicas': sorted(conflictos_por_torre.items(), key=lambda x: x[1], reverse=True)[:5]
-    }
\ No newline at end of file
+    }
+
+def verificar_lote(problema, asignaciones, bloque=10**7):
+    """
+    Verifica muchas asignaciones a la vez, sin bucles de Python por solución
+    
+    Args:
+        problema: diccionario con grafo, k, costos
+        asignaciones: matriz (P, n) con una asignación por fila
+        bloque: máximo de comparaciones arista-solución por paso (limita memoria)
+    
+    Returns:
+        (validas, costos_totales, num_conflictos): arrays de longitud P; las
+        filas con frecuencias fuera de rango son inválidas y de costo infinito
+    """
+    n = problema['n']
+    k = problema['k']
+    costos = problema['costos']
+    asignaciones = np.asarray(asignaciones)
+    if asignaciones.ndim != 2 or asignaciones.shape[1] != n:
+        raise ValueError(f"Se esperaba una matriz (P, {n}), se recibió {asignaciones.shape}")
+    
+    fuera_de_rango = ((asignaciones < 0) | (asignaciones >= k)).any(axis=1)
+    recortadas = np.clip(asignaciones, 0, k - 1)
+    
+    costos_totales = costos[np.arange(n), recortadas].sum(axis=1)
+    costos_totales[fuera_de_rango] = np.inf
+    
+    # Conflictos: aristas con la misma frecuencia en ambos extremos
+    aristas = problema['grafo'].aristas()
+    u, v = aristas[:, 0], aristas[:, 1]
+    num_conflictos = np.zeros(len(asignaciones), dtype=np.int64)
+    filas_por_paso = max(1, bloque // max(1, len(u)))
+    for inicio in range(0, len(asignaciones), filas_por_paso):
+        parte = recortadas[inicio:inicio + filas_por_paso]
+        num_conflictos[inicio:inicio + filas_por_paso] = (parte[:, u] == parte[:, v]).sum(axis=1)
+    
+    validas = (num_conflictos == 0) & ~fuera_de_rango
+    return validas, costos_totales, num_conflictos
\ No newline at end of file
@@ -37,8 +37,11 @@ def dibujar_solucion(problema, asignacion, titulo="", guardar_archivo=True):
     # Verificar solución para añadir información al título
     valida, costo, conflictos = verificar_solucion(problema, asignacion)
     
-    # Dibujar
-    pos = nx.spring_layout(G, seed=42)  # seed para reproducibilidad
+    # Dibujar (con la posición real de las torres si el problema la tiene)
+    if problema.get('coordenadas') is not None:
+        pos = {i: tuple(problema['coordenadas'][i]) for i in range(n)}
+    else:
+        pos = nx.spring_layout(G, seed=42)  # seed para reproducibilidad
     colores = [G.nodes[i]['color'] for i in G.nodes()]
     
     plt.figure(figsize=(12, 10))